@@ -3,9 +3,10 @@
 # Uses Logic.py for computations
 
 import tkinter as tk
-from tkinter import messagebox, scrolledtext
+from tkinter import filedialog, messagebox, scrolledtext
 
 from Logic import auto_fit_best_model
+from loaders import fit_file
 
 
 # =====================================
@@ -28,9 +29,16 @@ def format_model_result(model):
     """
     lines = []
     lines.append(f"Model: {model['model']}")
-    lines.append(f"a = {model['a']:.6f}")
-    lines.append(f"b = {model['b']:.6f}")
+    if "coefficients" in model:
+        lines.append("coefficients (highest power first) = "
+                     + ", ".join(f"{c:.6f}" for c in model["coefficients"]))
+    else:
+        lines.append(f"a = {model['a']:.6f}")
+        lines.append(f"b = {model['b']:.6f}")
     lines.append(f"Sum of squared residuals = {model['error']:.6f}")
+    if "linearized" in model:
+        lines.append(f"(linearized fit: {model['linearized']['error']:.6f}, refined in "
+                     f"{model['refinement']['iterations']} iterations)")
     return "\n".join(lines)
 
 
@@ -38,6 +46,23 @@ def format_model_result(model):
 # Main Solve Action
 # =====================================
 
+def show_result(result):
+    output.delete(1.0, tk.END)
+
+    output.insert(tk.END, "AUTOMATIC MODEL SELECTION\n")
+    output.insert(tk.END, "-" * 40 + "\n\n")
+
+    output.insert(tk.END, "All tested models:\n\n")
+
+    for model in result["all_models"]:
+        output.insert(tk.END, format_model_result(model))
+        output.insert(tk.END, "\n" + "-" * 40 + "\n")
+
+    output.insert(tk.END, "\nSELECTED BEST MODEL\n")
+    output.insert(tk.END, "=" * 40 + "\n")
+    output.insert(tk.END, format_model_result(result["best_model"]))
+
+
 def solve():
     try:
         x = parse_input(entry_x.get())
@@ -46,22 +71,33 @@ def solve():
         if len(x) != len(y):
             raise ValueError("x and y must have the same number of values.")
 
-        result = auto_fit_best_model(x, y)
+        show_result(auto_fit_best_model(x, y, refine=refine.get()))
 
-        output.delete(1.0, tk.END)
+    except Exception as e:
+        messagebox.showerror("Error", str(e))
 
-        output.insert(tk.END, "AUTOMATIC MODEL SELECTION\n")
-        output.insert(tk.END, "-" * 40 + "\n\n")
 
-        output.insert(tk.END, "All tested models:\n\n")
+def solve_file():
+    """
+    Fits x, y columns from a CSV, .npy or raw float64 file, chunk by chunk.
+    """
+    path = filedialog.askopenfilename(
+        filetypes=[("Data files", "*.csv *.txt *.npy *.bin"), ("All files", "*.*")]
+    )
+    if not path:
+        return
 
-        for model in result["all_models"]:
-            output.insert(tk.END, format_model_result(model))
-            output.insert(tk.END, "\n" + "-" * 40 + "\n")
+    try:
+        options = {}
+        if path.lower().endswith((".csv", ".txt")):
+            with open(path) as f:
+                first = f.readline()
+            try:
+                parse_input(first)
+            except ValueError:
+                options["skip_header"] = 1
 
-        output.insert(tk.END, "\nSELECTED BEST MODEL\n")
-        output.insert(tk.END, "=" * 40 + "\n")
-        output.insert(tk.END, format_model_result(result["best_model"]))
+        show_result(fit_file(path, **options))
 
     except Exception as e:
         messagebox.showerror("Error", str(e))
@@ -71,29 +107,39 @@ def solve():
 # GUI Layout
 # =====================================
 
-root = tk.Tk()
-root.title("Numerical Computing – Least Squares & Linearization")
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Numerical Computing – Least Squares & Linearization")
+
+    root.geometry("700x600")
+
+    # Input frame
+    frame_input = tk.Frame(root)
+    frame_input.pack(pady=10)
+
+    tk.Label(frame_input, text="x values (comma-separated):").grid(row=0, column=0, sticky="w")
+    entry_x = tk.Entry(frame_input, width=60)
+    entry_x.grid(row=0, column=1, padx=5)
 
-root.geometry("700x600")
+    tk.Label(frame_input, text="y values (comma-separated):").grid(row=1, column=0, sticky="w")
+    entry_y = tk.Entry(frame_input, width=60)
+    entry_y.grid(row=1, column=1, padx=5)
 
-# Input frame
-frame_input = tk.Frame(root)
-frame_input.pack(pady=10)
+    # Button
+    frame_buttons = tk.Frame(root)
+    frame_buttons.pack(pady=10)
 
-tk.Label(frame_input, text="x values (comma-separated):").grid(row=0, column=0, sticky="w")
-entry_x = tk.Entry(frame_input, width=60)
-entry_x.grid(row=0, column=1, padx=5)
+    btn_solve = tk.Button(frame_buttons, text="Auto Fit Best Model", command=solve)
+    btn_solve.grid(row=0, column=0, padx=5)
 
-tk.Label(frame_input, text="y values (comma-separated):").grid(row=1, column=0, sticky="w")
-entry_y = tk.Entry(frame_input, width=60)
-entry_y.grid(row=1, column=1, padx=5)
+    btn_file = tk.Button(frame_buttons, text="Fit From File...", command=solve_file)
+    btn_file.grid(row=0, column=1, padx=5)
 
-# Button
-btn_solve = tk.Button(root, text="Auto Fit Best Model", command=solve)
-btn_solve.pack(pady=10)
+    refine = tk.BooleanVar(value=False)
+    tk.Checkbutton(frame_buttons, text="Refine nonlinear models", variable=refine).grid(row=0, column=2, padx=5)
 
-# Output area
-output = scrolledtext.ScrolledText(root, width=80, height=25)
-output.pack(padx=10, pady=10)
+    # Output area
+    output = scrolledtext.ScrolledText(root, width=80, height=25)
+    output.pack(padx=10, pady=10)
 
-root.mainloop()
+    root.mainloop()
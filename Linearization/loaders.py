@@ -0,0 +1,15 @@
+# loaders.py
+# Kept for the existing imports; the implementation lives in numerics/loaders.py
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from numerics.loaders import (  # noqa: E402,F401
+    iter_csv_chunks,
+    iter_binary_chunks,
+    iter_npy_chunks,
+    iter_chunks,
+    fit_file,
+)
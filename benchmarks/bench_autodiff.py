@@ -0,0 +1,94 @@
+# bench_autodiff.py
+# Newton with dual-number derivatives (numerics.autodiff) vs the SymPy
+# program: first solve in a fresh interpreter, per-solve cost once warm,
+# an array batch and a function SymPy cannot read at all
+
+import math
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+
+from numerics import autodiff
+from numerics.newton import newton_method, newton_method_batch
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+FUNCTIONS = ["x**3 - 2*x - 5", "x**2*exp(x) - 1", "cos(x) - x", "atan(x) + x**5 - 3"]
+
+FIRST_SOLVE = (
+    "import sys, time; start = time.perf_counter(); "
+    "from numerics.newton import newton_method; "
+    "r = newton_method({text!r}, 1.0, 1e-12, trace='none', derivative={source!r}); "
+    "assert r['converged'], r; "
+    "print(time.perf_counter() - start, 'sympy' in sys.modules)"
+)
+
+
+def first_solve(text, source, repeat=3):
+    best, sympy_loaded = float("inf"), None
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", FIRST_SOLVE.format(text=text, source=source)],
+                             cwd=ROOT, check=True, capture_output=True, text=True).stdout.split()
+        best, sympy_loaded = min(best, float(out[0])), out[1] == "True"
+    return best, sympy_loaded
+
+
+def per_solve(solve, repeat=2000):
+    solve()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        solve()
+    return (time.perf_counter() - start) / repeat
+
+
+def exp_series(x, terms=12):
+    """exp(x) - 3 from a truncated Taylor series, with a branch for x < 0."""
+    total, term = 1.0, 1.0
+    for k in range(1, terms):
+        term = term * x / k
+        total = total + term
+    if x < 0:
+        total = 1 / (exp_series(-x, terms) + 3)
+    return total - 3
+
+
+def main():
+    print("first Newton solve in a fresh interpreter (imports + derivative + solve)")
+    print(f"{'f(x)':<22}{'sympy ms':>10}{'autodiff ms':>13}{'sympy imported':>16}")
+    for text in FUNCTIONS:
+        t_sym, _ = first_solve(text, "sympy")
+        t_ad, loaded = first_solve(text, "autodiff")
+        print(f"{text:<22}{t_sym * 1e3:>10.1f}{t_ad * 1e3:>13.1f}{str(loaded):>16}")
+
+    print("\nwarm solve, x0 = 1, tol = 1e-12 (compiled programs cached)")
+    print(f"{'f(x)':<22}{'sympy us':>10}{'autodiff us':>13}")
+    for text in FUNCTIONS:
+        t_sym = per_solve(lambda: newton_method(text, 1.0, 1e-12, trace="none"))
+        t_ad = per_solve(lambda: newton_method(text, 1.0, 1e-12, trace="none", derivative="autodiff"))
+        print(f"{text:<22}{t_sym * 1e6:>10.1f}{t_ad * 1e6:>13.1f}")
+
+    x0 = np.linspace(0.5, 3.0, 100_000)
+    c = np.linspace(1.0, 10.0, x0.size)
+    print(f"\nnewton_method_batch on x**3 - c, {x0.size} lanes")
+    for label, func in (("sympy", "x**3 - c"), ("autodiff", lambda x, c: x**3 - c)):
+        newton_method_batch(func, x0[:10], 1e-12, params={"c": c[:10]})
+        start = time.perf_counter()
+        result = newton_method_batch(func, x0, 1e-12, params={"c": c})
+        elapsed = time.perf_counter() - start
+        error = np.max(np.abs(result["root"] - np.cbrt(c)))
+        print(f"{label:<22}{elapsed * 1e3:>10.1f} ms   max error {error:.1e}")
+
+    result = newton_method(exp_series, -1.0, 1e-12, trace="none")
+    print(f"\nPython function with a loop and a branch (exp series): root {result['root']:.15f} "
+          f"({result['reason']}, ln 3 = {math.log(3):.15f})")
+    f_df = autodiff.value_and_derivative(exp_series)
+    print(f"f'(1) = {f_df(1.0)[1]:.15f}, exact series value {sum(1 / math.factorial(k) for k in range(11)):.15f}")
+
+
+if __name__ == "__main__":
+    main()
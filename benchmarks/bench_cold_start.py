@@ -0,0 +1,49 @@
+# bench_cold_start.py
+# Cold-start time of the GUI-free core and its command-line entry points
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+CASES = [
+    ("import numerics", ["-c", "import numerics"]),
+    ("import numerics.secant", ["-c", "import numerics.secant"]),
+    ("import numerics.jacobi", ["-c", "import numerics.jacobi"]),
+    ("import numerics.least_squares", ["-c", "import numerics.least_squares"]),
+    ("import numerics.newton", ["-c", "import numerics.newton"]),
+    ("cli secant", ["-m", "numerics", "secant", "--function", "x**3-2*x-5", "--x0", "2", "--x1", "3"]),
+    ("cli newton", ["-m", "numerics", "newton", "--function", "x**3-2*x-5", "--x0", "2"]),
+    ("cli newton --autodiff", ["-m", "numerics", "newton", "--function", "x**3-2*x-5", "--x0", "2", "--autodiff"]),
+    ("cli --help", ["-m", "numerics", "--help"]),
+]
+
+NO_GUI_CHECK = (
+    "import sys, numerics, numerics.cli, numerics.secant, numerics.jacobi, "
+    "numerics.least_squares, numerics.newton; "
+    "assert not {'tkinter', 'customtkinter'} & set(sys.modules), 'GUI toolkit imported'"
+)
+
+
+def run(args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    subprocess.run([sys.executable, "-c", NO_GUI_CHECK], cwd=ROOT, check=True)
+    baseline = run(["-c", "pass"])
+    print(f"python startup: {baseline * 1e3:.0f} ms (subtracted below)")
+    print(f"{'case':<32}{'ms':>8}")
+    for name, args in CASES:
+        print(f"{name:<32}{(run(args) - baseline) * 1e3:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
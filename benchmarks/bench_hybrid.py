@@ -0,0 +1,76 @@
+# bench_hybrid.py
+# Function evaluations to reach a root: hybrid_method vs secant_method and
+# newton_method on well-behaved and awkward functions
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.hybrid import hybrid_method
+from numerics.monitor import ConvergenceMonitor
+from numerics.newton import newton_method, program_cache
+from numerics.secant import parse_function, secant_method
+
+TOL = 1e-12
+
+# f(x) valid in both Python and SymPy syntax, and a bracket [a, b]
+FUNCTIONS = [
+    ("x**3 - 2*x - 5", 2.0, 3.0),
+    ("x**2*exp(x) - 1", 0.0, 1.0),
+    ("cos(x) - x", 0.0, 1.0),
+    ("x**10 - 1", 0.0, 1.5),
+    ("(x - 1)**3", 0.0, 3.5),
+    ("atan(x)", -1.0, 20.0),
+    ("tanh(5*(x - 2))", 0.0, 10.0),
+    ("1/x - 2", 0.1, 5.0),
+]
+
+
+class Counted:
+    def __init__(self, f):
+        self.f, self.calls = f, 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.f(x)
+
+
+def run_secant(func_text, a, b):
+    f = Counted(parse_function(func_text))
+    monitor = ConvergenceMonitor(TOL, 100)
+    try:
+        secant_method(f, a, b, TOL, 100, monitor=monitor, trace="none")
+    except (ArithmeticError, ValueError):
+        return f.calls, "breakdown"
+    return f.calls, monitor.reason
+
+
+def run_hybrid(func_text, a, b, derivative=False):
+    if derivative:
+        result = hybrid_method(program_cache.get(func_text)["f_df"], a, b, TOL, 100, df=True)
+    else:
+        result = hybrid_method(parse_function(func_text), a, b, TOL, 100)
+    return result["evaluations"]["f"], result["reason"]
+
+
+def main():
+    print(f"evaluations of f at tol = {TOL:g} (f and f' together for Newton)\n")
+    print(f"{'f(x)':<18}{'secant':>18}{'newton':>18}{'hybrid':>18}{'hybrid+newton':>18}")
+    solved = [0, 0, 0, 0]
+    for func_text, a, b in FUNCTIONS:
+        newton = newton_method(func_text, 0.5 * (a + b), TOL, 100, trace="compact")
+        cells = [run_secant(func_text, a, b),
+                 (len(newton["iterations"]), newton["reason"]),
+                 run_hybrid(func_text, a, b),
+                 run_hybrid(func_text, a, b, derivative=True)]
+        row = ""
+        for k, (count, reason) in enumerate(cells):
+            solved[k] += reason == "converged"
+            row += f"{count:>6} {reason:>11}"
+        print(f"{func_text:<18}{row}")
+    print(f"{'solved':<18}" + "".join(f"{f'{n}/{len(FUNCTIONS)}':>18}" for n in solved))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# bench_incremental_fit.py
+# IncrementalFitter on a live stream against re-running auto_fit_best_model
+# on the window after every point: cost per point for several window
+# sizes and refresh schedules, and the accuracy of the O(1) updates on
+# timestamp-like x
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.least_squares import IncrementalFitter, auto_fit_best_model
+
+
+def make_stream(points, seed=0):
+    rng = np.random.default_rng(seed)
+    x = 1.7e9 + np.arange(points, dtype=float)
+    return x, 1.7 * (x - 1.7e9 + 10) ** 1.3 * rng.uniform(0.95, 1.05, points)
+
+
+def per_point_fitter(x, y, window, refresh):
+    fitter = IncrementalFitter(window=window, refresh=refresh)
+    for xi, yi in zip(x[:window], y[:window]):
+        fitter.add(xi, yi)
+    fitter.auto_fit()
+    start = time.perf_counter()
+    for xi, yi in zip(x[window:], y[window:]):
+        fitter.add(xi, yi)
+        fitter.auto_fit()
+    return (time.perf_counter() - start) / (x.size - window), fitter
+
+
+def per_point_scratch(x, y, window, points):
+    start = time.perf_counter()
+    for end in range(window + 1, window + 1 + points):
+        auto_fit_best_model(x[end - window:end], y[end - window:end])
+    return (time.perf_counter() - start) / points
+
+
+def main():
+    print("per new point: add() + auto_fit() vs auto_fit_best_model on the window")
+    print(f"{'window':>8}{'from scratch us':>17}{'refresh=window us':>19}{'refresh=1 us':>14}")
+    for window in (100, 1_000, 10_000):
+        x, y = make_stream(window + 5_000)
+        scratch = per_point_scratch(x, y, window, 300)
+        lazy, _ = per_point_fitter(x, y, window, None)
+        exact, _ = per_point_fitter(x[:window + 300], y[:window + 300], window, 1)
+        print(f"{window:>8}{scratch * 1e6:>17.1f}{lazy * 1e6:>19.1f}{exact * 1e6:>14.1f}")
+
+    points, window = 200_000, 1_000
+    print(f"\nrelative error of a after {points} updates, x around 1.7e9, window {window}: "
+          f"O(1) updates only, and with auto_fit() after every point (refresh every {window})")
+    x, y = make_stream(points)
+    drifting = IncrementalFitter(window=window, refresh=0)
+    scheduled = IncrementalFitter(window=window)
+    for xi, yi in zip(x, y):
+        drifting.add(xi, yi)
+        scheduled.add(xi, yi).auto_fit()
+    reference = {m["model"]: m for m in auto_fit_best_model(x[-window:], y[-window:])["all_models"]}
+    print(f"{'model':<32}{'no refresh':>12}{'scheduled':>12}")
+    for kind in drifting.kinds:
+        name = drifting.fit(kind)["model"]
+        exact = reference[name]["a"]
+        errors = [abs(fitter.fit(kind)["a"] - exact) / abs(exact) for fitter in (drifting, scheduled)]
+        print(f"{name:<32}{errors[0]:>12.1e}{errors[1]:>12.1e}")
+    # Between refreshes the ranking compares current linear and logarithmic
+    # errors with older ones of the other models, which can flip near ties
+    ranked = scheduled.auto_fit()
+    age = max(m.get("error_age", 0) for m in ranked["all_models"])
+    print(f"best model: {ranked['best_model']['model']} with errors up to {age} updates old, "
+          f"{scheduled.refresh().auto_fit()['best_model']['model']} after refresh() "
+          f"(from scratch: {min(reference.values(), key=lambda m: m['error'])['model']})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# bench_jacobi_batched.py
+# Many right-hand sides: repeated jacobi_method calls vs jacobi_method_batched
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.jacobi import jacobi_method, jacobi_method_batched
+
+
+def dominant_system(n, k, seed=0):
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(-1, 1, (n, n))
+    A[np.diag_indices(n)] = np.abs(A).sum(axis=1) * rng.uniform(1.05, 1.5)
+    B = rng.uniform(-1, 1, (n, k))
+    return A, B
+
+
+def main():
+    tol, max_iter = 1e-8, 1000
+    print(f"{'n':>6}{'k':>7}{'loop (s)':>10}{'batched (s)':>13}{'speedup':>10}{'iters min/max':>16}")
+    for n, k in ((100, 1000), (500, 1000), (1000, 2000)):
+        A, B = dominant_system(n, k)
+        X0 = np.zeros((n, k))
+
+        start = time.perf_counter()
+        loop = np.column_stack([jacobi_method(A, B[:, j], X0[:, j], tol, max_iter) for j in range(k)])
+        t_loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = jacobi_method_batched(A, B, X0, tol, max_iter)
+        t_batch = time.perf_counter() - start
+
+        assert result["converged"].all()
+        assert np.allclose(loop, result["x"], atol=10 * tol)
+        its = result["iterations"]
+        print(f"{n:>6}{k:>7}{t_loop:>10.3f}{t_batch:>13.3f}{t_loop / t_batch:>9.1f}x{its.min():>8}/{its.max()}")
+
+
+if __name__ == "__main__":
+    main()
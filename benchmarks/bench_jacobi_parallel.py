@@ -0,0 +1,56 @@
+# bench_jacobi_parallel.py
+# Scaling of parallel_jacobi_method with the number of worker threads
+
+import os
+import sys
+import time
+
+import numpy as np
+import scipy.sparse as sparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.jacobi import jacobi_method, parallel_jacobi_method
+
+
+def poisson_2d(m):
+    T = sparse.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(m, m))
+    S = sparse.diags([-1.0, -1.0], [-1, 1], shape=(m, m))
+    I = sparse.identity(m)
+    return (sparse.kron(I, T) + sparse.kron(S, I)).tocsr()
+
+
+def dominant_dense(n, seed=0):
+    A = np.random.default_rng(seed).random((n, n))
+    A += np.diag(A.sum(axis=1) + 1)
+    return A
+
+
+def per_sweep(solve, sweeps):
+    start = time.perf_counter()
+    solve(sweeps)
+    return (time.perf_counter() - start) / sweeps
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, cpus} | {2 ** k for k in range(1, 8) if 2 ** k <= cpus})
+    print(f"{cpus} CPU(s)")
+
+    # tol = 0 never converges, so every call runs exactly `sweeps` sweeps
+    for name, A, sweeps in (("sparse Poisson, 1000x1000 grid", poisson_2d(1000), 50),
+                            ("dense, diagonally dominant", dominant_dense(4000), 20)):
+        n = A.shape[0]
+        b = np.ones(n)
+        x0 = np.zeros(n)
+        base = per_sweep(lambda k: jacobi_method(A, b, x0, 0.0, k), sweeps)
+        print(f"\n{name} (n = {n})")
+        print(f"{'workers':>8}{'ms/sweep':>10}{'speedup':>9}")
+        print(f"{'serial':>8}{base * 1e3:>10.2f}{1:>8.2f}x")
+        for workers in counts:
+            t = per_sweep(lambda k: parallel_jacobi_method(A, b, x0, 0.0, k, workers), sweeps)
+            print(f"{workers:>8}{t * 1e3:>10.2f}{base / t:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
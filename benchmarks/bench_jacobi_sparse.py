@@ -0,0 +1,47 @@
+# bench_jacobi_sparse.py
+# Sparse (CSR) jacobi_method on the 2-D Poisson 5-point stencil
+
+import os
+import sys
+import time
+
+import numpy as np
+import scipy.sparse as sparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.jacobi import jacobi_method
+
+
+def poisson_2d(m):
+    # m x m interior grid, n = m**2 unknowns, at most 5 nonzeros per row
+    T = sparse.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(m, m))
+    S = sparse.diags([-1.0, -1.0], [-1, 1], shape=(m, m))
+    I = sparse.identity(m)
+    return (sparse.kron(I, T) + sparse.kron(S, I)).tocsr()
+
+
+def main():
+    sweeps = 100
+    print(f"{'grid':>10}{'n':>10}{'nnz':>10}{'CSR (MB)':>10}{'dense (MB)':>12}{'ms/sweep':>10}")
+    for m in (64, 128, 256, 512, 1000):
+        A = poisson_2d(m)
+        n = A.shape[0]
+        b = np.ones(n)
+        csr_mb = (A.data.nbytes + A.indices.nbytes + A.indptr.nbytes) / 2**20
+        dense_mb = n * n * 8 / 2**20
+
+        start = time.perf_counter()
+        jacobi_method(A, b, np.zeros(n), 0.0, sweeps)
+        per_sweep = (time.perf_counter() - start) / sweeps
+        print(f"{m:>5}x{m:<4}{n:>10}{A.nnz:>10}{csr_mb:>10.1f}{dense_mb:>12.0f}{per_sweep * 1e3:>10.2f}")
+
+    m = 32
+    A = poisson_2d(m)
+    b = np.ones(m * m)
+    x = jacobi_method(A, b, np.zeros(m * m), 1e-8, 20000)
+    print(f"\n{m}x{m} grid solved to tol 1e-8, residual {np.abs(A @ x - b).max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
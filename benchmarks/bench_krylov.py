@@ -0,0 +1,70 @@
+# bench_krylov.py
+# CG / GMRES / BiCGSTAB (with and without Jacobi preconditioning) vs plain Jacobi
+
+import os
+import sys
+import time
+
+import numpy as np
+import scipy.sparse as sparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.jacobi import jacobi_preconditioner, stationary_method
+from numerics.krylov import bicgstab, conjugate_gradient, gmres
+
+
+def scaled_poisson_2d(m, shift=0.01, seed=0):
+    # S (shifted 2-D Poisson) S with a rough diagonal scaling S: SPD,
+    # diagonally dominant, with a strongly varying diagonal
+    T = sparse.diags([-1.0, 4.0 + shift, -1.0], [-1, 0, 1], shape=(m, m))
+    E = sparse.diags([-1.0, -1.0], [-1, 1], shape=(m, m))
+    I = sparse.identity(m)
+    S = sparse.diags(np.exp(np.random.default_rng(seed).uniform(-2, 2, m * m)))
+    return (S @ (sparse.kron(I, T) + sparse.kron(E, I)) @ S).tocsr()
+
+
+def convection_diffusion_2d(m, wind=0.3):
+    T = sparse.diags([-1.0 - wind, 4.0, -1.0 + wind], [-1, 0, 1], shape=(m, m))
+    S = sparse.diags([-1.0, -1.0], [-1, 1], shape=(m, m))
+    I = sparse.identity(m)
+    return (sparse.kron(I, T) + sparse.kron(S, I)).tocsr()
+
+
+def timed(label, solve, A, b):
+    start = time.perf_counter()
+    r = solve()
+    elapsed = time.perf_counter() - start
+    if isinstance(r, dict):
+        x, its, ok = r["x"], r["iterations"], r["converged"]
+    else:
+        x, its, ok = r, "-", r is not None
+    res = np.linalg.norm(A @ x - b) / np.linalg.norm(b) if x is not None else float("nan")
+    print(f"{label:<26}{str(its):>11}{elapsed:>10.3f}{res:>11.1e}{'' if ok else '  (not converged)'}")
+    return elapsed
+
+
+def main():
+    tol = 1e-8
+    for name, A in (("scaled Poisson (SPD)", scaled_poisson_2d(300)),
+                    ("convection-diffusion (non-symmetric)", convection_diffusion_2d(150))):
+        n = A.shape[0]
+        b = np.ones(n)
+        M = jacobi_preconditioner(A)
+        print(f"\n{name}, n = {n}")
+        print(f"{'solver':<26}{'iterations':>11}{'time (s)':>10}{'rel. res.':>11}")
+        # Jacobi stops on step size; 1e-2 * tol gives a comparable residual
+        t_jacobi = timed("jacobi", lambda: stationary_method(A, b, np.zeros(n), tol * 1e-2, 100_000, "jacobi"), A, b)
+        cases = [("gmres(30) + Jacobi", lambda: gmres(A, b, tol=tol, max_iter=5000, M=M)),
+                 ("bicgstab", lambda: bicgstab(A, b, tol=tol, max_iter=5000)),
+                 ("bicgstab + Jacobi", lambda: bicgstab(A, b, tol=tol, max_iter=5000, M=M))]
+        if name.startswith("scaled"):
+            cases = [("cg", lambda: conjugate_gradient(A, b, tol=tol, max_iter=5000)),
+                     ("cg + Jacobi", lambda: conjugate_gradient(A, b, tol=tol, max_iter=5000, M=M))] + cases
+        for label, solve in cases:
+            t = timed(label, solve, A, b)
+            print(f"{'':<26}speedup over Jacobi: {t_jacobi / t:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# bench_least_squares_qr.py
+# QR design-matrix least squares vs the 2x2 normal equations: accuracy on
+# offset x, polynomial fits, and streaming (TSQR) fits of many rows
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.least_squares import (QRAccumulator, array_summations, fit_from_sums,
+                                    fit_linear, fit_polynomial, multivariate_design)
+
+
+def offset_accuracy():
+    print("y = 3 (x - x0) + 2 + noise on x = x0 + 0..99: relative error of the slope")
+    print(f"{'x0':>8}{'normal eq':>14}{'QR':>14}")
+    rng = np.random.default_rng(0)
+    for x0 in (0.0, 1e4, 1e6, 1e8, 1e10):
+        x = x0 + np.arange(100.0)
+        y = 3 * (x - x0) + 2 + 1e-3 * rng.standard_normal(100)
+        exact = np.polynomial.polynomial.Polynomial.fit(x - x0, y, 1).convert().coef[1]
+        try:
+            normal = abs(fit_from_sums("linear", array_summations(x, y))["a"] / exact - 1)
+        except ValueError:
+            normal = float("nan")
+        qr = abs(fit_linear(x, y)["a"] / exact - 1)
+        print(f"{x0:>8.0e}{normal:>14.1e}{qr:>14.1e}")
+
+
+def polynomial_accuracy():
+    print("\npolynomial fits of exp(x) on [0, 2], 1000 points: max |fit - np.polyfit|")
+    x = np.linspace(0, 2, 1000)
+    y = np.exp(x)
+    for degree in (2, 5, 8, 12):
+        ours = fit_polynomial(x, y, degree)["coefficients"]
+        reference = np.polyfit(x, y, degree)
+        print(f"  degree {degree:>2}: {np.max(np.abs(ours - reference)):.1e}")
+
+
+def streaming(rows=2_000_000, columns=24, chunk=100_000):
+    print(f"\nstreaming fit of {rows} rows x {columns} regressors in chunks of {chunk}")
+    rng = np.random.default_rng(1)
+    coefficients = rng.standard_normal(columns + 1)
+    acc = QRAccumulator(columns + 1)
+    X_all, y_all = [], []
+    elapsed = 0.0
+    for _ in range(rows // chunk):
+        X = rng.standard_normal((chunk, columns))
+        y = multivariate_design(X) @ coefficients + 0.01 * rng.standard_normal(chunk)
+        start = time.perf_counter()
+        acc.update(multivariate_design(X), y)
+        elapsed += time.perf_counter() - start
+        X_all.append(X)
+        y_all.append(y)
+    solution = acc.solve()
+    print(f"  QRAccumulator: {elapsed:.2f} s ({rows / elapsed / 1e6:.1f} M rows/s), "
+          f"state {acc._R.nbytes} bytes")
+
+    A = multivariate_design(np.concatenate(X_all))
+    y = np.concatenate(y_all)
+    start = time.perf_counter()
+    reference = np.linalg.lstsq(A, y, rcond=None)[0]
+    print(f"  np.linalg.lstsq on all rows in memory: {time.perf_counter() - start:.2f} s, "
+          f"{A.nbytes / 1e6:.0f} MB")
+    print(f"  max coefficient difference: {np.max(np.abs(solution - reference)):.1e}")
+
+
+def main():
+    offset_accuracy()
+    polynomial_accuracy()
+    streaming()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# bench_linearization.py
+# Vectorized auto_fit_best_model vs the original list-based pipeline
+
+import os
+import sys
+import time
+from math import exp, log
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.least_squares import auto_fit_best_model
+
+
+# ==================================================
+# Original implementation
+# ==================================================
+# The list-based pipeline of the baseline Logic.py, copied here so the
+# baseline stays fixed while numerics.least_squares changes
+
+def compute_summations(X, Y):
+    n = len(X)
+    return {
+        "n": n,
+        "sum_x": sum(X),
+        "sum_y": sum(Y),
+        "sum_x2": sum(x ** 2 for x in X),
+        "sum_xy": sum(x * y for x, y in zip(X, Y))
+    }
+
+
+def solve_normal_equations(sums):
+    n, Sx, Sy, Sx2, Sxy = sums["n"], sums["sum_x"], sums["sum_y"], sums["sum_x2"], sums["sum_xy"]
+    denominator = n * Sx2 - Sx ** 2
+    if denominator == 0:
+        raise ValueError("Normal equations are singular.")
+    return {"a": (n * Sxy - Sx * Sy) / denominator, "b": (Sy * Sx2 - Sx * Sxy) / denominator}
+
+
+def fit_linear(x, y):
+    sums = compute_summations(x, y)
+    coeffs = solve_normal_equations(sums)
+    return {"model": "Linear: y = ax + b", "a": coeffs["a"], "b": coeffs["b"], "sums": sums}
+
+
+def fit_exponential(x, y):
+    Y = [log(val) for val in y]
+    sums = compute_summations(x, Y)
+    coeffs = solve_normal_equations(sums)
+    return {"model": "Exponential: y = b e^(ax)", "a": coeffs["a"], "b": exp(coeffs["b"]), "sums": sums}
+
+
+def fit_power(x, y):
+    X = [log(val) for val in x]
+    Y = [log(val) for val in y]
+    sums = compute_summations(X, Y)
+    coeffs = solve_normal_equations(sums)
+    return {"model": "Power: y = b x^a", "a": coeffs["a"], "b": exp(coeffs["b"]), "sums": sums}
+
+
+def fit_growth_rate(x, y):
+    X = [1 / val for val in x]
+    Y = [1 / val for val in y]
+    sums = compute_summations(X, Y)
+    coeffs = solve_normal_equations(sums)
+    a = 1 / coeffs["b"]
+    return {"model": "Growth Rate: y = ax / (b + x)", "a": a, "b": coeffs["a"] * a, "sums": sums}
+
+
+def predict_linear(x, a, b):
+    return [a * xi + b for xi in x]
+
+
+def predict_exponential(x, a, b):
+    return [b * exp(a * xi) for xi in x]
+
+
+def predict_power(x, a, b):
+    return [b * (xi ** a) for xi in x]
+
+
+def predict_growth_rate(x, a, b):
+    return [(a * xi) / (b + xi) for xi in x]
+
+
+def compute_residual_error(y_true, y_pred):
+    return sum((yt - yp) ** 2 for yt, yp in zip(y_true, y_pred))
+
+
+def auto_fit_lists(x, y):
+    results = []
+    for fit, predict, ok in (
+        (fit_linear, predict_linear, True),
+        (fit_exponential, predict_exponential, all(v > 0 for v in y)),
+        (fit_power, predict_power, all(v > 0 for v in x) and all(v > 0 for v in y)),
+        (fit_growth_rate, predict_growth_rate, all(v != 0 for v in x) and all(v != 0 for v in y)),
+    ):
+        if ok:
+            model = fit(x, y)
+            model["error"] = compute_residual_error(y, predict(x, model["a"], model["b"]))
+            results.append(model)
+    return {"best_model": min(results, key=lambda m: m["error"]), "all_models": results}
+
+
+# ==================================================
+# Benchmark
+# ==================================================
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'points':>10}{'lists (s)':>12}{'numpy (s)':>12}{'speedup':>10}{'max rel diff':>15}")
+    for n in (10_000, 100_000, 1_000_000):
+        x = rng.uniform(1, 10, n)
+        y = 2.0 * x**1.3 * rng.uniform(0.95, 1.05, n)
+        x_list, y_list = x.tolist(), y.tolist()
+
+        start = time.perf_counter()
+        slow = auto_fit_lists(x_list, y_list)
+        t_slow = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fast = auto_fit_best_model(x_list, y_list)
+        t_fast = time.perf_counter() - start
+
+        assert slow["best_model"]["model"] == fast["best_model"]["model"]
+        diff = max(abs(m1[k] - m2[k]) / abs(m1[k])
+                   for m1, m2 in zip(slow["all_models"], fast["all_models"])
+                   for k in ("a", "b", "error"))
+        print(f"{n:>10}{t_slow:>12.3f}{t_fast:>12.4f}{t_slow / t_fast:>9.0f}x{diff:>15.1e}")
+
+    # Best of 20 against the slow column's last row, the 10^6-point baseline
+    x = rng.uniform(1, 10, 1_000_000)
+    y = 2.0 * x**1.3
+    t_array = float("inf")
+    for _ in range(20):
+        start = time.perf_counter()
+        auto_fit_best_model(x, y)
+        t_array = min(t_array, time.perf_counter() - start)
+    print(f"\n10^6 points as NumPy arrays: {t_array:.4f} s ({t_slow / t_array:.0f}x the original)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# bench_linearization_batch.py
+# Throughput of auto_fit_many for different worker counts and chunk sizes
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.least_squares import auto_fit_many, auto_fit_stacked
+
+
+def make_series(count, points, seed=0):
+    rng = np.random.default_rng(seed)
+    series = []
+    for _ in range(count):
+        x = rng.uniform(1, 10, points)
+        y = rng.uniform(0.5, 3) * x ** rng.uniform(0.5, 2) * rng.uniform(0.95, 1.05, points)
+        series.append((x, y))
+    return series
+
+
+def main():
+    series = make_series(20_000, 200)
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, cores // 2 or 1, cores})
+
+    print(f"{len(series)} series x 200 points, {cores} core(s)")
+    print(f"{'workers':>8}{'chunksize':>11}{'ordered':>9}{'series/s':>11}")
+    for workers in worker_counts:
+        for chunksize in (16, 256):
+            for ordered in (True, False):
+                if workers == 1 and (chunksize, ordered) != (16, True):
+                    continue
+                stats = {}
+                for _ in auto_fit_many(series, workers, chunksize, ordered, stats):
+                    pass
+                print(f"{workers:>8}{chunksize:>11}{str(ordered):>9}{stats['series_per_second']:>11.0f}")
+
+    # Same data as one m x n array, all models fitted with array operations
+    x = np.stack([s[0] for s in series])
+    y = np.stack([s[1] for s in series])
+    start = time.perf_counter()
+    auto_fit_stacked(x, y)
+    elapsed = time.perf_counter() - start
+    print(f"{'auto_fit_stacked':>28}{len(series) / elapsed:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# bench_loaders.py
+# fit_file throughput and peak memory for CSV, .npy and raw binary input
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.loaders import fit_file
+
+
+def write_files(folder, n, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(1, 10, n)
+    data = np.column_stack([x, 2.0 * x**1.3 * rng.uniform(0.95, 1.05, n)])
+    paths = {
+        "csv": os.path.join(folder, "data.csv"),
+        "npy": os.path.join(folder, "data.npy"),
+        "bin": os.path.join(folder, "data.bin"),
+    }
+    np.savetxt(paths["csv"], data[: n // 10], delimiter=",")
+    np.save(paths["npy"], data)
+    data.astype("<f8").tofile(paths["bin"])
+    return paths
+
+
+def main():
+    n = 10_000_000
+    with tempfile.TemporaryDirectory() as folder:
+        paths = write_files(folder, n)
+        print(f"{'format':>8}{'file (MB)':>11}{'time (s)':>10}{'M points/s':>12}{'peak (MB)':>11}")
+        for fmt, path in paths.items():
+            size = os.path.getsize(path) / 2**20
+            tracemalloc.start()
+            start = time.perf_counter()
+            result = fit_file(path, chunk_size=200_000)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+            points = result["best_model"]["sums"]["n"]
+            print(f"{fmt:>8}{size:>11.0f}{elapsed:>10.2f}{points / elapsed / 1e6:>12.1f}{peak:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
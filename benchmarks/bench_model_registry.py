@@ -0,0 +1,55 @@
+# bench_model_registry.py
+# auto_fit_best_model with the model registry: cost per extra candidate,
+# and fitting the candidates on a thread pool against one after another
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.least_squares import DEFAULT_MODELS, auto_fit_best_model, polynomial_model
+
+LECTURE = ["linear", "exponential", "power", "growth_rate"]
+
+
+def best_time(f, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def make_data(points, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(0.5, 10, points)
+    return x, 1.7 * x ** 1.3 * rng.uniform(0.95, 1.05, points)
+
+
+def main():
+    cores = os.cpu_count() or 1
+    # At least two threads, so the pool is exercised even on one core
+    workers = max(2, cores)
+    candidate_sets = [
+        ("lecture (4)", LECTURE),
+        (f"default ({len(DEFAULT_MODELS)})", DEFAULT_MODELS),
+        ("default + saturation + cubic", DEFAULT_MODELS + ["saturation", polynomial_model(3)]),
+    ]
+
+    print(f"{cores} core(s), {workers} threads; time per auto_fit_best_model call")
+    print(f"{'points':>9}  {'candidates':<30}{'sequential ms':>15}{'threads ms':>12}{'speedup':>9}")
+    for points, repeat in ((1_000, 200), (100_000, 10), (2_000_000, 3)):
+        x, y = make_data(points)
+        for label, models in candidate_sets:
+            sequential = best_time(lambda: auto_fit_best_model(x, y, models=models, workers=1), repeat)
+            threaded = best_time(lambda: auto_fit_best_model(x, y, models=models, workers=workers), repeat)
+            print(f"{points:>9}  {label:<30}{sequential * 1e3:>15.2f}{threaded * 1e3:>12.2f}"
+                  f"{sequential / threaded:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# bench_monitor.py
+# Iterations and time spent on failing runs: early exit vs the max_iter budget
+
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.jacobi import stationary_method
+from numerics.monitor import BREAKDOWN, CONVERGED, CYCLE, DIVERGED, STAGNATED, ConvergenceMonitor
+from numerics.newton import newton_method
+from numerics.secant import parse_function, secant_method
+
+MAX_ITER = 10_000
+
+
+def newton_case(func_str, x0, tol=1e-6):
+    result = newton_method(func_str, x0, tol=tol, max_iter=MAX_ITER)
+    return result["reason"], len(result["iterations"])
+
+
+def secant_case(func_text, x0, x1, tol=1e-6):
+    monitor = ConvergenceMonitor(tol, MAX_ITER)
+    secant_method(parse_function(func_text), x0, x1, tol, MAX_ITER, monitor=monitor)
+    return monitor.reason, monitor.iterations
+
+
+# Each run with the reason it must stop for
+CASES = [
+    ("newton atan(x), x0 = 1.5", BREAKDOWN, lambda: newton_case("atan(x)", 1.5)),
+    ("newton x**3 - 2*x + 2, x0 = 0", CYCLE, lambda: newton_case("x**3 - 2*x + 2", 0.0)),
+    ("newton x**2 - 2, tol 1e-30", STAGNATED, lambda: newton_case("x**2 - 2", 1.0, tol=1e-30)),
+    ("newton x**2 - 2 (converges)", CONVERGED, lambda: newton_case("x**2 - 2", 1.0)),
+    ("secant cbrt(x), x0 = 1, x1 = 2", CYCLE,
+     lambda: secant_case("x**(1/3) if x > 0 else -(-x)**(1/3)", 1.0, 2.0)),
+    # Runs away from the root at 0 while f fades towards 0
+    ("secant x*exp(-x), x0 = 2, x1 = 3", DIVERGED, lambda: secant_case("x*math.exp(-x)", 2.0, 3.0)),
+    ("secant x**2 + 1 (no root)", DIVERGED, lambda: secant_case("x**2 + 1", 0.5, 1.0)),
+]
+
+
+def main():
+    print(f"max_iter = {MAX_ITER}\n")
+    print(f"{'run':<34}{'reason':>12}{'iterations':>12}{'time (ms)':>11}")
+    for name, expected, case in CASES:
+        case()  # compile f(x) outside the timing
+        start = time.perf_counter()
+        reason, iterations = case()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<34}{reason:>12}{iterations:>12}{elapsed * 1e3:>11.2f}")
+        assert reason == expected, f"{name}: expected {expected}, stopped with {reason}"
+
+    # A diverging Jacobi run stops once |b - A x| has grown 1e8-fold
+    n = 1000
+    rng = np.random.default_rng(0)
+    A = rng.standard_normal((n, n)) + np.diag(np.full(n, 5.0))
+    b = np.ones(n)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        start = time.perf_counter()
+        result = stationary_method(A, b, np.zeros(n), 1e-8, MAX_ITER, "jacobi")
+        elapsed = time.perf_counter() - start
+    assert result["reason"] == DIVERGED, result["reason"]
+    # Cost of a sweep, from a run that converges: divided by the sweeps
+    # actually done, since tol=0 stops once the iterates stagnate
+    start = time.perf_counter()
+    timing = stationary_method(A + np.diag(np.full(n, 100.0)), b, np.zeros(n), 0.0, 100, "jacobi")
+    per_sweep = (time.perf_counter() - start) / timing["iterations"]
+    print(f"\njacobi, hopeless dense n = {n}: {result['reason']} after {result['iterations']} sweeps, "
+          f"{elapsed * 1e3:.1f} ms (the full budget: ~{MAX_ITER * per_sweep * 1e3:.0f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# bench_newton.py
+# Per-iteration cost of the Newton loop: SymPy subs vs compiled callables
+
+import os
+import sys
+import time
+
+import sympy as sp
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.newton import compile_function, newton_method
+
+
+# README example functions
+FUNCTIONS = [
+    ("x**3 - 2*x - 5", 2.0),
+    ("x**2*exp(x) - 1", 1.0),
+    ("x**2 - 2", 1.0),
+]
+
+
+def subs_step(fx, dfx, x, x_val):
+    return float(fx.subs(x, x_val)), float(dfx.subs(x, x_val))
+
+
+def time_per_call(step, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        step()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    x = sp.symbols("x")
+    print(f"{'f(x)':<20}{'subs (us/iter)':>16}{'compiled (us/iter)':>20}{'speedup':>10}")
+    for func_str, x0 in FUNCTIONS:
+        fx = sp.sympify(func_str)
+        dfx = sp.diff(fx, x)
+        f_df = compile_function(fx, dfx, x)
+
+        t_subs = time_per_call(lambda: subs_step(fx, dfx, x, x0), 200)
+        t_fast = time_per_call(lambda: f_df(x0), 200_000)
+        print(f"{func_str:<20}{t_subs * 1e6:>16.2f}{t_fast * 1e6:>20.3f}{t_subs / t_fast:>9.0f}x")
+
+    print()
+    for func_str, x0 in FUNCTIONS:
+        start = time.perf_counter()
+        result = newton_method(func_str, x0)
+        elapsed = time.perf_counter() - start
+        print(f"newton_method({func_str!r}, {x0}): root = {result['root']:.6f}, "
+              f"{len(result['iterations'])} iterations, {elapsed * 1e3:.2f} ms total")
+
+
+if __name__ == "__main__":
+    main()
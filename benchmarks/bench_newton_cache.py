@@ -0,0 +1,59 @@
+# bench_newton_cache.py
+# newton_method with and without the program cache, and warm starts from disk
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from numerics.newton import newton_method, program_cache
+
+FUNCTIONS = ["x**3 - 2*x - 5", "x**2*exp(x) - 1", "cos(x) - x", "x**2 - 2", "log(x) + x - 2"]
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from numerics.newton import newton_method, program_cache
+for f in {functions!r}:
+    newton_method(f, 1.5)
+print(time.perf_counter() - start, "sympy" in sys.modules, program_cache.stats()["disk_loads"])
+"""
+
+
+def main():
+    rng = np.random.default_rng(0)
+    calls = [(FUNCTIONS[i % len(FUNCTIONS)], x0) for i, x0 in enumerate(rng.uniform(0.5, 3, 2000))]
+
+    start = time.perf_counter()
+    for func_str, x0 in calls[:100]:
+        program_cache.clear()
+        newton_method(func_str, x0)
+    t_cold = (time.perf_counter() - start) / 100
+
+    program_cache.clear()
+    start = time.perf_counter()
+    for func_str, x0 in calls:
+        newton_method(func_str, x0)
+    t_warm = (time.perf_counter() - start) / len(calls)
+
+    print(f"uncached: {t_cold * 1e3:.3f} ms/call, cached: {t_warm * 1e3:.4f} ms/call "
+          f"({t_cold / t_warm:.0f}x), {program_cache.stats()}")
+
+    with tempfile.TemporaryDirectory() as folder:
+        env = dict(os.environ, NUMERICS_NEWTON_CACHE=os.path.join(folder, "newton.json"))
+        script = SCRIPT.format(functions=FUNCTIONS)
+        for label in ("first run (builds + saves)", "warm start from disk"):
+            out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env,
+                                 capture_output=True, text=True, check=True).stdout.split()
+            print(f"{label:<28} {float(out[0]) * 1e3:7.1f} ms, sympy imported: {out[1]}, "
+                  f"programs loaded from disk: {out[2]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# bench_refine.py
+# Cost of Levenberg-Marquardt refinement (auto_fit_best_model refine=True)
+# against the linearized-only fit, and how often it changes the chosen model
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.least_squares import MODEL_NAMES, auto_fit_best_model
+
+# True models with additive noise in y: the case the linearized fits misweight
+TRUE_MODELS = {
+    "exponential": lambda x: 2.5 * np.exp(0.4 * x),
+    "power": lambda x: 1.7 * x ** 1.3,
+    "growth_rate": lambda x: 5 * x / (2 + x),
+}
+
+
+def make_data(kind, points, rng, noise=0.05):
+    x = np.sort(rng.uniform(0.2, 8, points))
+    clean = TRUE_MODELS[kind](x)
+    return x, clean + noise * np.std(clean) * rng.standard_normal(points)
+
+
+def timing(points, repeat):
+    rng = np.random.default_rng(points)
+    data = [make_data(kind, points, rng) for kind in TRUE_MODELS for _ in range(repeat)]
+    times = []
+    for refine in (False, True):
+        start = time.perf_counter()
+        for x, y in data:
+            result = auto_fit_best_model(x, y, refine=refine)
+        times.append((time.perf_counter() - start) / len(data))
+    iterations = [m["refinement"]["iterations"] for m in result["all_models"] if "refinement" in m]
+    return times, iterations
+
+
+def selection(points=30, trials=300):
+    rng = np.random.default_rng(7)
+    print(f"\ntrue model picked, {trials} noisy data sets of {points} points each")
+    print(f"{'true model':<14}{'linearized':>12}{'refined':>10}")
+    for kind in TRUE_MODELS:
+        right = [0, 0]
+        for _ in range(trials):
+            x, y = make_data(kind, points, rng)
+            for i, refine in enumerate((False, True)):
+                right[i] += auto_fit_best_model(x, y, refine=refine)["best_model"]["model"] == MODEL_NAMES[kind]
+        print(f"{kind:<14}{right[0]:>12}{right[1]:>10}")
+
+
+def main():
+    print("auto_fit_best_model per data set")
+    print(f"{'points':>8}{'linearized us':>15}{'refined us':>12}{'ratio':>7}   LM iterations")
+    for points, repeat in ((10, 300), (100, 300), (1000, 100), (10_000, 20), (100_000, 3)):
+        (plain, refined), iterations = timing(points, repeat)
+        print(f"{points:>8}{plain * 1e6:>15.0f}{refined * 1e6:>12.0f}{refined / plain:>7.1f}   {iterations}")
+    selection()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# bench_root_batch.py
+# Scalar secant/Newton calls in a Python loop vs the array-valued batch versions
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.secant import CONVERGED, secant_method, secant_method_batch
+from numerics.newton import newton_method, newton_method_batch
+
+
+def main():
+    # x**3 - 2*x - c for a sweep of coefficients c
+    rng = np.random.default_rng(0)
+
+    n_loop = 2_000
+    c = rng.uniform(1, 10, n_loop)
+    start = time.perf_counter()
+    for ci in c:
+        secant_method(lambda x: x**3 - 2*x - ci, 2.0, 3.0, 1e-10)
+    t_loop = (time.perf_counter() - start) / n_loop
+
+    start = time.perf_counter()
+    for ci in c[:200]:
+        newton_method(f"x**3 - 2*x - {ci}", 2.0, 1e-10)
+    t_newton_loop = (time.perf_counter() - start) / 200
+
+    print(f"{'lanes':>10}{'secant us/root':>16}{'newton us/root':>16}{'converged':>11}")
+    print(f"{'loop':>10}{t_loop * 1e6:>16.2f}{t_newton_loop * 1e6:>16.2f}")
+
+    for n in (10_000, 100_000, 1_000_000):
+        c = rng.uniform(1, 10, n)
+
+        start = time.perf_counter()
+        sec = secant_method_batch(lambda x, c: x**3 - 2*x - c, 2.0, 3.0, 1e-10, args=(c,))
+        t_sec = (time.perf_counter() - start) / n
+
+        start = time.perf_counter()
+        newt = newton_method_batch("x**3 - 2*x - c", 2.0, 1e-10, params={"c": c})
+        t_newt = (time.perf_counter() - start) / n
+
+        ok = np.mean((sec["status"] == CONVERGED) & (newt["status"] == CONVERGED))
+        print(f"{n:>10}{t_sec * 1e6:>16.3f}{t_newt * 1e6:>16.3f}{ok:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# bench_secant.py
+# Secant solver: eval() per call vs compiled expression, and evaluation counts
+
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.expressions import compile_expression
+from numerics.secant import parse_function, secant_method
+
+FUNCTIONS = [
+    ("x**3 - 2*x - 5", 2.0, 3.0),
+    ("x**2*math.exp(x)-1", 0.0, 1.0),
+    ("math.cos(x) - x", 0.0, 1.0),
+]
+
+
+def secant_two_evals(f, x0, x1, tol=1e-4, max_iter=100):
+    # Original loop, kept here as the baseline: f(x0) and f(x1) every iteration
+    steps = []
+    for i in range(max_iter):
+        f0 = f(x0)
+        f1 = f(x1)
+        if f1 - f0 == 0:
+            raise ValueError("Division by zero")
+        x2 = x1 - f1*(x1 - x0)/(f1 - f0)
+        steps.append((i+1, x0, x1, x2, f0, f1))
+        if abs(x2 - x1) < tol:
+            return x2, steps
+        x0, x1 = x1, x2
+    return x2, steps
+
+
+def counted(f):
+    def wrapper(x):
+        wrapper.calls += 1
+        return f(x)
+    wrapper.calls = 0
+    return wrapper
+
+
+def per_call(f, repeat=100_000):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        f(1.5)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    print(f"{'f(x)':<22}{'eval us/call':>14}{'compiled us/call':>18}{'f evals old/new':>17}{'solve us old/new':>20}")
+    for text, x0, x1 in FUNCTIONS:
+        slow = lambda x, text=text: eval(text, {"x": x, "math": math})
+        fast = compile_expression(text)
+
+        old, new = counted(slow), counted(parse_function(text))
+        secant_two_evals(old, x0, x1, 1e-10)
+        secant_method(new, x0, x1, 1e-10)
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            secant_two_evals(lambda x, text=text: eval(text, {"x": x, "math": math}), x0, x1, 1e-10)
+        t_old = (time.perf_counter() - start) / 1000
+        start = time.perf_counter()
+        for _ in range(1000):
+            secant_method(parse_function(text), x0, x1, 1e-10)
+        t_new = (time.perf_counter() - start) / 1000
+
+        print(f"{text:<22}{per_call(slow) * 1e6:>14.2f}{per_call(fast) * 1e6:>18.3f}"
+              f"{old.calls:>9}/{new.calls:<7}{t_old * 1e6:>12.0f}/{t_new * 1e6:.0f}")
+
+    print("\n" + str(compile_expression.cache_info()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# bench_stationary.py
+# Iterations and wall time to tolerance: Jacobi, damped Jacobi, Gauss–Seidel, SOR
+
+import os
+import sys
+import time
+
+import numpy as np
+import scipy.sparse as sparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.jacobi import STATIONARY_METHODS, stationary_method
+
+
+def shifted_poisson_2d(m, shift):
+    # Diagonally dominant (by `shift`) but poorly conditioned for small shifts
+    T = sparse.diags([-1.0, 4.0 + shift, -1.0], [-1, 0, 1], shape=(m, m))
+    S = sparse.diags([-1.0, -1.0], [-1, 1], shape=(m, m))
+    I = sparse.identity(m)
+    return (sparse.kron(I, T) + sparse.kron(S, I)).tocsr()
+
+
+def main():
+    tol, max_iter = 1e-8, 20_000
+    for m, shift, dense in ((30, 0.05, True), (100, 0.05, False), (300, 0.01, False)):
+        A = shifted_poisson_2d(m, shift)
+        n = A.shape[0]
+        if dense:
+            A = A.toarray()
+        b = np.ones(n)
+        print(f"\n{m}x{m} grid, n = {n}, shift {shift}, {'dense' if dense else 'CSR'}")
+        print(f"{'method':<16}{'omega':>8}{'iterations':>12}{'time (s)':>10}{'residual':>11}")
+        for method in STATIONARY_METHODS:
+            start = time.perf_counter()
+            r = stationary_method(A, b, np.zeros(n), tol, max_iter, method)
+            elapsed = time.perf_counter() - start
+            residual = np.abs(A @ r["x"] - b).max()
+            print(f"{method:<16}{r['omega']:>8.3f}{r['iterations']:>12}{elapsed:>10.3f}{residual:>11.1e}")
+
+
+if __name__ == "__main__":
+    main()
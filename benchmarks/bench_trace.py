@@ -0,0 +1,55 @@
+# bench_trace.py
+# Cost of iteration traces: time per solve, memory per row, export time
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from numerics.newton import newton_method
+from numerics.secant import STEP_COLUMNS, parse_function, secant_method
+from numerics.trace import TRACE_MODES, make_trace
+
+
+def per_call(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    f = parse_function("x**2*math.exp(x) - 1")
+    newton_method("x**2*exp(x) - 1", 1.0)  # compile once
+
+    print(f"{'mode':<10}{'secant (us)':>13}{'newton (us)':>13}")
+    for mode in TRACE_MODES:
+        t_secant = per_call(lambda: secant_method(f, 0.0, 1.0, 1e-12, trace=mode), 20_000)
+        t_newton = per_call(lambda: newton_method("x**2*exp(x) - 1", 1.0, 1e-12, trace=mode), 20_000)
+        print(f"{mode:<10}{t_secant * 1e6:>13.2f}{t_newton * 1e6:>13.2f}")
+
+    rows = 200_000
+    print(f"\n{rows} secant rows{'bytes/row':>14}{'CSV (s)':>10}{'.npy (s)':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("compact", "full"):
+            tracemalloc.start()
+            trace = make_trace(mode, STEP_COLUMNS, "qddddd")
+            for i in range(rows):
+                trace.record((i + 1, 0.5 * i, 1.5 * i, 2.5 * i, -0.1 * i, 0.1 * i))
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            trace.save(os.path.join(tmp, "trace.csv"))
+            t_csv = time.perf_counter() - start
+            start = time.perf_counter()
+            trace.save(os.path.join(tmp, "trace.npy"))
+            t_npy = time.perf_counter() - start
+            print(f"{mode:<17}{size / rows:>14.0f}{t_csv:>10.3f}{t_npy:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
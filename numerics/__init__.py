@@ -0,0 +1,48 @@
+# numerics
+# GUI-free core of the Numerical Methods Project
+#
+# Submodules are imported on first use, so `import numerics` stays cheap
+# and never pulls in tkinter, SymPy or SciPy.
+
+import importlib
+
+_EXPORTS = {
+    "newton_method": "newton",
+    "newton_method_batch": "newton",
+    "secant_method": "secant",
+    "secant_method_batch": "secant",
+    "hybrid_method": "hybrid",
+    "value_and_derivative": "autodiff",
+    "jacobi_method": "jacobi",
+    "jacobi_method_batched": "jacobi",
+    "parallel_jacobi_method": "jacobi",
+    "conjugate_gradient": "krylov",
+    "gmres": "krylov",
+    "bicgstab": "krylov",
+    "auto_fit_best_model": "least_squares",
+    "auto_fit_many": "least_squares",
+    "auto_fit_stacked": "least_squares",
+    "fit_polynomial": "least_squares",
+    "fit_multivariate": "least_squares",
+    "QRAccumulator": "least_squares",
+    "LeastSquaresAccumulator": "least_squares",
+    "IncrementalFitter": "least_squares",
+    "register_model": "least_squares",
+    "fit_file": "loaders",
+    "ConvergenceMonitor": "monitor",
+    "make_trace": "trace",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,281 @@
+# autodiff.py
+# Forward-mode automatic differentiation with dual numbers
+#
+# A Dual carries a value and its derivative with respect to x. Running any
+# Python function of x on Dual(x, 1) gives f(x) and f'(x) in one pass,
+# through branches, loops and helper functions alike, without SymPy.
+# Values may be floats or NumPy arrays (one lane per element).
+
+import math
+from functools import lru_cache
+from types import FunctionType, SimpleNamespace
+
+import numpy as np
+
+from .expressions import BUILTIN_NAMES, MATH_NAMES, build_function
+
+
+class Dual:
+    __slots__ = ("value", "deriv")
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # np.sin(x), ndarray + x, ...: the differentiable ufuncs go to the
+        # functions and operators below instead of building object arrays
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if ufunc.nin == 1 and ufunc.__name__ in _UFUNCS:
+            return _UFUNCS[ufunc.__name__](inputs[0])
+        if ufunc.nin == 2 and ufunc.__name__ in _BINARY_UFUNCS:
+            a, b = inputs
+            forward, reflected = _BINARY_UFUNCS[ufunc.__name__]
+            return forward(a, b) if isinstance(a, Dual) else reflected(b, a)
+        raise TypeError(f"numpy.{ufunc.__name__}() has no automatic derivative")
+
+    def __init__(self, value, deriv=0.0):
+        self.value = value
+        self.deriv = deriv
+
+    def __repr__(self):
+        return f"Dual({self.value!r}, {self.deriv!r})"
+
+    # Arithmetic
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.deriv + other.deriv)
+        return Dual(self.value + other, self.deriv)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value - other.value, self.deriv - other.deriv)
+        return Dual(self.value - other, self.deriv)
+
+    def __rsub__(self, other):
+        return Dual(other - self.value, -self.deriv)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value,
+                        self.deriv * other.value + self.value * other.deriv)
+        return Dual(self.value * other, self.deriv * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value / other.value,
+                        (self.deriv * other.value - self.value * other.deriv) / (other.value * other.value))
+        return Dual(self.value / other, self.deriv / other)
+
+    def __rtruediv__(self, other):
+        return Dual(other / self.value, -other * self.deriv / (self.value * self.value))
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            # d(u^v) = u^v (v' ln u + v u'/u)
+            value = self.value ** other.value
+            return Dual(value, value * (other.deriv * _module(self.value).log(self.value)
+                                        + other.value * self.deriv / self.value))
+        if isinstance(other, (int, float)) and other == 0:
+            return Dual(self.value ** 0, self.deriv * 0)
+        return Dual(self.value ** other, other * self.value ** (other - 1) * self.deriv)
+
+    def __rpow__(self, other):
+        value = other ** self.value
+        return Dual(value, value * _module(other).log(other) * self.deriv)
+
+    def __neg__(self):
+        return Dual(-self.value, -self.deriv)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return fabs(self)
+
+    # Comparisons look at the value, so branches on x work
+    def __lt__(self, other):
+        return self.value < _value(other)
+
+    def __le__(self, other):
+        return self.value <= _value(other)
+
+    def __gt__(self, other):
+        return self.value > _value(other)
+
+    def __ge__(self, other):
+        return self.value >= _value(other)
+
+    def __eq__(self, other):
+        return self.value == _value(other)
+
+    def __ne__(self, other):
+        return self.value != _value(other)
+
+    __hash__ = None
+
+    def __float__(self):
+        # math.exp(x) would go through here and silently drop the
+        # derivative: the functions of this module must be used instead
+        raise TypeError("a Dual cannot be converted to float; use the functions "
+                        "of numerics.autodiff (exp, sin, ...) instead of math's")
+
+
+def _value(x):
+    return x.value if isinstance(x, Dual) else x
+
+
+def _module(value):
+    return np if isinstance(value, np.ndarray) else math
+
+
+# ==================================================
+# Elementary Functions
+# ==================================================
+
+def _elementary(name, derivative):
+    """
+    math.<name> lifted to Dual numbers. derivative(M, v, fv) gives f'(v)
+    using module M (math for floats, numpy for arrays) and fv = f(v).
+    """
+    np_name = {"fabs": "abs", "asin": "arcsin", "acos": "arccos", "atan": "arctan",
+               "asinh": "arcsinh", "acosh": "arccosh", "atanh": "arctanh"}.get(name, name)
+
+    def function(x):
+        if isinstance(x, Dual):
+            v = x.value
+            M = _module(v)
+            fv = getattr(M, np_name if M is np else name)(v)
+            return Dual(fv, derivative(M, v, fv) * x.deriv)
+        if isinstance(x, np.ndarray):
+            return getattr(np, np_name)(x)
+        return getattr(math, name)(x)
+
+    function.__name__ = name
+    return function
+
+
+_DERIVATIVES = {
+    "exp": lambda M, v, fv: fv,
+    "expm1": lambda M, v, fv: fv + 1,
+    "log": lambda M, v, fv: 1 / v,
+    "log1p": lambda M, v, fv: 1 / (1 + v),
+    "log2": lambda M, v, fv: 1 / (v * math.log(2)),
+    "log10": lambda M, v, fv: 1 / (v * math.log(10)),
+    "sqrt": lambda M, v, fv: 0.5 / fv,
+    "sin": lambda M, v, fv: M.cos(v),
+    "cos": lambda M, v, fv: -M.sin(v),
+    "tan": lambda M, v, fv: 1 + fv * fv,
+    "asin": lambda M, v, fv: 1 / M.sqrt(1 - v * v),
+    "acos": lambda M, v, fv: -1 / M.sqrt(1 - v * v),
+    "atan": lambda M, v, fv: 1 / (1 + v * v),
+    "sinh": lambda M, v, fv: M.cosh(v),
+    "cosh": lambda M, v, fv: M.sinh(v),
+    "tanh": lambda M, v, fv: 1 - fv * fv,
+    "asinh": lambda M, v, fv: 1 / M.sqrt(v * v + 1),
+    "acosh": lambda M, v, fv: 1 / M.sqrt(v * v - 1),
+    "atanh": lambda M, v, fv: 1 / (1 - v * v),
+    "fabs": lambda M, v, fv: M.copysign(1.0, v),
+}
+
+globals().update({name: _elementary(name, d) for name, d in _DERIVATIVES.items()})
+_log = log
+
+
+def log(x, base=None):
+    return _log(x) if base is None else _log(x) / math.log(base)
+
+
+def _unsupported(name, original):
+    # Fine on constants (gamma(3) * x); only a Dual argument is an error
+    def function(*args):
+        if any(isinstance(a, Dual) for a in args):
+            raise TypeError(f"{name}() has no automatic derivative")
+        return original(*args)
+    function.__name__ = name
+    return function
+
+
+# Drop-in for the math names an f(x) expression may use: differentiable
+# functions work on Dual numbers, constants are kept, anything else
+# raises when called
+DUAL_MATH = {name: (value if not callable(value) else _unsupported(name, value))
+             for name, value in MATH_NAMES.items()}
+DUAL_MATH.update({name: globals()[name] for name in _DERIVATIVES})
+DUAL_MATH["pow"] = lambda x, y: x ** y
+DUAL_MATH["math"] = SimpleNamespace(**DUAL_MATH)
+# abs, min and max pick a branch through the Dual methods; round is flat
+DUAL_MATH.update(abs=abs, min=min, max=max, round=_unsupported("round", BUILTIN_NAMES["round"]))
+
+# NumPy ufuncs on Dual numbers (Dual.__array_ufunc__)
+_UFUNCS = {"arcsin": asin, "arccos": acos, "arctan": atan, "arcsinh": asinh, "arccosh": acosh,
+           "arctanh": atanh, "absolute": fabs, "negative": Dual.__neg__, "positive": Dual.__pos__,
+           "square": lambda x: x * x, "reciprocal": lambda x: 1 / x}
+_UFUNCS.update({name: globals()[name] for name in _DERIVATIVES if hasattr(np, name)})
+_BINARY_UFUNCS = {
+    "add": (Dual.__add__, Dual.__radd__),
+    "subtract": (Dual.__sub__, Dual.__rsub__),
+    "multiply": (Dual.__mul__, Dual.__rmul__),
+    "divide": (Dual.__truediv__, Dual.__rtruediv__),
+    "power": (Dual.__pow__, Dual.__rpow__),
+}
+
+
+def _dual_globals(f):
+    """
+    f with the math module and math functions among its globals
+    (math.exp, or exp from "from math import exp") replaced by their
+    DUAL_MATH versions, so that math-based functions, such as those the
+    secant method takes, differentiate too. Other functions are returned
+    as they are.
+    """
+    if not isinstance(f, FunctionType):
+        return f
+    replace = {name: _MATH_TO_DUAL[id(value)] for name in f.__code__.co_names
+               if (value := f.__globals__.get(name)) is not None and id(value) in _MATH_TO_DUAL}
+    if not replace:
+        return f
+    rebound = FunctionType(f.__code__, {**f.__globals__, **replace}, f.__name__,
+                           f.__defaults__, f.__closure__)
+    rebound.__kwdefaults__ = f.__kwdefaults__
+    return rebound
+
+
+_MATH_TO_DUAL = {id(value): DUAL_MATH[name] for name, value in MATH_NAMES.items() if callable(value)}
+_MATH_TO_DUAL[id(math)] = DUAL_MATH["math"]
+
+
+# ==================================================
+# Derivatives of Python Callables
+# ==================================================
+
+def value_and_derivative(f):
+    """
+    Wraps f(x, *args, **kwargs) into f_df(x, ...) -> (f(x), f'(x)),
+    evaluated in one pass with dual numbers. x may be a float or a NumPy
+    array, differentiated element-wise; the other arguments are constants.
+    f may use math (its math names are rebound to DUAL_MATH) or NumPy
+    ufuncs.
+    """
+    f = _dual_globals(f)
+
+    def f_df(x, *args, **kwargs):
+        seed = np.ones_like(x, dtype=float) if isinstance(x, np.ndarray) else 1.0
+        y = f(Dual(x, seed), *args, **kwargs)
+        if isinstance(y, Dual):
+            return y.value, y.deriv
+        # f did not depend on x
+        return y, 0 * seed
+
+    return f_df
+
+
+@lru_cache(maxsize=256)
+def compile_dual(text, variable="x"):
+    """
+    f(x) text (the secant syntax: Python with math names, e.g.
+    "x**2*math.exp(x) - 1") compiled for dual numbers and wrapped by
+    value_and_derivative. Cached like compile_expression.
+    """
+    return value_and_derivative(build_function(text, variable, namespace=DUAL_MATH))
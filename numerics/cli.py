@@ -0,0 +1,261 @@
+# cli.py
+# Command-line entry points: python -m numerics <method> [options]
+#
+# Parameters come from options and/or a JSON object given with --input
+# (a file, or "-" for stdin); options win over the JSON values. The result
+# is written as JSON to stdout or --output, with NaN and infinities as null.
+#
+# Exit codes: 0 success, 1 the method failed or did not converge,
+# 2 bad input.
+
+import argparse
+import json
+import math
+import sys
+
+
+class InputError(Exception):
+    pass
+
+
+def _to_json(value):
+    """
+    value with arrays and traces as lists and NaN/inf as null: JSON has
+    no literal for them and strict parsers (jq, JSON.parse) reject
+    Python's Infinity.
+    """
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, (str, int, bool)) or value is None:
+        return value
+    if hasattr(value, "tolist"):
+        return _to_json(value.tolist())
+    return str(value)
+
+
+def _load_params(args):
+    params = {}
+    if args.input is not None:
+        try:
+            if args.input == "-":
+                params = json.load(sys.stdin)
+            else:
+                with open(args.input) as f:
+                    params = json.load(f)
+        except (OSError, ValueError) as e:
+            raise InputError(f"Cannot read input: {e}")
+        if not isinstance(params, dict):
+            raise InputError("Input must be a JSON object.")
+    for key, value in vars(args).items():
+        if key not in ("command", "input", "output", "handler") and value is not None:
+            params[key] = value
+    return params
+
+
+def _require(params, *keys):
+    missing = [key for key in keys if params.get(key) is None]
+    if missing:
+        raise InputError("Missing parameter(s): " + ", ".join(missing))
+    return [params[key] for key in keys]
+
+
+def _trace_mode(params):
+    # Writing a trace file needs a trace, but not the Python tuples
+    default = "compact" if params.get("trace_file") else "full"
+    return params.get("trace", default)
+
+
+def _save_trace(params, trace):
+    if params.get("trace_file"):
+        try:
+            trace.save(params["trace_file"])
+        except OSError as e:
+            raise InputError(f"Cannot write trace: {e}")
+
+
+# ==================================================
+# Commands
+# ==================================================
+
+def run_newton(params):
+    from .newton import newton_method
+
+    func_str, x0 = _require(params, "function", "x0")
+    result = newton_method(func_str, float(x0),
+                           tol=float(params.get("tol", 1e-6)),
+                           max_iter=int(params.get("max_iter", 100)),
+                           trace=_trace_mode(params),
+                           derivative="autodiff" if params.get("autodiff") else "sympy")
+    _save_trace(params, result["iterations"])
+    return result, result["converged"]
+
+
+def run_secant(params):
+    from .monitor import BREAKDOWN, ConvergenceMonitor
+    from .secant import parse_function, secant_method
+
+    func_text, x0, x1 = _require(params, "function", "x0", "x1")
+    tol, max_iter = float(params.get("tol", 1e-4)), int(params.get("max_iter", 100))
+    try:
+        f = parse_function(func_text)
+    except ValueError as e:
+        raise InputError(str(e))
+    monitor = ConvergenceMonitor(tol, max_iter)
+    try:
+        root, steps = secant_method(f, float(x0), float(x1),
+                                    tol=tol, max_iter=max_iter, monitor=monitor,
+                                    trace=_trace_mode(params))
+    except (ArithmeticError, ValueError) as e:
+        return {"root": None, "steps": [], "error_msg": str(e), "reason": BREAKDOWN}, False
+    _save_trace(params, steps)
+    return {"root": root, "steps": steps, "converged": monitor.converged,
+            "reason": monitor.reason, "error_msg": monitor.message}, monitor.converged
+
+
+def run_hybrid(params):
+    from .hybrid import hybrid_method
+
+    func_text, a, b = _require(params, "function", "a", "b")
+    if params.get("derivative"):
+        from .newton import program_cache
+
+        f, df = program_cache.get(func_text)["f_df"], True
+    else:
+        from .secant import parse_function
+
+        try:
+            f, df = parse_function(func_text), None
+        except ValueError as e:
+            raise InputError(str(e))
+    try:
+        result = hybrid_method(f, float(a), float(b),
+                               tol=float(params.get("tol", 1e-12)),
+                               max_iter=int(params.get("max_iter", 100)), df=df)
+    except ValueError as e:
+        raise InputError(str(e))
+    return result, result["converged"]
+
+
+def run_jacobi(params):
+    import numpy as np
+
+    from .jacobi import parallel_jacobi_method, stationary_method
+
+    A, b = _require(params, "A", "b")
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if A.ndim != 2 or A.shape[0] != A.shape[1] or b.shape != (A.shape[0],):
+        raise InputError("A must be n x n and b must have n values.")
+    x0 = np.asarray(params.get("x0", np.zeros(len(b))), dtype=float)
+    if x0.shape != b.shape:
+        raise InputError("x0 must have n values.")
+
+    tol, max_iter = float(params.get("tol", 1e-6)), int(params.get("max_iter", 100))
+    if params.get("workers") is not None:
+        x = parallel_jacobi_method(A, b, x0, tol, max_iter, int(params["workers"]))
+        return {"x": x, "converged": x is not None}, x is not None
+
+    # Hopeless systems are rejected before iterating; the diagnostics
+    # explain why and predict the number of sweeps otherwise
+    result = stationary_method(A, b, x0, tol, max_iter, "jacobi", precheck=True)
+    return result, result["converged"]
+
+
+def run_fit(params):
+    if params.get("data") is not None:
+        from .loaders import fit_file
+
+        if params.get("refine"):
+            raise InputError("--refine needs x and y in memory; it is not available with --data.")
+
+        options = {}
+        if params.get("skip_header"):
+            options["skip_header"] = int(params["skip_header"])
+        return fit_file(params["data"], int(params.get("chunk_size", 100_000)), **options), True
+
+    from .least_squares import auto_fit_best_model
+
+    x, y = _require(params, "x", "y")
+    if len(x) != len(y):
+        raise InputError("x and y must have the same number of values.")
+    return auto_fit_best_model(x, y, refine=bool(params.get("refine"))), True
+
+
+# ==================================================
+# Argument Parsing
+# ==================================================
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m numerics",
+                                     description="Numerical methods without the GUI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def traced(sub):
+        sub.add_argument("--trace", choices=("none", "compact", "full"),
+                         help="how much of each iteration to keep (default full)")
+        sub.add_argument("--trace-file", dest="trace_file",
+                         help="also write the iterations to this CSV or .npy file")
+
+    def command(name, handler, help_text):
+        sub = commands.add_parser(name, help=help_text)
+        sub.add_argument("--input", help="JSON file with the parameters ('-' for stdin)")
+        sub.add_argument("--output", help="write the JSON result here instead of stdout")
+        sub.add_argument("--tol", type=float)
+        sub.add_argument("--max-iter", dest="max_iter", type=int)
+        sub.set_defaults(handler=handler)
+        return sub
+
+    sub = command("newton", run_newton, "Newton's method for f(x) = 0")
+    sub.add_argument("--function", help='f(x) in SymPy syntax, e.g. "x**3 - 2*x - 5"')
+    sub.add_argument("--x0", type=float)
+    sub.add_argument("--autodiff", action="store_true", default=None,
+                     help="differentiate with dual numbers instead of SymPy (f(x) in Python syntax)")
+    traced(sub)
+
+    sub = command("secant", run_secant, "secant method for f(x) = 0")
+    sub.add_argument("--function", help='f(x) in Python syntax, e.g. "x**2*math.exp(x)-1"')
+    sub.add_argument("--x0", type=float)
+    sub.add_argument("--x1", type=float)
+    traced(sub)
+
+    sub = command("hybrid", run_hybrid, "safeguarded bracketing solver for f(x) = 0 on [a, b]")
+    sub.add_argument("--function", help='f(x) in Python syntax, or SymPy syntax with --derivative')
+    sub.add_argument("--a", type=float)
+    sub.add_argument("--b", type=float)
+    sub.add_argument("--derivative", action="store_true", default=None,
+                     help="differentiate f with SymPy and take Newton steps")
+
+    sub = command("jacobi", run_jacobi, "Jacobi iteration for A x = b (A, b, x0 from --input)")
+    sub.add_argument("--workers", type=int, help="update row blocks on this many threads")
+
+    sub = command("fit", run_fit, "least squares model selection")
+    sub.add_argument("--data", help="CSV, .npy or raw float64 file of x, y pairs")
+    sub.add_argument("--skip-header", dest="skip_header", type=int)
+    sub.add_argument("--chunk-size", dest="chunk_size", type=int)
+    sub.add_argument("--refine", action="store_true", default=None,
+                     help="refine the nonlinear models by Levenberg-Marquardt on the error in y")
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        result, ok = args.handler(_load_params(args))
+        status = 0 if ok else 1
+    except InputError as e:
+        result, status = {"error_msg": str(e)}, 2
+    except (ArithmeticError, TypeError, ValueError) as e:
+        result, status = {"error_msg": str(e)}, 1
+
+    text = json.dumps(_to_json(result), indent=2, allow_nan=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return status
@@ -0,0 +1,71 @@
+# expressions.py
+# Compile-once f(x) expressions typed by the user
+
+import ast
+import math
+from functools import lru_cache
+
+# Names an expression may use besides x: the math module itself
+# (math.exp(x)) and its public functions and constants (exp(x), pi)
+MATH_NAMES = {name: getattr(math, name) for name in dir(math) if not name.startswith("_")}
+
+# The numeric builtins eval() used to provide; everything else of
+# builtins stays out of reach
+BUILTIN_NAMES = {"abs": abs, "min": min, "max": max, "round": round, "pow": pow}
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp,
+    ast.Call, ast.Name, ast.Attribute, ast.Constant, ast.Load,
+    ast.operator, ast.unaryop, ast.boolop, ast.cmpop,
+)
+
+
+def _validate(tree, variable):
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Unsupported syntax in f(x): {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id not in (variable, "math") \
+                and node.id not in MATH_NAMES and node.id not in BUILTIN_NAMES:
+            raise ValueError(f"Unknown name in f(x): {node.id}")
+        if isinstance(node, ast.Attribute):
+            if not (isinstance(node.value, ast.Name) and node.value.id == "math"
+                    and node.attr in MATH_NAMES):
+                raise ValueError(f"Unsupported attribute in f(x): {ast.unparse(node)}")
+        if isinstance(node, ast.Call) and node.keywords:
+            raise ValueError("Keyword arguments are not supported in f(x)")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float, complex)):
+            raise ValueError(f"Unsupported constant in f(x): {node.value!r}")
+
+
+def build_function(text, variable="x", namespace=None):
+    """
+    Parses and validates f(x) text once and returns it as a Python function.
+
+    The expression is compiled into a lambda, so calling the result costs
+    the same as calling hand-written code. namespace replaces the math
+    and builtin names (e.g. to evaluate the same text on other number
+    types).
+    """
+    try:
+        tree = ast.parse(text.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid f(x): {e.msg}") from None
+    _validate(tree, variable)
+
+    args = ast.arguments(posonlyargs=[], args=[ast.arg(arg=variable)], kwonlyargs=[],
+                         kw_defaults=[], defaults=[])
+    wrapper = ast.Expression(body=ast.Lambda(args=args, body=tree.body))
+    code = compile(ast.fix_missing_locations(wrapper), "<f(x)>", "eval")
+
+    if namespace is None:
+        namespace = dict(MATH_NAMES, math=math, **BUILTIN_NAMES)
+    return eval(code, {"__builtins__": {}, **namespace})
+
+
+@lru_cache(maxsize=256)
+def compile_expression(text, variable="x"):
+    """
+    Cached build_function: repeated solves of the same text reuse the
+    compiled function. Use compile_expression.cache_info() for statistics.
+    """
+    return build_function(text, variable)
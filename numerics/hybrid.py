@@ -0,0 +1,154 @@
+# hybrid.py
+# Safeguarded bracketing root finder: Newton / secant / inverse quadratic
+# interpolation steps with a bisection fallback (Brent's method + Newton)
+
+import math
+import sys
+
+from .monitor import CONVERGED, MAX_ITER, NON_FINITE
+
+STEP_TYPES = ("newton", "secant", "iqi", "bisection")
+
+_EPS = sys.float_info.epsilon
+
+
+def hybrid_method(f, a, b, tol=1e-12, max_iter=100, df=None):
+    """
+    Finds a root of f in [a, b], where f(a) and f(b) have opposite signs.
+
+    Every step keeps a sign change bracketed. The fast step is tried
+    first: Newton when a derivative is available, otherwise inverse
+    quadratic interpolation or secant. It is only accepted if it lands
+    well inside the bracket and shrinks faster than bisection would
+    (Brent's rules); otherwise the step is a bisection. Fast steps are
+    also kept close enough to the midpoint that the bracket never lags
+    bisection by more than two steps, so at most
+    ceil(log2((b - a) / tol)) + 2 steps are needed whatever f does,
+    and on smooth functions with simple roots convergence is superlinear.
+
+    df enables Newton steps: a callable f'(x), or True if f itself returns
+    (f(x), f'(x)) such as a compiled Newton program (f_df).
+
+    Returns a dict with:
+        'root', 'converged', 'iterations', 'bracket': final (lo, hi)
+        'evaluations': {'f': calls of f, 'df': evaluations of f'}
+        'steps': how many steps of each STEP_TYPES kind were taken
+        'reason' (numerics.monitor code), 'error_msg'
+    """
+    evaluations = {"f": 0, "df": 0}
+    steps = dict.fromkeys(STEP_TYPES, 0)
+    result = {
+        "root": None,
+        "converged": False,
+        "iterations": 0,
+        "bracket": None,
+        "evaluations": evaluations,
+        "steps": steps,
+        "reason": None,
+        "error_msg": None
+    }
+
+    # Returns f(x) and, when Newton steps are on, f'(x) (else None)
+    if df is True:
+        def evaluate(x):
+            evaluations["f"] += 1
+            evaluations["df"] += 1
+            fx, dfx = f(x)
+            return float(fx), float(dfx)
+    elif df is not None:
+        def evaluate(x):
+            evaluations["f"] += 1
+            evaluations["df"] += 1
+            return float(f(x)), float(df(x))
+    else:
+        def evaluate(x):
+            evaluations["f"] += 1
+            return float(f(x)), None
+
+    a, b = float(a), float(b)
+    fa, dfa = evaluate(a)
+    fb, dfb = evaluate(b)
+    if not (math.isfinite(fa) and math.isfinite(fb)):
+        result.update(reason=NON_FINITE, error_msg="f is not finite at the bracket ends")
+        return result
+    if fa == 0 or fb == 0:
+        root = a if fa == 0 else b
+        result.update(root=root, converged=True, bracket=(root, root), reason=CONVERGED)
+        return result
+    if (fa > 0) == (fb > 0):
+        raise ValueError("f(a) and f(b) must have opposite signs")
+
+    # b is the best estimate, c the other end of the bracket [b, c] and a
+    # the previous b. d is the last step and e the one before it.
+    c, fc, dfc = a, fa, dfa
+    d = e = b - a
+    # Worst-case budget: two steps more than bisection needs (see below)
+    n_max = math.ceil(math.log2(abs(b - a) / tol)) + 2 if tol > 0 else None
+
+    for i in range(1, max_iter + 1):
+        result["iterations"] = i
+        if (fb > 0) == (fc > 0):
+            c, fc, dfc = a, fa, dfa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+            dfa, dfb, dfc = dfb, dfc, dfb
+
+        tol1 = 2 * _EPS * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0:
+            result.update(root=b, converged=True, reason=CONVERGED)
+            break
+
+        kind = "bisection"
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            # A fast step must land inside the bracket, at most 3/4 of the
+            # way to c, and be less than half the step before last
+            limit = min(3 * abs(xm) - tol1, abs(e))
+            if dfb:
+                p = -fb / dfb
+                if p * xm > 0 and 2 * abs(p) < limit:
+                    kind, step = "newton", p
+            if kind == "bisection":
+                s = fb / fa
+                if a == c:
+                    p, q = 2 * xm * s, 1 - s
+                    interpolation = "secant"
+                else:
+                    q, r = fa / fc, fb / fc
+                    p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                    interpolation = "iqi"
+                if p > 0:
+                    q = -q
+                p = abs(p)
+                if 2 * p < limit * abs(q):
+                    kind, step = interpolation, p / q
+
+        steps[kind] += 1
+        if kind == "bisection":
+            d = e = xm
+        else:
+            e, d = d, step
+            if n_max is not None:
+                # Brent's rules alone can crawl (multiple roots: ~3x the
+                # bisection count). As in the ITP method, pull the new point
+                # towards the midpoint so the bracket half-width after step
+                # i is at most tol/2 * 2**(n_max - i), whichever side the
+                # root turns out to be on.
+                delta = max(tol * 2.0 ** (n_max - i) - abs(xm), 0.0)
+                if abs(d - xm) > delta:
+                    d = xm + math.copysign(delta, d - xm)
+
+        a, fa, dfa = b, fb, dfb
+        b += d if abs(d) > tol1 else math.copysign(tol1, xm)
+        fb, dfb = evaluate(b)
+        if not math.isfinite(fb):
+            result.update(root=b, reason=NON_FINITE, error_msg=f"f is not finite at x = {b}")
+            break
+    else:
+        result.update(reason=MAX_ITER, error_msg="Method did not converge")
+
+    result["bracket"] = (min(b, c), max(b, c))
+    return result
@@ -0,0 +1,543 @@
+# jacobi.py
+# Jacobi iteration for A x = b
+
+import os
+import sys
+from itertools import repeat
+
+import numpy as np
+
+from .monitor import BREAKDOWN, CONVERGED, DIVERGED, MAX_ITER, NON_FINITE, ConvergenceMonitor
+
+
+def _sparse_module(A):
+    """
+    scipy.sparse if A is a sparse matrix, else None. A caller passing a
+    sparse matrix has already imported scipy, so it is never loaded here.
+    """
+    sparse = sys.modules.get("scipy.sparse")
+    if sparse is not None and sparse.issparse(A):
+        return sparse
+    return None
+
+
+def _split_diagonal(A):
+    """
+    Split A into its diagonal D and the off-diagonal remainder R = A - D.
+    Returns None if a diagonal entry is zero.
+
+    scipy.sparse matrices stay sparse: R is returned in CSR format so
+    memory scales with the number of nonzeros.
+    """
+    sparse = _sparse_module(A)
+    if sparse is not None:
+        A = sparse.csr_matrix(A, dtype=float)
+        D = A.diagonal()
+        if np.any(D == 0):
+            return None
+        R = A - sparse.diags(D, format="csr")
+        R.eliminate_zeros()
+        return D, R
+
+    A = np.asarray(A, dtype=float)
+    D = A.diagonal().copy()
+    if np.any(D == 0):
+        return None
+    R = A.copy()
+    np.fill_diagonal(R, 0.0)
+    return D, R
+
+
+def jacobi_preconditioner(A):
+    """
+    The Jacobi diagonal scaling r -> D^-1 r as a callable, for use as the
+    preconditioner M of the solvers in numerics.krylov. A may be dense,
+    scipy.sparse, or already the diagonal as a 1-D array.
+    """
+    if _sparse_module(A) is not None:
+        D = A.diagonal()
+    else:
+        A = np.asarray(A, dtype=float)
+        D = A if A.ndim == 1 else A.diagonal()
+    if np.any(D == 0):
+        raise ValueError("Zero on the diagonal")
+    inv_D = 1 / np.asarray(D, dtype=float)
+    return lambda r: inv_D * r
+
+
+def _matvec(R, x, out):
+    if isinstance(R, np.ndarray):
+        return np.dot(R, x, out=out)
+    out[...] = R @ x
+    return out
+
+
+def jacobi_method(A, b, x0, tol, max_iter):
+    """
+    Returns the solution, or None if A has a zero on its diagonal or the
+    iteration stops without converging (max_iter sweeps, or earlier when
+    a ConvergenceMonitor sees it diverge, stagnate or turn non-finite).
+    """
+    split = _split_diagonal(A)
+    if split is None:
+        return None
+    D, R = split
+    abs_D = np.abs(D)
+
+    b = np.asarray(b, dtype=float)
+    x = np.array(x0, dtype=float)
+    x_new = np.empty_like(x)
+    work = np.empty_like(x)
+    monitor = ConvergenceMonitor(tol, max_iter)
+
+    for _ in range(max_iter):
+        # x_new = (b - R @ x) / D
+        _matvec(R, x, work)
+        np.subtract(b, work, out=work)
+        np.divide(work, D, out=x_new)
+
+        np.subtract(x_new, x, out=work)
+        step = np.abs(work, out=work).max()
+        # D (x_new - x) = b - A x: the residual of x comes for free
+        residual = np.multiply(work, abs_D, out=work).max()
+        if monitor.update(step, residual, scale=lambda: np.abs(x_new).max()):
+            return x_new if monitor.converged else None
+
+        x, x_new = x_new, x
+
+    return None
+
+
+def jacobi_method_batched(A, b, x0, tol, max_iter):
+    """
+    Jacobi iteration for many right-hand sides at once.
+
+    b and x0 are (n, k) matrices, one column per system. All active columns
+    are advanced together with one matrix-matrix product per sweep, and a
+    column is dropped from the working set as soon as it converges, turns
+    non-finite or diverges (by the rules of ConvergenceMonitor, applied
+    to each column's step and residual).
+
+    Returns None if A has a zero on its diagonal, otherwise a dict with:
+        'x': (n, k) solutions (last iterate for unconverged columns)
+        'iterations': sweeps performed for each column
+        'converged': True/False for each column
+        'reason': why each column stopped, a numerics.monitor reason code
+    """
+    split = _split_diagonal(A)
+    if split is None:
+        return None
+    D, R = split
+    D = D[:, None]
+    abs_D = np.abs(D)
+    rules = ConvergenceMonitor(tol, max_iter)
+
+    B = np.asarray(b, dtype=float)
+    X = np.array(x0, dtype=float)
+    k = B.shape[1]
+    iterations = np.zeros(k, dtype=int)
+    reason = np.full(k, MAX_ITER, dtype=object)
+
+    # Working set: columns of X, B still iterating, their indices and
+    # their ConvergenceMonitor state
+    active = np.arange(k)
+    Xa = X.copy()
+    Ba = B
+    Xa_new = np.empty_like(Xa)
+    work = np.empty_like(Xa)
+    best_step = np.full(k, np.inf)
+    best_residual = np.full(k, np.inf)
+    since_best = np.zeros(k, dtype=int)
+    grown = np.zeros(k, dtype=bool)
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        for _ in range(max_iter):
+            if active.size == 0:
+                break
+
+            _matvec(R, Xa, work)
+            np.subtract(Ba, work, out=work)
+            np.divide(work, D, out=Xa_new)
+
+            np.subtract(Xa_new, Xa, out=work)
+            step = np.abs(work, out=work).max(axis=0)
+            # D (x_new - x) = b - A x, as in jacobi_method
+            residual = np.multiply(work, abs_D, out=work).max(axis=0)
+            iterations[active] += 1
+            Xa, Xa_new = Xa_new, Xa
+
+            # max() passes NaN through, so a NaN anywhere in a column shows
+            non_finite = ~(np.isfinite(step) & np.isfinite(residual))
+            done = ~non_finite & (step < tol)
+            grown = (step > rules.divergence * best_step) | \
+                (residual > rules.divergence * best_residual)
+            improved = (step < best_step) | (residual < best_residual)
+            np.fmin(best_step, step, out=best_step)
+            np.fmin(best_residual, residual, out=best_residual)
+            since_best = np.where(improved, 0, since_best + 1)
+            diverged = grown & (since_best >= rules.patience) & ~done
+
+            stop = non_finite | done | diverged
+            if stop.any():
+                X[:, active] = Xa
+                reason[active[done]] = CONVERGED
+                reason[active[diverged]] = DIVERGED
+                reason[active[non_finite]] = NON_FINITE
+                keep = ~stop
+                active = active[keep]
+                Xa = np.ascontiguousarray(Xa[:, keep])
+                Ba = np.ascontiguousarray(Ba[:, keep])
+                Xa_new = np.empty_like(Xa)
+                work = np.empty_like(Xa)
+                best_step = best_step[keep]
+                best_residual = best_residual[keep]
+                since_best = since_best[keep]
+                grown = grown[keep]
+
+    X[:, active] = Xa
+    # Still growing when max_iter ran out
+    reason[active[grown]] = DIVERGED
+
+    return {
+        "x": X,
+        "iterations": iterations,
+        "converged": reason == CONVERGED,
+        "reason": reason
+    }
+
+
+# ==================================================
+# Parallel Block Jacobi
+# ==================================================
+
+def _row_blocks(n, parts):
+    bounds = np.linspace(0, n, parts + 1).astype(int)
+    return [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+
+def parallel_jacobi_method(A, b, x0, tol, max_iter, workers=None):
+    """
+    jacobi_method with the rows split into one block per worker, each
+    block updated on a thread pool. NumPy and scipy.sparse release the
+    GIL inside the matrix-vector products, so the blocks run on separate
+    cores while sharing A, x and x_new without copies.
+
+    workers defaults to os.cpu_count(). Returns the same as jacobi_method.
+    """
+    # Imported here: concurrent.futures pulls in logging (~15 ms)
+    from concurrent.futures import ThreadPoolExecutor
+
+    split = _split_diagonal(A)
+    if split is None:
+        return None
+    D, R = split
+    abs_D = np.abs(D)
+
+    b = np.asarray(b, dtype=float)
+    x = np.array(x0, dtype=float)
+    x_new = np.empty_like(x)
+    work = np.empty_like(x)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # Dense row slices are views; sparse ones are CSR matrices of the
+    # block's rows, built once
+    blocks = [(rows, R[rows]) for rows in _row_blocks(len(x), max(1, int(workers)))]
+
+    def sweep(block, x, x_new):
+        rows, R_rows = block
+        w = work[rows]
+        _matvec(R_rows, x, w)
+        np.subtract(b[rows], w, out=w)
+        np.divide(w, D[rows], out=x_new[rows])
+        np.subtract(x_new[rows], x[rows], out=w)
+        step = np.abs(w, out=w).max()
+        residual = np.multiply(w, abs_D[rows], out=w).max()
+        return step, residual
+
+    monitor = ConvergenceMonitor(tol, max_iter)
+    with ThreadPoolExecutor(max_workers=len(blocks)) as pool:
+        for _ in range(max_iter):
+            steps, residuals = zip(*pool.map(sweep, blocks, repeat(x), repeat(x_new)))
+            if monitor.update(max(steps), max(residuals), scale=lambda: np.abs(x_new).max()):
+                return x_new if monitor.converged else None
+
+            x, x_new = x_new, x
+
+    return None
+
+
+# ==================================================
+# Stationary Iterations: Jacobi, damped Jacobi, Gauss–Seidel, SOR
+# ==================================================
+
+STATIONARY_METHODS = ("jacobi", "damped-jacobi", "gauss-seidel", "sor")
+
+
+def estimate_spectral_radius(D, R, iters=30, seed=0):
+    """
+    Estimate of the spectral radius of the Jacobi iteration matrix
+    D^-1 R; Jacobi converges for every x0 iff it is < 1.
+
+    Runs iters Arnoldi steps (iters matrix-vector products, like power
+    iteration) and returns the largest Ritz value magnitude. Clustered
+    spectra such as Poisson's are resolved far better than by power
+    iteration; for strongly non-normal matrices the estimate errs high.
+    """
+    n = len(D)
+    iters = min(iters, n)
+    V = np.empty((iters + 1, n))
+    H = np.zeros((iters + 1, iters))
+    v = np.random.default_rng(seed).standard_normal(n)
+    V[0] = v / np.linalg.norm(v)
+    for j in range(iters):
+        w = (R @ V[j]) / D
+        if not np.all(np.isfinite(w)):
+            return float("inf")
+        # Gram-Schmidt against the basis, twice for orthogonality
+        for _ in range(2):
+            h = V[:j + 1] @ w
+            w -= h @ V[:j + 1]
+            H[:j + 1, j] += h
+        H[j + 1, j] = norm = np.linalg.norm(w)
+        if norm <= 1e-12 * max(1.0, np.abs(H[:j + 1, j]).max()):
+            # Invariant subspace found: its Ritz values are exact
+            iters = j + 1
+            break
+        V[j + 1] = w / norm
+    return float(np.abs(np.linalg.eigvals(H[:iters, :iters])).max())
+
+
+def optimal_sor_omega(rho_jacobi):
+    """
+    Young's optimal SOR relaxation factor from the Jacobi spectral radius
+    (exact for consistently ordered matrices, a good guess otherwise).
+    """
+    if not rho_jacobi < 1:
+        return 1.0
+    return float(2 / (1 + np.sqrt(1 - rho_jacobi ** 2)))
+
+
+def diagonal_dominance(A, D=None, R=None):
+    """
+    Classifies A as "strict" (|a_ii| > sum_j |a_ij| on every row),
+    "irreducible" (>= on every row, > on at least one, and the graph of A
+    strongly connected) or "none". Jacobi and Gauss–Seidel converge for
+    both "strict" and "irreducible". D, R from _split_diagonal may be
+    passed to skip the split.
+    """
+    if D is None:
+        split = _split_diagonal(A)
+        if split is None:
+            return "none"
+        D, R = split
+
+    diag = np.abs(D)
+    sparse = _sparse_module(R)
+    if sparse is not None:
+        off = np.asarray(abs(R).sum(axis=1)).ravel()
+    else:
+        off = np.abs(R).sum(axis=1)
+
+    if np.all(diag > off):
+        return "strict"
+    if not (np.all(diag >= off) and np.any(diag > off)):
+        return "none"
+
+    try:
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import connected_components
+    except ImportError:
+        return "none"
+    # R has the same off-diagonal pattern as A
+    count, _ = connected_components(csr_matrix(R), directed=True, connection="strong")
+    return "irreducible" if count == 1 else "none"
+
+
+def jacobi_diagnostics(A, b=None, x0=None, tol=None, iters=30):
+    """
+    Cheap analysis of A before running Jacobi: diagonal dominance (one
+    pass over A) and the spectral radius rho of D^-1 R (iters
+    matrix-vector products, see estimate_spectral_radius). With b, x0 and tol it also predicts the
+    number of sweeps, from the first step and a decay of rho per sweep.
+
+    Returns a dict with:
+        'dominance': "strict", "irreducible" or "none"
+        'spectral_radius': estimate of rho (inf if A has a zero diagonal)
+        'converges': whether Jacobi converges for every x0
+        'predicted_iterations': estimated sweeps to reach tol, or None
+        'error_msg': why Jacobi cannot be used, or None
+    """
+    return _diagnose(A, _split_diagonal(A), b, x0, tol, iters)
+
+
+def _diagnose(A, split, b, x0, tol, iters):
+    result = {
+        "dominance": "none",
+        "spectral_radius": float("inf"),
+        "converges": False,
+        "predicted_iterations": None,
+        "error_msg": None
+    }
+    if split is None:
+        result["error_msg"] = "Zero on the diagonal"
+        return result
+    D, R = split
+
+    result["dominance"] = dominance = diagonal_dominance(A, D, R)
+    result["spectral_radius"] = rho = estimate_spectral_radius(D, R, iters)
+    # Dominance is a proof; the estimate decides only without one
+    result["converges"] = converges = dominance != "none" or rho < 1
+    if not converges:
+        result["error_msg"] = f"Jacobi cannot converge: spectral radius ~ {rho:.3g} >= 1"
+        return result
+
+    if b is not None and x0 is not None and tol is not None:
+        x0 = np.asarray(x0, dtype=float)
+        step = np.abs((np.asarray(b, dtype=float) - R @ x0) / D - x0).max()
+        if step < tol:
+            result["predicted_iterations"] = 1
+        elif 0 < rho < 1:
+            # step_k ~ step * rho^(k - 1) < tol
+            result["predicted_iterations"] = 1 + int(np.ceil(np.log(tol / step) / np.log(rho)))
+        elif rho == 0:
+            result["predicted_iterations"] = 2
+    return result
+
+
+def _sor_splitting(A, D, omega):
+    """
+    Returns (solve, N) for the SOR sweep
+        (D + omega L) x_new = omega b - N x,   N = omega U + (omega - 1) D
+    where L and U are the strict lower and upper triangles of A and solve
+    applies (D + omega L)^-1. omega = 1 gives Gauss–Seidel.
+    """
+    sparse = _sparse_module(A)
+    if sparse is not None:
+        from scipy.sparse.linalg import spsolve_triangular
+
+        A = sparse.csr_matrix(A, dtype=float)
+        diag = sparse.diags(D, format="csr")
+        M = (sparse.tril(A, k=-1) * omega + diag).tocsr()
+        N = (sparse.triu(A, k=1) * omega + diag * (omega - 1)).tocsr()
+        return (lambda rhs: spsolve_triangular(M, rhs, lower=True)), N
+
+    A = np.asarray(A, dtype=float)
+    M = np.tril(A, -1) * omega + np.diag(D)
+    N = np.triu(A, 1) * omega + np.diag(D * (omega - 1))
+    try:
+        from scipy.linalg import solve_triangular
+    except ImportError:
+        def solve(rhs):
+            # Forward substitution, one row at a time
+            x = np.empty_like(rhs)
+            for i in range(len(rhs)):
+                x[i] = (rhs[i] - M[i, :i] @ x[:i]) / M[i, i]
+            return x
+        return solve, N
+    return (lambda rhs: solve_triangular(M, rhs, lower=True, check_finite=False)), N
+
+
+def stationary_method(A, b, x0, tol, max_iter, method="gauss-seidel", omega=None,
+                      precheck=False):
+    """
+    Solves A x = b with a stationary iteration, stopping when the largest
+    change in x is below tol (the same test as jacobi_method).
+
+    method is one of STATIONARY_METHODS. omega is the relaxation factor of
+    "damped-jacobi" (default 2/3) and "sor" (default: Young's optimal
+    omega from an estimate of the Jacobi spectral radius). Dense and
+    scipy.sparse A are supported.
+
+    precheck=True runs jacobi_diagnostics first and adds its dict as
+    'diagnostics'; plain Jacobi is then rejected without iterating when it
+    cannot converge.
+
+    Returns a dict with:
+        'x': last iterate (None if A has a zero on its diagonal or the
+             precheck rejected the system)
+        'converged', 'iterations', 'method', 'omega', 'error_msg'
+        'reason': why it stopped, a numerics.monitor reason code
+    """
+    if method not in STATIONARY_METHODS:
+        raise ValueError(f"Unknown method {method!r}, expected one of {STATIONARY_METHODS}")
+
+    result = {
+        "x": None,
+        "converged": False,
+        "iterations": 0,
+        "method": method,
+        "omega": omega,
+        "error_msg": None,
+        "reason": None
+    }
+
+    split = _split_diagonal(A)
+    rho = None
+    if precheck:
+        diagnostics = result["diagnostics"] = _diagnose(A, split, b, x0, tol, 30)
+        rho = diagnostics["spectral_radius"]
+        if method == "jacobi" and not diagnostics["converges"]:
+            result["error_msg"] = diagnostics["error_msg"]
+            result["reason"] = DIVERGED if split is not None else BREAKDOWN
+            return result
+    if split is None:
+        result["error_msg"] = "Zero on the diagonal"
+        result["reason"] = BREAKDOWN
+        return result
+    D, R = split
+
+    if method in ("jacobi", "gauss-seidel"):
+        omega = 1.0
+    elif omega is None:
+        if method == "damped-jacobi":
+            omega = 2 / 3
+        else:
+            omega = optimal_sor_omega(estimate_spectral_radius(D, R) if rho is None else rho)
+    result["omega"] = omega
+
+    b = np.asarray(b, dtype=float)
+    x = np.array(x0, dtype=float)
+
+    if method in ("jacobi", "damped-jacobi"):
+        work = np.empty_like(x)
+
+        def sweep(x):
+            # x + omega * ((b - R x) / D - x)
+            _matvec(R, x, work)
+            np.subtract(b, work, out=work)
+            np.divide(work, D, out=work)
+            if omega != 1:
+                np.subtract(work, x, out=work)
+                np.multiply(work, omega, out=work)
+                np.add(work, x, out=work)
+            return work.copy()
+    else:
+        solve, N = _sor_splitting(A, D, omega)
+        omega_b = omega * b
+
+        def sweep(x):
+            return solve(omega_b - N @ x)
+
+    monitor = ConvergenceMonitor(tol, max_iter)
+    delta = np.empty_like(x)
+    abs_D = np.abs(D) / omega
+    for k in range(1, max_iter + 1):
+        x_new = sweep(x)
+        np.subtract(x_new, x, out=delta)
+        step = np.abs(delta, out=delta).max()
+        residual = None
+        if method in ("jacobi", "damped-jacobi"):
+            # D (x_new - x) / omega = b - A x, for free
+            residual = np.multiply(delta, abs_D, out=delta).max()
+        x = x_new
+        result["iterations"] = k
+
+        if monitor.update(step, residual, scale=lambda: np.abs(x).max()):
+            break
+
+    result["converged"] = monitor.converged
+    result["reason"] = monitor.reason
+    result["error_msg"] = monitor.message
+    result["x"] = x
+    return result
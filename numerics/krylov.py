@@ -0,0 +1,230 @@
+# krylov.py
+# Krylov subspace solvers for A x = b: CG, restarted GMRES and BiCGSTAB
+#
+# A may be a dense array, a scipy.sparse matrix or a LinearOperator, or a
+# plain function v -> A v (matrix-free). M is an optional preconditioner
+# r -> M^-1 r, e.g. numerics.jacobi.jacobi_preconditioner(A).
+#
+# Every solver returns a dict with:
+#     'x', 'converged', 'iterations', 'residuals' (history of ||b - A x||,
+#     starting with the initial residual) and 'error_msg'
+# and stops when ||b - A x|| <= tol * ||b||.
+
+import numpy as np
+
+
+def as_operator(A):
+    if callable(A) and not hasattr(A, "shape"):
+        return A
+    return lambda v: A @ v
+
+
+def _start(A, b, x0, M):
+    A = as_operator(A)
+    M = M if M is not None else (lambda r: r)
+    b = np.asarray(b, dtype=float)
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=float)
+    r = b - A(x)
+    b_norm = np.linalg.norm(b) or 1.0
+    result = {
+        "x": x,
+        "converged": False,
+        "iterations": 0,
+        "residuals": [float(np.linalg.norm(r))],
+        "error_msg": None
+    }
+    return A, M, b, x, r, b_norm, result
+
+
+def _confirmed(A, b, x, residuals, tol, b_norm):
+    """
+    The recurrences of CG and BiCGSTAB update r cheaply but can drift away
+    from b - A x. Recomputes the true residual; returns it if x has not
+    actually converged, else None.
+    """
+    r = b - A(x)
+    residuals[-1] = float(np.linalg.norm(r))
+    return r if residuals[-1] > tol * b_norm else None
+
+
+def conjugate_gradient(A, b, x0=None, tol=1e-8, max_iter=1000, M=None):
+    """
+    Preconditioned conjugate gradient, for symmetric positive definite A
+    (and a symmetric positive definite preconditioner).
+    """
+    A, M, b, x, r, b_norm, result = _start(A, b, x0, M)
+    residuals = result["residuals"]
+
+    z = M(r)
+    p = z.copy()
+    rz = r @ z
+
+    for k in range(1, max_iter + 1):
+        if residuals[-1] <= tol * b_norm:
+            r = _confirmed(A, b, x, residuals, tol, b_norm)
+            if r is None:
+                break
+            z = M(r)
+            p = z.copy()
+            rz = r @ z
+        Ap = A(p)
+        pAp = p @ Ap
+        if pAp <= 0:
+            result["error_msg"] = "Matrix is not positive definite"
+            break
+
+        alpha = rz / pAp
+        x += alpha * p
+        r -= alpha * Ap
+        residuals.append(float(np.linalg.norm(r)))
+        result["iterations"] = k
+
+        z = M(r)
+        rz_new = r @ z
+        p *= rz_new / rz
+        p += z
+        rz = rz_new
+    else:
+        _confirmed(A, b, x, residuals, tol, b_norm)
+
+    result["converged"] = residuals[-1] <= tol * b_norm
+    if not result["converged"] and result["error_msg"] is None:
+        result["error_msg"] = "Method did not converge"
+    return result
+
+
+def gmres(A, b, x0=None, tol=1e-8, max_iter=1000, restart=30, M=None):
+    """
+    Restarted GMRES(restart) with right preconditioning, so the residuals
+    reported are those of the original system. Works for any nonsingular A.
+    """
+    A, M, b, x, r, b_norm, result = _start(A, b, x0, M)
+    residuals = result["residuals"]
+    n = len(b)
+    total = 0
+
+    while total < max_iter and residuals[-1] > tol * b_norm:
+        beta = np.linalg.norm(r)
+        m = min(restart, max_iter - total)
+        V = np.zeros((m + 1, n))
+        H = np.zeros((m + 1, m))
+        cs = np.zeros(m)
+        sn = np.zeros(m)
+        g = np.zeros(m + 1)
+        g[0] = beta
+        V[0] = r / beta
+
+        k = 0
+        for j in range(m):
+            w = A(M(V[j]))
+            # Classical Gram–Schmidt with one reorthogonalization pass
+            h = V[:j + 1] @ w
+            w -= V[:j + 1].T @ h
+            dh = V[:j + 1] @ w
+            w -= V[:j + 1].T @ dh
+            H[:j + 1, j] = h + dh
+            H[j + 1, j] = np.linalg.norm(w)
+            if H[j + 1, j] > 0:
+                V[j + 1] = w / H[j + 1, j]
+
+            # Apply the previous Givens rotations, then eliminate H[j+1, j]
+            for i in range(j):
+                H[i, j], H[i + 1, j] = (cs[i] * H[i, j] + sn[i] * H[i + 1, j],
+                                        -sn[i] * H[i, j] + cs[i] * H[i + 1, j])
+            denom = np.hypot(H[j, j], H[j + 1, j])
+            if denom == 0:
+                result["error_msg"] = "GMRES breakdown"
+                break
+            cs[j] = H[j, j] / denom
+            sn[j] = H[j + 1, j] / denom
+            H[j, j] = denom
+            H[j + 1, j] = 0.0
+            g[j + 1] = -sn[j] * g[j]
+            g[j] *= cs[j]
+
+            k = j + 1
+            total += 1
+            residuals.append(float(abs(g[j + 1])))
+            if abs(g[j + 1]) <= tol * b_norm:
+                break
+
+        if k == 0:
+            break
+        # Back substitution for the upper triangular least-squares system
+        y = np.zeros(k)
+        for i in range(k - 1, -1, -1):
+            y[i] = (g[i] - H[i, i + 1:k] @ y[i + 1:]) / H[i, i]
+        x += M(V[:k].T @ y)
+        r = b - A(x)
+        residuals[-1] = float(np.linalg.norm(r))
+        if result["error_msg"] is not None:
+            break
+
+    result["iterations"] = total
+    result["converged"] = residuals[-1] <= tol * b_norm
+    if not result["converged"] and result["error_msg"] is None:
+        result["error_msg"] = "Method did not converge"
+    return result
+
+
+def bicgstab(A, b, x0=None, tol=1e-8, max_iter=1000, M=None):
+    """
+    Preconditioned BiCGSTAB for general (non-symmetric) A.
+    """
+    A, M, b, x, r, b_norm, result = _start(A, b, x0, M)
+    residuals = result["residuals"]
+
+    rho = alpha = omega = 1.0
+    v = np.zeros_like(b)
+    p = np.zeros_like(b)
+    restart = True
+
+    for k in range(1, max_iter + 1):
+        if residuals[-1] <= tol * b_norm:
+            r = _confirmed(A, b, x, residuals, tol, b_norm)
+            if r is None:
+                break
+            restart = True
+
+        if restart:
+            r_hat = r.copy()
+            rho_new = r_hat @ r
+            p = r.copy()
+            restart = False
+        else:
+            rho_new = r_hat @ r
+            if rho_new == 0:
+                result["error_msg"] = "BiCGSTAB breakdown (rho = 0)"
+                break
+            p = r + (rho_new / rho) * (alpha / omega) * (p - omega * v)
+
+        p_hat = M(p)
+        v = A(p_hat)
+        alpha = rho_new / (r_hat @ v)
+        s = r - alpha * v
+        rho = rho_new
+        result["iterations"] = k
+
+        if np.linalg.norm(s) <= tol * b_norm:
+            x += alpha * p_hat
+            r = s
+            residuals.append(float(np.linalg.norm(s)))
+            continue
+
+        s_hat = M(s)
+        t = A(s_hat)
+        tt = t @ t
+        omega = (t @ s) / tt if tt > 0 else 0.0
+        x += alpha * p_hat + omega * s_hat
+        r = s - omega * t
+        residuals.append(float(np.linalg.norm(r)))
+        if omega == 0:
+            result["error_msg"] = "BiCGSTAB breakdown (omega = 0)"
+            break
+    else:
+        _confirmed(A, b, x, residuals, tol, b_norm)
+
+    result["converged"] = residuals[-1] <= tol * b_norm
+    if not result["converged"] and result["error_msg"] is None:
+        result["error_msg"] = "Method did not converge"
+    return result
@@ -0,0 +1,1270 @@
+# least_squares.py
+# Numerical Computing Project
+# Linear Least Squares Regression & Linearization
+# Based strictly on lecture PDF formulas
+
+import multiprocessing
+import sys
+import threading
+import time
+from collections import deque
+from math import log, exp
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+# ==================================================
+# Core Least Squares Utilities
+# ==================================================
+
+def compute_summations(X: List[float], Y: List[float]) -> Dict:
+    n = len(X)
+    return {
+        "n": n,
+        "sum_x": sum(X),
+        "sum_y": sum(Y),
+        "sum_x2": sum(x ** 2 for x in X),
+        "sum_xy": sum(x * y for x, y in zip(X, Y))
+    }
+
+
+def solve_normal_equations(sums: Dict) -> Dict:
+    n = sums["n"]
+    Sx = sums["sum_x"]
+    Sy = sums["sum_y"]
+    Sx2 = sums["sum_x2"]
+    Sxy = sums["sum_xy"]
+
+    denominator = n * Sx2 - Sx ** 2
+    if denominator == 0:
+        raise ValueError("Normal equations are singular.")
+
+    a = (n * Sxy - Sx * Sy) / denominator
+    b = (Sy * Sx2 - Sx * Sxy) / denominator
+
+    return {"a": a, "b": b}
+
+
+# ==================================================
+# Design Matrix Least Squares
+# ==================================================
+
+def polynomial_design(x, degree: int = 1) -> np.ndarray:
+    """
+    Design matrix with columns x^degree, ..., x, 1, so coefficients come
+    out highest power first (a, b for y = ax + b).
+    """
+    if degree < 0:
+        raise ValueError("Polynomial degree must be at least 0.")
+    x = np.asarray(x, dtype=float).ravel()
+    # Column by column in Fortran order, as QRAccumulator copies it
+    A = np.empty((x.size, degree + 1), order="F")
+    A[:, degree] = 1.0
+    for power in range(degree - 1, -1, -1):
+        np.multiply(A[:, power + 1], x, out=A[:, power])
+    return A
+
+
+def multivariate_design(X, intercept: bool = True) -> np.ndarray:
+    """
+    Design matrix for y = c1 x1 + ... + ck xk (+ c0): one regressor per
+    column of X, and a final column of ones for the intercept.
+    """
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    if intercept:
+        X = np.column_stack([X, np.ones(len(X))])
+    return X
+
+
+class QRAccumulator:
+    """
+    Least squares for a design matrix fed in row blocks (TSQR).
+
+    Rows are taken block_rows at a time: [A | y] is stacked under the
+    current triangular factor of all rows so far and factored again with
+    Householder QR, so memory is one (p + 1) x (p + 1) matrix for p
+    columns however many rows arrive, and accumulators of separate
+    streams combine with merge(). Unlike the normal equations, which
+    square the condition number (n*Sx2 - Sx**2 cancels for large or
+    offset x), QR keeps it as is.
+    """
+
+    # Rows per factorization: small enough for the block to stay in cache
+    block_rows = 16384
+
+    def __init__(self, columns: int):
+        self.columns = columns
+        self.n = 0
+        self._R = np.zeros((0, columns + 1))
+
+    def update(self, A, y) -> "QRAccumulator":
+        A = np.asarray(A, dtype=float)
+        y = np.asarray(y, dtype=float).ravel()
+        if A.ndim == 1:
+            A = A[:, None]
+        if A.shape != (y.size, self.columns):
+            raise ValueError(f"The design matrix must have one row per y value and {self.columns} columns.")
+        self.n += y.size
+        for start in range(0, y.size, self.block_rows):
+            stop = start + self.block_rows
+            self._fold(A[start:stop], y[start:stop])
+        return self
+
+    def merge(self, other: "QRAccumulator") -> "QRAccumulator":
+        self.n += other.n
+        self._fold(other._R[:, :-1], other._R[:, -1])
+        return self
+
+    def _fold(self, A: np.ndarray, y: np.ndarray):
+        # R of [R_old; A y] is R of every row seen, up to row signs.
+        # LAPACK works on columns: a Fortran-ordered block saves a copy.
+        k = self._R.shape[0]
+        block = np.empty((k + len(y), self.columns + 1), order="F")
+        block[:k] = self._R
+        block[k:, :-1] = A
+        block[k:, -1] = y
+        self._R = np.linalg.qr(block, mode="r")
+
+    def solve(self) -> np.ndarray:
+        """Coefficients minimizing |A c - y|; ValueError if A is rank deficient."""
+        p = self.columns
+        R = self._R
+        if R.shape[0] < p or not np.all(np.isfinite(R)):
+            raise ValueError("Least squares system is singular.")
+        R, z = R[:p, :p], R[:p, p]
+        # A column that is (nearly) a combination of the ones before it
+        # leaves a diagonal entry at rounding level of its norm
+        norms = np.sqrt(np.sum(R * R, axis=0))
+        if not np.all(np.abs(np.diag(R)) > 10 * p * sys.float_info.epsilon * norms):
+            raise ValueError("Least squares system is singular.")
+        return np.linalg.solve(R, z)
+
+    @property
+    def error(self) -> float:
+        """Sum of squared residuals of the solution: the last diagonal entry of R, squared."""
+        p = self.columns
+        return float(self._R[p, p] ** 2) if self._R.shape[0] > p else 0.0
+
+
+def solve_least_squares(A, y) -> Dict:
+    """
+    Solves min |A c - y| by QR for a design matrix A (see polynomial_design
+    and multivariate_design). Returns 'coefficients' and 'error', the sum
+    of squared residuals.
+    """
+    A = np.asarray(A, dtype=float)
+    acc = QRAccumulator(1 if A.ndim == 1 else A.shape[1]).update(A, y)
+    return {"coefficients": acc.solve(), "error": acc.error}
+
+
+# Points per block of fit_line's centred pass: the centred copies of a
+# block stay in cache instead of being two whole-array temporaries
+LINE_BLOCK = 32_768
+
+
+def fit_line(X, Y) -> Tuple[float, float]:
+    """
+    a, b of the line Y = aX + b: solve_least_squares on polynomial_design(X, 1)
+    with the QR done in closed form. Orthogonalizing X against the ones
+    column centres it, which costs a few array passes instead of a LAPACK
+    call on many small fits.
+    """
+    a, b, _ = fit_line_sums(X, Y)
+    return a, b
+
+
+def fit_line_sums(X, Y) -> Tuple[float, float, Dict]:
+    """
+    fit_line, plus the array_summations of X and Y. sum_x and sum_y are
+    taken in the pass that finds the means, and sum_x2 and sum_xy follow
+    from the centred moments, so the data is read twice in all.
+    """
+    X = np.asarray(X, dtype=float).ravel()
+    Y = np.asarray(Y, dtype=float).ravel()
+    if X.shape != Y.shape:
+        raise ValueError("x and y must have the same number of values.")
+    n = X.size
+    if n == 0:
+        raise ValueError("Least squares system is singular.")
+    sum_x, sum_y = float(X.sum()), float(Y.sum())
+    mean_x, mean_y = sum_x / n, sum_y / n
+    Sxx = Sxy = 0.0
+    Xc, Yc = np.empty(min(n, LINE_BLOCK)), np.empty(min(n, LINE_BLOCK))
+    for start in range(0, n, LINE_BLOCK):
+        k = min(LINE_BLOCK, n - start)
+        np.subtract(X[start:start + k], mean_x, out=Xc[:k])
+        np.subtract(Y[start:start + k], mean_y, out=Yc[:k])
+        Sxx += float(Xc[:k].dot(Xc[:k]))
+        Sxy += float(Xc[:k].dot(Yc[:k]))
+    sum_x2 = Sxx + n * mean_x * mean_x
+    # Rank test of QRAccumulator.solve
+    if not Sxx > (20 * sys.float_info.epsilon) ** 2 * sum_x2:
+        raise ValueError("Least squares system is singular.")
+    a = Sxy / Sxx
+    sums = {"n": n, "sum_x": sum_x, "sum_y": sum_y, "sum_x2": sum_x2, "sum_xy": Sxy + n * mean_x * mean_y}
+    return a, mean_y - a * mean_x, sums
+
+
+def fit_polynomial(x: List[float], y: List[float], degree: int) -> Dict:
+    result = solve_least_squares(polynomial_design(x, degree), y)
+    result["model"] = f"Polynomial: degree {degree}"
+    return result
+
+
+def fit_multivariate(X, y: List[float], intercept: bool = True) -> Dict:
+    """X holds one regressor per column; the intercept is the last coefficient."""
+    result = solve_least_squares(multivariate_design(X, intercept), y)
+    result["model"] = "Multivariate Linear: y = c1 x1 + ... + ck xk" + (" + c0" if intercept else "")
+    return result
+
+
+# ==================================================
+# Model Fitting (Lecture-Based)
+# ==================================================
+
+MODEL_NAMES = {
+    "linear": "Linear: y = ax + b",
+    "exponential": "Exponential: y = b e^(ax)",
+    "power": "Power: y = b x^a",
+    "growth_rate": "Growth Rate: y = ax / (b + x)",
+}
+
+
+def _from_line(kind: str, a: float, b: float) -> Dict:
+    """
+    Maps the coefficients of the linearized model Y = aX + b back to the
+    model's a and b (the model's back in MODELS).
+    """
+    model = MODELS[kind]
+    a, b = model.back(a, b)
+    return {"model": model.name, "a": a, "b": b}
+
+
+def fit_from_sums(kind: str, sums: Dict) -> Dict:
+    """
+    Solves the normal equations of the linearized model and maps the
+    line coefficients back to the model's a and b. Only for when the sums
+    are all there is; fit_linearized is the accurate path.
+    """
+    coeffs = solve_normal_equations(sums)
+    model = _from_line(kind, coeffs["a"], coeffs["b"])
+    model["sums"] = sums
+    return model
+
+
+def fit_linearized(kind: str, X, Y) -> Dict:
+    """
+    Fits the line Y = aX + b of a linearized model (fit_line) and maps it
+    back.
+    """
+    a, b, sums = fit_line_sums(X, Y)
+    model = _from_line(kind, a, b)
+    model["sums"] = sums
+    return model
+
+
+def fit_linear(x: List[float], y: List[float]) -> Dict:
+    return fit_linearized("linear", x, y)
+
+
+def fit_exponential(x: List[float], y: List[float]) -> Dict:
+    # y = b e^(ax)  → ln(y) = ax + ln(b)
+    Y = [log(val) for val in y]
+    return fit_linearized("exponential", x, Y)
+
+
+def fit_power(x: List[float], y: List[float]) -> Dict:
+    # y = b x^a → ln(y) = a ln(x) + ln(b)
+    X = [log(val) for val in x]
+    Y = [log(val) for val in y]
+    return fit_linearized("power", X, Y)
+
+
+def fit_growth_rate(x: List[float], y: List[float]) -> Dict:
+    # y = ax / (b + x)
+    # 1/y = (b/a)(1/x) + (1/a)
+    X = [1 / val for val in x]
+    Y = [1 / val for val in y]
+    return fit_linearized("growth_rate", X, Y)
+
+
+# ==================================================
+# Prediction Functions
+# ==================================================
+
+def predict_linear(x, a, b):
+    return [a * xi + b for xi in x]
+
+
+def predict_exponential(x, a, b):
+    return [b * exp(a * xi) for xi in x]
+
+
+def predict_power(x, a, b):
+    return [b * (xi ** a) for xi in x]
+
+
+def predict_growth_rate(x, a, b):
+    return [(a * xi) / (b + xi) for xi in x]
+
+
+# ==================================================
+# Error Metric
+# ==================================================
+
+def compute_residual_error(y_true, y_pred):
+    return sum((yt - yp) ** 2 for yt, yp in zip(y_true, y_pred))
+
+
+# ==================================================
+# Nonlinear Refinement (Levenberg–Marquardt)
+# ==================================================
+
+def model_jacobian(kind: str, x: np.ndarray, ln_x, a: float, b: float):
+    """
+    Prediction f(x) of the model and its analytic partial derivatives
+    df/da, df/db, as arrays over the data (the model's jacobian in
+    MODELS). ln_x is only used by models of ln(x) and may be None.
+    """
+    data = SharedTransforms(x, None)
+    if ln_x is not None:
+        data.ln_x = ln_x
+    return MODELS[kind].jacobian(data, a, b)
+
+
+def refine_model(kind: str, x, y, a: float, b: float, tol: float = 1e-8,
+                 max_iter: int = 50, ln_x=None) -> Dict:
+    """
+    Levenberg–Marquardt on the model's own residual sum(y - f(x))^2,
+    starting from the linearized a, b.
+
+    The linearized fits minimize the error of ln(y) or 1/y, which weights
+    the points unevenly; this finds the a, b that minimize the error in y
+    itself. Started that close, it usually takes a handful of iterations.
+    Each step solves the 2 x 2 damped system with the Jacobian columns
+    scaled to unit length (Marquardt's scaling) and is only kept if the
+    error decreases.
+
+    Returns 'a', 'b', 'error', 'iterations', 'reason'
+    (numerics.monitor code) and 'initial_error'.
+    """
+    data = SharedTransforms(np.asarray(x, dtype=float).ravel(), np.asarray(y, dtype=float).ravel())
+    if ln_x is not None:
+        data.ln_x = ln_x
+    return _refine(MODELS[kind].jacobian, data, a, b, tol, max_iter)
+
+
+def _refine(jacobian, data: "SharedTransforms", a: float, b: float, tol: float = 1e-8,
+            max_iter: int = 50) -> Dict:
+    from .monitor import CONVERGED, MAX_ITER, NON_FINITE, STAGNATED
+
+    y = data.y
+    with np.errstate(all="ignore"):
+        f, Ja, Jb = jacobian(data, a, b)
+        r = y - f
+        error = float(r.dot(r))
+        result = {"a": a, "b": b, "error": error, "iterations": 0,
+                  "reason": MAX_ITER, "initial_error": error}
+        if not np.isfinite(error):
+            result["reason"] = NON_FINITE
+            return result
+
+        damping, growth = 1e-3, 2.0
+        for i in range(1, max_iter + 1):
+            result["iterations"] = i
+            na, nb = np.sqrt(Ja.dot(Ja)), np.sqrt(Jb.dot(Jb))
+            if not (na > 0 and nb > 0 and np.isfinite(na) and np.isfinite(nb)):
+                result["reason"] = NON_FINITE if not (np.isfinite(na) and np.isfinite(nb)) else STAGNATED
+                break
+            # (S J^T J S + damping I) u = S J^T r, step = S u, S = diag(1/|J_i|)
+            c = Ja.dot(Jb) / (na * nb)
+            ga, gb = Ja.dot(r) / na, Jb.dot(r) / nb
+            d = 1 + damping
+            det = d * d - c * c
+            ua, ub = (d * ga - c * gb) / det, (d * gb - c * ga) / det
+            da, db = ua / na, ub / nb
+            # The error is quadratic near the minimum: a relative step of
+            # tol changes it by about tol**2 relative, below rounding
+            predicted = ua * (damping * ua + ga) + ub * (damping * ub + gb)
+            if abs(da) <= tol * abs(a) and abs(db) <= tol * abs(b) or predicted <= tol * tol * error:
+                result["reason"] = CONVERGED
+                break
+
+            a_new, b_new = a + da, b + db
+            f_new, Ja_new, Jb_new = jacobian(data, a_new, b_new)
+            r_new = y - f_new
+            error_new = float(r_new.dot(r_new))
+
+            if np.isfinite(error_new) and error_new < error:
+                # Gain ratio: actual over predicted decrease (Nielsen's update)
+                rho = (error - error_new) / predicted if predicted > 0 else 1.0
+                damping *= max(1 / 3, 1 - (2 * rho - 1) ** 3)
+                growth = 2.0
+                improvement = error - error_new
+                a, b, r, error = a_new, b_new, r_new, error_new
+                Ja, Jb = Ja_new, Jb_new
+                if improvement <= tol * tol * error:
+                    result["reason"] = CONVERGED
+                    break
+            else:
+                damping *= growth
+                growth *= 2
+                if damping > 1e16:
+                    # No decrease along any direction: a minimum to rounding
+                    result["reason"] = CONVERGED
+                    break
+
+    result.update(a=float(a), b=float(b), error=error)
+    return result
+
+
+# ==================================================
+# Model Registry
+# ==================================================
+
+class SharedTransforms:
+    """
+    x, y and what the models are built from: ln_x, ln_y, inv_x, inv_y and
+    the domain facts x_pos, y_pos, x_nonneg, y_nonneg, x_nonzero,
+    y_nonzero. Each is computed on first use, under a lock so that models
+    fitted concurrently never compute one twice, and then shared.
+
+    x and y may also hold one series per row (auto_fit_stacked); the
+    domain facts are then per row.
+    """
+
+    _COMPUTE = {
+        "ln_x": lambda d: np.log(d.x),
+        "ln_y": lambda d: np.log(d.y),
+        "inv_x": lambda d: 1 / d.x,
+        "inv_y": lambda d: 1 / d.y,
+        "x_pos": lambda d: np.all(d.x > 0, axis=-1),
+        "y_pos": lambda d: np.all(d.y > 0, axis=-1),
+        "x_nonneg": lambda d: np.all(d.x >= 0, axis=-1),
+        "y_nonneg": lambda d: np.all(d.y >= 0, axis=-1),
+        "x_nonzero": lambda d: np.all(d.x != 0, axis=-1),
+        "y_nonzero": lambda d: np.all(d.y != 0, axis=-1),
+    }
+
+    def __init__(self, x: np.ndarray, y: Optional[np.ndarray]):
+        self.x = x
+        self.y = y
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name):
+        # Only reached while name is not cached in the instance yet
+        compute = SharedTransforms._COMPUTE.get(name)
+        if compute is None:
+            raise AttributeError(name)
+        with self._lock:
+            if name not in self.__dict__:
+                self.__dict__[name] = compute(self)
+        return self.__dict__[name]
+
+
+class Model:
+    """
+    A candidate model for auto_fit_best_model; every function takes the
+    SharedTransforms d of the data.
+
+    name       display name
+    domain     d -> True if the model applies to the data (per row for
+               stacked series)
+    predict    (d, *params) -> f(x), as a new array: callers overwrite
+               it with the residuals
+    transform  d -> (X, Y), the data on which the model is a line
+    back       (a, b) of that line -> the model's params, for floats and
+               for arrays of them
+    point      (x, y) of one point -> its (X, Y), or None outside the
+               domain: the scalar form of transform and domain, which
+               IncrementalFitter updates with
+    fit        d -> params, for models that are not a line in any
+               transform (used instead of transform and back)
+    jacobian   (d, a, b) -> (f, df/da, df/db) for refine_model
+    exact      the fit already minimizes the error in y, so refining
+               cannot improve it
+
+    Line models (those with a transform) in DEFAULT_MODELS are also what
+    auto_fit_stacked, LeastSquaresAccumulator and fit_file fit.
+    """
+
+    def __init__(self, name: str, domain, predict, transform=None, back=None, fit=None,
+                 jacobian=None, exact: bool = False, point=None):
+        if fit is None and transform is None:
+            raise ValueError("A model needs either a transform or a fit.")
+        self.name = name
+        self.domain = domain
+        self.predict = predict
+        self.transform = transform
+        self.back = back or (lambda a, b: (a, b))
+        self.point = point
+        self.fit = fit
+        self.jacobian = jacobian
+        self.exact = exact
+
+    def fit_data(self, d: SharedTransforms) -> Dict:
+        """Fitted model dict: 'model', 'a' and 'b' (or 'coefficients'), 'sums' of a line fit."""
+        if self.fit is not None:
+            params, sums = tuple(self.fit(d)), None
+        else:
+            a, b, sums = fit_line_sums(*self.transform(d))
+            params = self.back(a, b)
+        model = {"model": self.name}
+        if len(params) == 2:
+            model["a"], model["b"] = float(params[0]), float(params[1])
+        else:
+            model["coefficients"] = [float(c) for c in params]
+        if sums is not None:
+            model["sums"] = sums
+        return model
+
+
+def _exp(value):
+    # math.exp on floats keeps the scalar fits bit-identical to the
+    # lecture functions; arrays are back-transformed row-wise
+    return np.exp(value) if isinstance(value, np.ndarray) else exp(value)
+
+
+def _params(model: Dict) -> Tuple:
+    return tuple(model["coefficients"]) if "coefficients" in model else (model["a"], model["b"])
+
+
+def _line_predict(X, a, b):
+    # aX + b
+    f = X * a
+    f += b
+    return f
+
+
+def _exp_predict(X, a, b):
+    # b e^(aX)
+    f = X * a
+    np.exp(f, out=f)
+    f *= b
+    return f
+
+
+def _growth_rate_predict(d, a, b):
+    # ax / (x + b)
+    f = d.x + b
+    np.divide(d.x, f, out=f)
+    f *= a
+    return f
+
+
+def _saturation_predict(d, a, b):
+    # a (1 - e^(-bx))
+    f = -b * d.x
+    np.exp(f, out=f)
+    np.subtract(1, f, out=f)
+    f *= a
+    return f
+
+
+def _growth_rate_jacobian(d, a, b):
+    # f = ax / (b + x)
+    q = d.x / (b + d.x)
+    f = a * q
+    return f, q, -f / (b + d.x)
+
+
+def _exponential_jacobian(d, a, b):
+    # f = b e^(ax)
+    e = np.exp(a * d.x)
+    f = b * e
+    return f, d.x * f, e
+
+
+def _power_jacobian(d, a, b):
+    # f = b x^a = b e^(a ln x)
+    e = np.exp(a * d.ln_x)
+    f = b * e
+    return f, d.ln_x * f, e
+
+
+def _saturation_jacobian(d, a, b):
+    # f = a (1 - e^(-bx))
+    e = np.exp(-b * d.x)
+    return a * (1 - e), 1 - e, a * d.x * e
+
+
+def _fit_saturation(d):
+    # Start just above the largest y, where ln(1 - y/a) = -bx is a line
+    # through the origin, then solve the real problem by refine_model
+    a = float(np.max(d.y)) * (1 + 1 / d.y.size)
+    z = -np.log1p(-d.y / a)
+    b = float(d.x.dot(z) / d.x.dot(d.x))
+    refined = _refine(_saturation_jacobian, d, a, b)
+    return refined["a"], refined["b"]
+
+
+def polynomial_model(degree: int) -> Model:
+    """Polynomial of the given degree, fitted by fit_polynomial; 'coefficients' highest power first."""
+    return Model(
+        f"Polynomial: degree {degree}",
+        domain=lambda d: d.x.size > degree,
+        fit=lambda d: solve_least_squares(polynomial_design(d.x, degree), d.y)["coefficients"],
+        predict=lambda d, *c: np.polyval(c, d.x),
+        exact=True,
+    )
+
+
+# Predictors keep the operation order of the earlier vectorized
+# predictions, so the lecture models score exactly as before, and work
+# in place on the one array they allocate
+MODELS = {
+    "linear": Model(
+        MODEL_NAMES["linear"],
+        domain=lambda d: True,
+        transform=lambda d: (d.x, d.y),
+        point=lambda x, y: (x, y),
+        predict=lambda d, a, b: _line_predict(d.x, a, b),
+        jacobian=lambda d, a, b: (a * d.x + b, d.x, np.ones_like(d.x)),
+        exact=True),
+    "exponential": Model(
+        MODEL_NAMES["exponential"],
+        domain=lambda d: d.y_pos,
+        transform=lambda d: (d.x, d.ln_y),
+        back=lambda a, b: (a, _exp(b)),
+        point=lambda x, y: (x, log(y)) if y > 0 else None,
+        predict=lambda d, a, b: _exp_predict(d.x, a, b),
+        jacobian=_exponential_jacobian),
+    "power": Model(
+        MODEL_NAMES["power"],
+        domain=lambda d: d.y_pos & d.x_pos,
+        transform=lambda d: (d.ln_x, d.ln_y),
+        back=lambda a, b: (a, _exp(b)),
+        point=lambda x, y: (log(x), log(y)) if x > 0 and y > 0 else None,
+        predict=lambda d, a, b: _exp_predict(d.ln_x, a, b),
+        jacobian=_power_jacobian),
+    "growth_rate": Model(
+        MODEL_NAMES["growth_rate"],
+        domain=lambda d: d.x_nonzero & d.y_nonzero,
+        transform=lambda d: (d.inv_x, d.inv_y),
+        back=lambda A, B: (1 / B, A * (1 / B)),
+        point=lambda x, y: (1 / x, 1 / y) if x != 0 and y != 0 else None,
+        predict=_growth_rate_predict,
+        jacobian=_growth_rate_jacobian),
+    "logarithmic": Model(
+        "Logarithmic: y = a ln(x) + b",
+        domain=lambda d: d.x_pos,
+        transform=lambda d: (d.ln_x, d.y),
+        point=lambda x, y: (log(x), y) if x > 0 else None,
+        predict=lambda d, a, b: _line_predict(d.ln_x, a, b),
+        jacobian=lambda d, a, b: (a * d.ln_x + b, d.ln_x, np.ones_like(d.x)),
+        exact=True),
+    "saturation": Model(
+        "Saturation: y = a (1 - e^(-bx))",
+        domain=lambda d: d.x_nonneg & d.y_nonneg & np.any(d.x > 0, axis=-1) & np.any(d.y > 0, axis=-1),
+        fit=_fit_saturation,
+        predict=_saturation_predict,
+        jacobian=_saturation_jacobian,
+        exact=True),
+}
+
+# Candidates every entry point tries unless told otherwise: the lecture
+# models. The others are opt-in (models=..., register_model), since any
+# new default changes which model wins on existing data. Polynomials
+# would also always win, ranked by error alone, and saturation's
+# iterative fit costs about ten times the others on data that does not
+# level off.
+DEFAULT_MODELS = ["linear", "exponential", "power", "growth_rate"]
+
+
+def register_model(kind: str, model: Model, default: bool = True):
+    """Adds a model to MODELS under kind, and to DEFAULT_MODELS unless default is False."""
+    MODELS[kind] = model
+    if default and kind not in DEFAULT_MODELS:
+        DEFAULT_MODELS.append(kind)
+
+
+def line_models(models: Optional[Iterable[str]] = None) -> Tuple[str, ...]:
+    """The kinds among models (default DEFAULT_MODELS) that are a line in some transform."""
+    return tuple(kind for kind in (DEFAULT_MODELS if models is None else models)
+                 if MODELS[kind].transform is not None)
+
+
+# ==================================================
+# Automatic Model Selection
+# ==================================================
+
+def array_summations(X: np.ndarray, Y: np.ndarray) -> Dict:
+    """
+    compute_summations for NumPy arrays.
+    """
+    return {
+        "n": X.size,
+        "sum_x": float(np.sum(X)),
+        "sum_y": float(np.sum(Y)),
+        "sum_x2": float(np.dot(X, X)),
+        "sum_xy": float(np.dot(X, Y))
+    }
+
+
+def predict_into(kind: str, x: np.ndarray, ln_x, a: float, b: float, out: np.ndarray) -> np.ndarray:
+    """
+    The model's predict (see MODELS) written into a preallocated buffer.
+    ln_x is only used by models of ln(x) and may be None.
+    """
+    d = SharedTransforms(x, None)
+    if ln_x is not None:
+        d.ln_x = ln_x
+    out[...] = MODELS[kind].predict(d, a, b)
+    return out
+
+
+def linearize(x: np.ndarray, y: np.ndarray,
+              models: Optional[Iterable[str]] = None) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Linearized (X, Y) data of every line model (line_models(models)) whose
+    domain holds. ln(x), ln(y), 1/x and 1/y are each computed once and
+    shared by the models that use them.
+    """
+    d = SharedTransforms(x, y)
+    return {kind: MODELS[kind].transform(d) for kind in line_models(models) if MODELS[kind].domain(d)}
+
+
+# Below this many points the models are fitted one after another: thread
+# start-up would cost more than it saves
+PARALLEL_MIN_POINTS = 20_000
+
+
+def _fit_candidate(model: Model, d: SharedTransforms, refine: bool) -> Dict:
+    with np.errstate(all="ignore"):
+        try:
+            result = model.fit_data(d)
+        except (ValueError, ArithmeticError) as e:
+            # Singular, or a pole in the back-transform (growth rate on
+            # y = cx): ranked last, as auto_fit_stacked and
+            # IncrementalFitter do
+            return {"model": model.name, "a": float("nan"), "b": float("nan"),
+                    "error": float("inf"), "error_msg": str(e)}
+        residual = model.predict(d, *_params(result))
+        np.subtract(d.y, residual, out=residual)
+        error = float(np.dot(residual, residual))
+        # Overflow or a pole in the prediction ranks the model last
+        result["error"] = error if np.isfinite(error) else float("inf")
+        if refine and not model.exact and model.jacobian is not None and np.isfinite(error):
+            refined = _refine(model.jacobian, d, result["a"], result["b"])
+            if refined["error"] <= result["error"]:
+                result["linearized"] = {key: result[key] for key in ("a", "b", "error")}
+                result.update(a=refined["a"], b=refined["b"], error=refined["error"])
+                result["refinement"] = {key: refined[key] for key in ("iterations", "reason")}
+    return result
+
+
+def auto_fit_best_model(x: List[float], y: List[float], refine: bool = False,
+                        models: Optional[Iterable] = None, workers: Optional[int] = None) -> Dict:
+    """
+    Fits every candidate model whose domain holds and picks the one with
+    the least sum of squared residuals in y.
+
+    models lists the candidates as MODELS keys or Model objects (default
+    DEFAULT_MODELS). ln(x), ln(y), 1/x and 1/y are computed once and
+    shared by the models that use them. With workers other than 1 and at
+    least PARALLEL_MIN_POINTS points, the models are fitted concurrently
+    on a thread pool (NumPy releases the GIL on array work); workers=None
+    uses one thread per core.
+
+    With refine, models whose fit is not least squares in y (exponential,
+    power, growth rate) are polished by refine_model so that each model
+    is ranked by its best possible error rather than by its linearized
+    fit; a refined model keeps the linearized a, b and error under
+    'linearized' and has a 'refinement' entry with the iteration count
+    and reason.
+
+    A model whose fit fails (singular, or a pole in its back-transform)
+    has NaN a and b, an inf error and the cause under 'error_msg'. If
+    every model fails, the first cause is raised as a ValueError.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.shape != y.shape:
+        raise ValueError("x and y must have the same number of values.")
+    d = SharedTransforms(x.ravel(), y.ravel())
+
+    candidates = [MODELS[m] if isinstance(m, str) else m
+                  for m in (DEFAULT_MODELS if models is None else models)]
+    candidates = [model for model in candidates if model.domain(d)]
+
+    if workers == 1 or len(candidates) < 2 or (workers is None and d.x.size < PARALLEL_MIN_POINTS):
+        results = [_fit_candidate(model, d, refine) for model in candidates]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_fit_candidate, model, d, refine) for model in candidates]
+            results = [future.result() for future in futures]
+
+    failed = [m["error_msg"] for m in results if "error_msg" in m]
+    if results and len(failed) == len(results):
+        raise ValueError(failed[0])
+    best_model = min(results, key=lambda m: m["error"])
+
+    return {
+        "best_model": best_model,
+        "all_models": results
+    }
+
+
+# ==================================================
+# Vectorized Fitting
+# ==================================================
+
+def _fit_rows(kinds, x, y, a, b, error):
+    """Fits every model to the rows of y, writing one column of a, b and error per row."""
+    d = SharedTransforms(x, y)
+    for i, kind in enumerate(kinds):
+        model = MODELS[kind]
+        valid = model.domain(d)
+        X, Y = model.transform(d)
+        # fit_line on every row; a shared X gives scalars
+        mean_x = np.mean(X, axis=-1, keepdims=True)
+        mean_y = np.mean(Y, axis=1, keepdims=True)
+        Xc = X - mean_x
+        Sxx = np.sum(Xc * Xc, axis=-1)
+        Sxx = np.where(Sxx > (20 * sys.float_info.epsilon) ** 2 * np.sum(X * X, axis=-1), Sxx, np.nan)
+        A = np.sum(Xc * (Y - mean_y), axis=1) / Sxx
+        B = mean_y[:, 0] - A * mean_x[..., 0]
+
+        # The model's back and predict, row-wise
+        A, B = model.back(A, B)
+        prediction = model.predict(d, A[:, None], B[:, None]) - y
+        sse = np.einsum("ij,ij->i", prediction, prediction)
+        valid = valid & np.isfinite(sse)
+        a[i] = np.where(valid, A, np.nan)
+        b[i] = np.where(valid, B, np.nan)
+        error[i] = np.where(valid, sse, np.inf)
+
+
+def auto_fit_stacked(x, y, block: int = 256, models: Optional[Iterable[str]] = None) -> Dict:
+    """
+    auto_fit_best_model for m series of n points at once: y is m x n, one
+    series per row, and x is either shared (n values) or m x n too.
+
+    Every model is fitted to every row with whole-array operations, and a
+    shared x is transformed only once, so many short series cost about as
+    much as one long one. Rows are processed block at a time to keep the
+    temporaries in cache. The models are line_models(models).
+
+    Returns a dict with:
+        'kinds': MODELS keys, one row of the arrays below each
+        'a', 'b': len(kinds) x m coefficients, NaN where a row is outside
+            the model's domain or its normal equations are singular
+        'error': len(kinds) x m sums of squared residuals, inf where no fit
+        'best': index into kinds of each row's best model, -1 if none fits
+    """
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    x = np.asarray(x, dtype=float)
+    if y.ndim != 2 or x.shape not in (y.shape, y.shape[1:]):
+        raise ValueError("y must be m x n and x must have n values or be m x n.")
+
+    m = y.shape[0]
+    kinds = line_models(models)
+    a = np.empty((len(kinds), m))
+    b = np.empty_like(a)
+    error = np.empty_like(a)
+    with np.errstate(all="ignore"):
+        for start in range(0, m, block):
+            rows = slice(start, start + block)
+            _fit_rows(kinds, x if x.ndim == 1 else x[rows], y[rows], a[:, rows], b[:, rows], error[:, rows])
+
+    best = np.argmin(error, axis=0)
+    best[np.isinf(error[best, np.arange(m)])] = -1
+    return {"kinds": kinds, "a": a, "b": b, "error": error, "best": best}
+
+
+# ==================================================
+# Batch Fitting
+# ==================================================
+
+def _fit_indexed(item):
+    index, (x, y) = item
+    try:
+        return index, auto_fit_best_model(x, y)
+    except (ValueError, ArithmeticError) as e:
+        return index, {"best_model": None, "all_models": [], "error_msg": str(e)}
+
+
+def auto_fit_many(series: Iterable[Tuple[List[float], List[float]]],
+                  workers: Optional[int] = None,
+                  chunksize: int = 64,
+                  ordered: bool = True,
+                  stats: Optional[Dict] = None) -> Iterator[Tuple[int, Dict]]:
+    """
+    Runs auto_fit_best_model on many independent (x, y) series.
+
+    Series are sent to a pool of worker processes in chunks of chunksize
+    (workers=None uses every core, workers=1 runs in this process). Yields
+    (index, result) pairs, in input order or as they complete when ordered
+    is False. A series that cannot be fitted yields a result with
+    best_model None and an 'error_msg'.
+
+    If a stats dict is given, it is kept up to date with 'count',
+    'elapsed' (seconds) and 'series_per_second'.
+    """
+    start = time.perf_counter()
+    items = enumerate(series)
+
+    pool = None
+    if workers == 1:
+        results = map(_fit_indexed, items)
+    else:
+        pool = multiprocessing.Pool(workers)
+        imap = pool.imap if ordered else pool.imap_unordered
+        results = imap(_fit_indexed, items, chunksize)
+
+    try:
+        for count, item in enumerate(results, 1):
+            if stats is not None:
+                elapsed = time.perf_counter() - start
+                stats["count"] = count
+                stats["elapsed"] = elapsed
+                stats["series_per_second"] = count / elapsed if elapsed > 0 else float("inf")
+            yield item
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+# ==================================================
+# Streaming Least Squares
+# ==================================================
+
+SUM_KEYS = ("sum_x", "sum_y", "sum_x2", "sum_xy")
+
+
+class CompensatedSum:
+    """
+    Running sum with Neumaier (improved Kahan) compensation.
+    """
+
+    __slots__ = ("total", "compensation")
+
+    def __init__(self):
+        self.total = 0.0
+        self.compensation = 0.0
+
+    def add(self, value: float):
+        t = self.total + value
+        if abs(self.total) >= abs(value):
+            self.compensation += (self.total - t) + value
+        else:
+            self.compensation += (value - t) + self.total
+        self.total = t
+
+    def merge(self, other: "CompensatedSum"):
+        self.add(other.total)
+        self.add(other.compensation)
+
+    @property
+    def value(self) -> float:
+        return self.total + self.compensation
+
+
+class LeastSquaresAccumulator:
+    """
+    Incremental compute_summations and QR factor for every linearized model.
+
+    Data is fed in chunks with update(); each chunk is reduced with
+    pairwise summation and folded into compensated running totals, and
+    into a QRAccumulator that fit() solves, so memory stays O(1) however
+    long the stream is. The models are line_models(models); one whose
+    domain is violated by any point (e.g. y <= 0 for exponential) is
+    dropped.
+    """
+
+    def __init__(self, models: Optional[Iterable[str]] = None):
+        self.n = 0
+        self.kinds = line_models(models)
+        self.valid = {kind: True for kind in self.kinds}
+        self._sums = {kind: {key: CompensatedSum() for key in SUM_KEYS} for kind in self.kinds}
+        self._qr = {kind: QRAccumulator(2) for kind in self.kinds}
+
+    def update(self, x, y) -> "LeastSquaresAccumulator":
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if x.shape != y.shape:
+            raise ValueError("x and y must have the same number of values.")
+        if x.size == 0:
+            return self
+
+        self.n += x.size
+        with np.errstate(divide="ignore", invalid="ignore"):
+            table = linearize(x, y, self.kinds)
+            for kind in self.kinds:
+                if kind not in table:
+                    self.valid[kind] = False
+                if not self.valid[kind]:
+                    continue
+                X, Y = table[kind]
+                sums = self._sums[kind]
+                sums["sum_x"].add(float(np.sum(X)))
+                sums["sum_y"].add(float(np.sum(Y)))
+                sums["sum_x2"].add(float(np.sum(X * X)))
+                sums["sum_xy"].add(float(np.sum(X * Y)))
+                self._qr[kind].update(polynomial_design(X, 1), Y)
+        return self
+
+    def merge(self, other: "LeastSquaresAccumulator") -> "LeastSquaresAccumulator":
+        if other.kinds != self.kinds:
+            raise ValueError("Accumulators of different models cannot be merged.")
+        self.n += other.n
+        for kind in self.kinds:
+            self.valid[kind] = self.valid[kind] and other.valid[kind]
+            for key in SUM_KEYS:
+                self._sums[kind][key].merge(other._sums[kind][key])
+            self._qr[kind].merge(other._qr[kind])
+        return self
+
+    def sums(self, kind: str = "linear") -> Dict:
+        """
+        Summations of the transformed data, as returned by compute_summations.
+        """
+        if not self.valid[kind]:
+            raise ValueError(f"Data is outside the domain of the {kind} model.")
+        result = {"n": self.n}
+        for key in SUM_KEYS:
+            result[key] = self._sums[kind][key].value
+        return result
+
+    def fit(self, kind: str = "linear") -> Dict:
+        sums = self.sums(kind)
+        a, b = self._qr[kind].solve()
+        model = _from_line(kind, float(a), float(b))
+        model["sums"] = sums
+        return model
+
+    def fit_all(self) -> List[Dict]:
+        """
+        Coefficients of every model whose domain holds for all data seen.
+        """
+        return [self.fit(kind) for kind in self.kinds if self.valid[kind]]
+
+
+# ==================================================
+# Incremental Model Selection
+# ==================================================
+
+class IncrementalFitter:
+    """
+    Model selection on live data. Points are added and removed one at a
+    time, or pushed through a sliding window of the last window points,
+    and the coefficients of every model stay current at O(1) cost per
+    update. The models are the line models of DEFAULT_MODELS unless
+    given; each needs a point transform (see Model).
+
+    Each model keeps the count, the means and the centred co-moments of
+    its transformed points. Welford's update adds a point, and the same
+    update run backwards removes one. The raw compute_summations totals
+    are not used: once points are subtracted, they lose all accuracy to
+    cancellation on offset x such as timestamps. A model is left out
+    while any stored point is outside its domain, and it comes back as
+    soon as those points leave.
+
+    Ranking needs each model's error in y. Exact models (linear,
+    logarithmic) fit y itself, so their error follows from the co-moments
+    and is always current. For the other models, refresh() evaluates the error over
+    the stored points; it also recomputes every co-moment from scratch,
+    which clears the rounding drift of the updates. auto_fit() calls
+    refresh() once refresh updates have gone by since the last one. The
+    default is the window size; without a window the stored points grow
+    with the history, so the default gap grows too, to the number of
+    points the last refresh saw (at least 1000). Either way a refresh of
+    n points comes at most every n updates, which keeps the cost O(1)
+    per update amortized. An explicit refresh is honoured as given:
+    refresh=1 keeps the ranking exact, and refresh=0 leaves refreshing
+    to the caller.
+    """
+
+    def __init__(self, window: Optional[int] = None, models: Optional[Iterable[str]] = None,
+                 refresh: Optional[int] = None):
+        if window is not None and window < 2:
+            raise ValueError("A window must hold at least 2 points.")
+        kinds = [kind for kind in line_models() if MODELS[kind].point is not None] \
+            if models is None else list(models)
+        for kind in kinds:
+            if MODELS[kind].transform is None or MODELS[kind].point is None:
+                raise ValueError(f"The {kind} model cannot be fitted incrementally.")
+        self.kinds = tuple(kinds)
+        self._point = [(kind, MODELS[kind].point) for kind in self.kinds]
+        self.window = window
+        self.refresh_every = (window or 1000) if refresh is None else refresh
+        # Geometric schedule: only for the default refresh without a window
+        self._grow = window is None and refresh is None
+        self._x = deque()
+        self._y = deque()
+        # n, mean X, mean Y, Sxx, Sxy, Syy of each model's (X, Y)
+        self._moments = {kind: [0, 0.0, 0.0, 0.0, 0.0, 0.0] for kind in self.kinds}
+        self._outside = dict.fromkeys(self.kinds, 0)
+        self._errors = {}
+        self._since_refresh = 0
+        self._refreshed_size = 0
+
+    def __len__(self):
+        return len(self._x)
+
+    def _apply(self, x: float, y: float, sign: int):
+        for kind, transform in self._point:
+            point = transform(x, y)
+            if point is None:
+                self._outside[kind] += sign
+                self._errors.pop(kind, None)
+                continue
+            X, Y = point
+            m = self._moments[kind]
+            n = m[0] + sign
+            if n == 0:
+                m[:] = [0, 0.0, 0.0, 0.0, 0.0, 0.0]
+                continue
+            dx, dy = X - m[1], Y - m[2]
+            m[0] = n
+            m[1] += sign * dx / n
+            m[2] += sign * dy / n
+            # Against the new means, the same products add or remove the point
+            m[3] += sign * dx * (X - m[1])
+            m[4] += sign * dx * (Y - m[2])
+            m[5] += sign * dy * (Y - m[2])
+
+    def add(self, x: float, y: float) -> "IncrementalFitter":
+        """Adds a point; with a full window, the oldest point leaves."""
+        x, y = float(x), float(y)
+        self._x.append(x)
+        self._y.append(y)
+        self._apply(x, y, 1)
+        if self.window is not None and len(self._x) > self.window:
+            self._apply(self._x.popleft(), self._y.popleft(), -1)
+        self._since_refresh += 1
+        return self
+
+    def remove(self, x: float, y: float) -> "IncrementalFitter":
+        """
+        Removes a point added earlier. Removing the oldest point is O(1);
+        any other point has to be searched for among the stored points.
+        """
+        x, y = float(x), float(y)
+        if self._x and self._x[0] == x and self._y[0] == y:
+            self._x.popleft()
+            self._y.popleft()
+        else:
+            index = next((i for i, point in enumerate(zip(self._x, self._y)) if point == (x, y)), None)
+            if index is None:
+                raise ValueError(f"Point ({x}, {y}) was never added.")
+            del self._x[index]
+            del self._y[index]
+        self._apply(x, y, -1)
+        self._since_refresh += 1
+        return self
+
+    def sums(self, kind: str = "linear") -> Dict:
+        """
+        Summations of the transformed points, as returned by
+        compute_summations, plus 'sum_y2'.
+        """
+        if self._outside[kind]:
+            raise ValueError(f"Data is outside the domain of the {kind} model.")
+        n, mean_x, mean_y, Sxx, Sxy, Syy = self._moments[kind]
+        return {
+            "n": n,
+            "sum_x": n * mean_x,
+            "sum_y": n * mean_y,
+            "sum_x2": Sxx + n * mean_x * mean_x,
+            "sum_xy": Sxy + n * mean_x * mean_y,
+            "sum_y2": Syy + n * mean_y * mean_y,
+        }
+
+    def fit(self, kind: str = "linear") -> Dict:
+        """
+        The model's 'model', 'a', 'b' and 'sums'. 'error' is the sum of
+        squared residuals in y, and 'error_age' is the number of updates
+        since it was computed (0 for linear and logarithmic). A model
+        that has not been refreshed yet has neither key.
+        """
+        sums = self.sums(kind)
+        n, mean_x, mean_y, Sxx, Sxy, Syy = self._moments[kind]
+        # Rank test of fit_line
+        if not Sxx > (20 * sys.float_info.epsilon) ** 2 * sums["sum_x2"]:
+            raise ValueError("Least squares system is singular.")
+        a = Sxy / Sxx
+        model_def = MODELS[kind]
+        params = model_def.back(a, mean_y - a * mean_x)
+        model = {"model": model_def.name, "a": float(params[0]), "b": float(params[1]), "sums": sums}
+        if model_def.exact:
+            model["error"] = max(Syy - a * Sxy, 0.0)
+            model["error_age"] = 0
+        elif kind in self._errors:
+            model["error"] = self._errors[kind]
+            model["error_age"] = self._since_refresh
+        return model
+
+    def refresh(self) -> "IncrementalFitter":
+        """
+        Recomputes the co-moments of every model whose domain holds, and
+        the error in y of the models whose fit is not least squares in y.
+        O(number of stored points).
+        """
+        self._since_refresh = 0
+        self._refreshed_size = len(self._x)
+        self._errors = {}
+        if not self._x:
+            for m in self._moments.values():
+                m[:] = [0, 0.0, 0.0, 0.0, 0.0, 0.0]
+            return self
+
+        n = len(self._x)
+        d = SharedTransforms(np.fromiter(self._x, float, n), np.fromiter(self._y, float, n))
+        with np.errstate(all="ignore"):
+            for kind in self.kinds:
+                if self._outside[kind]:
+                    continue
+                model_def = MODELS[kind]
+                X, Y = model_def.transform(d)
+                mean_x, mean_y = float(X.sum()) / X.size, float(Y.sum()) / Y.size
+                Xc, Yc = X - mean_x, Y - mean_y
+                self._moments[kind] = [X.size, mean_x, mean_y,
+                                       float(Xc.dot(Xc)), float(Xc.dot(Yc)), float(Yc.dot(Yc))]
+                if model_def.exact:
+                    continue
+                try:
+                    model = self.fit(kind)
+                except (ValueError, ArithmeticError):
+                    # Singular or overflowing: ranked last until the next refresh
+                    self._errors[kind] = float("inf")
+                    continue
+                residual = d.y - model_def.predict(d, model["a"], model["b"])
+                error = float(residual.dot(residual))
+                self._errors[kind] = error if np.isfinite(error) else float("inf")
+        return self
+
+    def auto_fit(self) -> Dict:
+        """
+        auto_fit_best_model on the stored points: 'best_model' (None
+        while no model can be fitted) and 'all_models', as ranked by
+        their latest errors. Refreshes first when the schedule says so,
+        or when a model has just come back into its domain.
+        """
+        every = max(self.refresh_every, self._refreshed_size) if self._grow else self.refresh_every
+        due = self.refresh_every and self._since_refresh >= every
+        missing = any(not self._outside[kind] and not MODELS[kind].exact and kind not in self._errors
+                      for kind in self.kinds)
+        if due or missing:
+            self.refresh()
+
+        results = []
+        for kind in self.kinds:
+            if self._outside[kind]:
+                continue
+            try:
+                results.append(self.fit(kind))
+            except (ValueError, ArithmeticError):
+                continue
+        best_model = min(results, key=lambda m: m.get("error", float("inf")), default=None)
+
+        return {
+            "best_model": best_model,
+            "all_models": results
+        }
@@ -0,0 +1,117 @@
+# loaders.py
+# Numerical Computing Project
+# Chunked file input for the least squares pipeline
+
+import os
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .least_squares import MODELS, LeastSquaresAccumulator, SharedTransforms
+
+
+Chunk = Tuple[np.ndarray, np.ndarray]
+
+
+# ==================================================
+# Chunk Readers
+# ==================================================
+
+def iter_csv_chunks(path: str, chunk_size: int = 100_000, columns: Tuple[int, int] = (0, 1),
+                    delimiter: str = ",", skip_header: int = 0) -> Iterator[Chunk]:
+    """
+    Reads (x, y) from two columns of a text file, chunk_size rows at a time.
+    """
+    with open(path, "r") as f:
+        for _ in range(skip_header):
+            next(f, None)
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+            data = np.loadtxt(lines, delimiter=delimiter, usecols=columns, ndmin=2)
+            yield data[:, 0], data[:, 1]
+
+
+def iter_binary_chunks(path: str, chunk_size: int = 1_000_000, dtype: str = "<f8") -> Iterator[Chunk]:
+    """
+    Reads a raw binary file of interleaved x, y float64 pairs through np.memmap.
+    """
+    if os.path.getsize(path) == 0:
+        return
+    data = np.memmap(path, dtype=dtype, mode="r")
+    if data.size % 2:
+        raise ValueError("Binary file must contain an even number of values (x, y pairs).")
+    pairs = data.reshape(-1, 2)
+    for start in range(0, len(pairs), chunk_size):
+        block = pairs[start:start + chunk_size]
+        yield block[:, 0], block[:, 1]
+
+
+def iter_npy_chunks(path: str, chunk_size: int = 1_000_000) -> Iterator[Chunk]:
+    """
+    Reads a .npy array of shape (n, 2) or (2, n) memory-mapped.
+    """
+    data = np.load(path, mmap_mode="r")
+    if data.ndim != 2 or 2 not in data.shape:
+        raise ValueError(f"Expected an array of shape (n, 2) or (2, n), got {data.shape}.")
+    if data.shape[1] != 2:
+        data = data.T
+    for start in range(0, len(data), chunk_size):
+        block = data[start:start + chunk_size]
+        yield block[:, 0], block[:, 1]
+
+
+def iter_chunks(path: str, chunk_size: int = 100_000, **options) -> Iterator[Chunk]:
+    """
+    Picks the reader from the file extension: .csv/.txt are text,
+    .npy is a NumPy array and anything else is raw float64 pairs.
+    skip_header only applies to text files and is ignored otherwise.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    skip_header = options.pop("skip_header", 0)
+    if ext in (".csv", ".txt"):
+        return iter_csv_chunks(path, chunk_size, skip_header=skip_header, **options)
+    if ext == ".npy":
+        return iter_npy_chunks(path, chunk_size)
+    return iter_binary_chunks(path, chunk_size, **options)
+
+
+# ==================================================
+# Fitting From Files
+# ==================================================
+
+def fit_file(path: str, chunk_size: int = 100_000, models: Optional[Iterable[str]] = None,
+             **options) -> Dict:
+    """
+    auto_fit_best_model for a file of any size.
+
+    The first pass accumulates the summations of every model (the line
+    models of models, see LeastSquaresAccumulator), the second computes
+    each model's sum of squared residuals. Only one chunk is in memory
+    at a time.
+    """
+    acc = LeastSquaresAccumulator(models)
+    for x, y in iter_chunks(path, chunk_size, **options):
+        acc.update(x, y)
+    results = acc.fit_all()
+
+    kinds = [kind for kind in acc.kinds if acc.valid[kind]]
+    errors = [0.0] * len(results)
+    with np.errstate(all="ignore"):
+        for x, y in iter_chunks(path, chunk_size, **options):
+            # ln(x) and the like are computed once per chunk for all models
+            d = SharedTransforms(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+            for i, (kind, model) in enumerate(zip(kinds, results)):
+                residual = MODELS[kind].predict(d, model["a"], model["b"])
+                np.subtract(d.y, residual, out=residual)
+                errors[i] += float(np.dot(residual, residual))
+
+    for model, error in zip(results, errors):
+        model["error"] = error if np.isfinite(error) else float("inf")
+
+    return {
+        "best_model": min(results, key=lambda m: m["error"]),
+        "all_models": results
+    }
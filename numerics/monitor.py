@@ -0,0 +1,161 @@
+# monitor.py
+# Shared stopping logic for the iterative methods
+
+import math
+import sys
+from collections import deque
+
+# Reason codes
+CONVERGED = "converged"
+MAX_ITER = "max_iter"
+DIVERGED = "diverged"
+STAGNATED = "stagnated"
+CYCLE = "cycle"
+NON_FINITE = "non_finite"
+BREAKDOWN = "breakdown"
+
+MESSAGES = {
+    CONVERGED: None,
+    MAX_ITER: "Method did not converge",
+    DIVERGED: "Iteration diverged",
+    STAGNATED: "Iteration stagnated",
+    CYCLE: "Iteration is cycling",
+    NON_FINITE: "Iteration diverged to a non-finite value",
+}
+
+
+class ConvergenceMonitor:
+    """
+    Decides after every iteration whether an iterative method should stop,
+    and why. A method calls update() once per iteration with the size of
+    its step, optionally a residual norm (|f(x)|, |b - A x|) and the new
+    iterate (scalar methods) or its size as scale (vector methods, a
+    number or a function that is only called on a plateau);
+    update() returns True when the loop should stop and the reason is
+    then in .reason.
+
+    Stops with:
+        CONVERGED   step < tol
+        NON_FINITE  step, residual or x is NaN or infinite
+        DIVERGED    step or residual is past divergence times its
+                    smallest value so far and has not reached a new
+                    minimum for patience iterations, or still is when
+                    max_iter runs out; or x runs away: |x| grew on each
+                    of at least patience iterations at a steady pace
+                    (the step within a factor 2 of the first) while the
+                    residual fell below rounding level of where it
+                    started (f fading towards an asymptote, as x e^(-x)
+                    does, rather than a root)
+        STAGNATED   the step is at rounding level (|x| or scale times
+                    rounding) and neither it nor the residual reached a
+                    new minimum for patience iterations: tol is out of
+                    reach in floating point
+        CYCLE       x came back within tol of an iterate at most
+                    cycle_window iterations old without the steps shrinking
+        MAX_ITER    max_iter updates without any of the above
+
+    BREAKDOWN is for methods to report that they cannot continue (a zero
+    derivative or divisor); the monitor itself never sets it.
+    """
+
+    def __init__(self, tol, max_iter, divergence=1e8, patience=20, cycle_window=8,
+                 rounding=1e3 * sys.float_info.epsilon):
+        self.tol = tol
+        self.max_iter = max_iter
+        self.divergence = divergence
+        self.patience = patience
+        self.rounding = rounding
+        self.iterations = 0
+        self.reason = MAX_ITER if max_iter <= 0 else None
+        self.step = None
+        self.residual = None
+        self._best_step = math.inf
+        self._best_residual = math.inf
+        self._since_best = 0
+        self._history = deque(maxlen=cycle_window + 1)
+        # Current run of outward iterates: last x, first step and
+        # residual, iterations
+        self._outward = None
+
+    @property
+    def converged(self):
+        return self.reason == CONVERGED
+
+    @property
+    def message(self):
+        """error_msg for the result dicts: None when converged."""
+        return MESSAGES.get(self.reason)
+
+    def stop(self, reason):
+        self.reason = reason
+        return True
+
+    def update(self, step, residual=None, x=None, scale=None):
+        self.iterations += 1
+        self.step = step = float(step)
+        if residual is not None:
+            self.residual = residual = float(residual)
+
+        if not math.isfinite(step) or (residual is not None and not math.isfinite(residual)) \
+                or (x is not None and not math.isfinite(x)):
+            return self.stop(NON_FINITE)
+        if step < self.tol:
+            return self.stop(CONVERGED)
+
+        # One overshoot (Newton from near a zero derivative, non-normal
+        # Jacobi matrices) can blow the step or residual up by many orders
+        # and still converge, so growth only counts once it is sustained
+        grown = step > self.divergence * self._best_step or \
+            (residual is not None and residual > self.divergence * self._best_residual)
+
+        # Transient growth of the residual can also last hundreds of
+        # iterations, so only a plateau at rounding level counts as
+        # stagnation
+        improved = step < self._best_step
+        self._best_step = min(self._best_step, step)
+        if residual is not None:
+            improved = improved or residual < self._best_residual
+            self._best_residual = min(self._best_residual, residual)
+        self._since_best = 0 if improved else self._since_best + 1
+        if grown and self._since_best >= self.patience:
+            return self.stop(DIVERGED)
+        if x is not None and residual is not None and self._running_away(x, step, residual):
+            return self.stop(DIVERGED)
+        if self._since_best >= self.patience:
+            if scale is None and x is not None:
+                scale = abs(x)
+            elif callable(scale):
+                scale = scale()
+            if scale is not None and step <= self.rounding * float(scale):
+                return self.stop(STAGNATED)
+
+        # Flipping between neighbouring floats is stagnation, not a cycle
+        if x is not None and step > self.rounding * abs(x) and self._cycling(x, step):
+            return self.stop(CYCLE)
+
+        if self.iterations >= self.max_iter:
+            return self.stop(DIVERGED if grown else MAX_ITER)
+        return False
+
+    def _running_away(self, x, step, residual):
+        run = self._outward
+        if run is None or not (abs(x) > abs(run[0]) and x * run[0] > 0):
+            self._outward = [x, step, residual, 0]
+            return False
+        run[0] = x
+        run[3] += 1
+        # Near a root the residual is about |f'| times the step, so a
+        # residual below rounding level with the step still as long as
+        # at the start needs a root whose slope is rounding level too
+        return run[3] >= self.patience and residual < sys.float_info.epsilon * run[2] \
+            and 0.5 * run[1] < step < 2 * run[1]
+
+    def _cycling(self, x, step):
+        history = self._history
+        history.append((x, step))
+        # history[-2] is the previous iterate: closeness to it is the
+        # convergence test, so periods start at 2
+        for past_x, past_step in list(history)[-3::-1]:
+            if abs(x - past_x) < self.tol and step >= 0.999 * past_step:
+                return True
+        return False
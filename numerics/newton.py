@@ -0,0 +1,387 @@
+# newton.py
+# Newton–Raphson method for f(x) = 0
+
+import atexit
+import importlib
+import inspect
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .monitor import BREAKDOWN, ConvergenceMonitor
+from .trace import make_trace
+
+# Lane status codes for newton_method_batch
+CONVERGED = 0
+ZERO_DERIVATIVE = 1
+NOT_CONVERGED = 2
+NOT_FINITE = 3
+
+# Columns of the newton_method iterations trace
+ITERATION_COLUMNS = ("iteration", "x", "fx", "error")
+
+# Where f'(x) comes from: SymPy's symbolic derivative, or dual numbers
+# (numerics.autodiff) for callables and for text SymPy should not touch
+DERIVATIVE_SOURCES = ("sympy", "autodiff")
+AUTODIFF = "automatic (dual numbers)"
+
+
+def compile_function(fx, dfx, x, params=(), modules="math"):
+    """
+    Compile f(x) and f'(x) into one native callable.
+
+    Common subexpressions between f and f' are evaluated once, so the
+    returned function gives (f(x), f'(x)) without going through SymPy.
+    Extra symbols must be listed in params and become extra arguments.
+    """
+    extra = (fx.free_symbols | dfx.free_symbols) - {x} - set(params)
+    if extra:
+        names = ", ".join(sorted(str(s) for s in extra))
+        raise ValueError(f"unknown symbol(s): {names}")
+    import sympy as sp
+    return sp.lambdify((x, *params), (fx, dfx), modules=modules, cse=True)
+
+
+# ==================================================
+# Program Cache
+# ==================================================
+
+def normalize_expression(func_str):
+    return "".join(str(func_str).split())
+
+
+def _build_program(func_str, params, modules):
+    import sympy as sp
+
+    x = sp.symbols('x')
+    param_syms = sp.symbols(list(params)) if params else ()
+    fx = sp.sympify(func_str, locals=dict(zip(params, param_syms)))
+    dfx = sp.diff(fx, x)
+    program = {
+        "expression": fx,
+        "derivative": dfx,
+        "f_df": compile_function(fx, dfx, x, param_syms, modules)
+    }
+    # Taken now: SymPy drops the generated source from linecache when the
+    # function is collected, which includes interpreter exit
+    program["record"] = _export_program(program)
+    return program
+
+
+def _export_program(program):
+    """
+    Source and globals of a compiled program as JSON-friendly data, or
+    None if some global cannot be looked up again by module and name.
+    """
+    f_df = program["f_df"]
+    try:
+        source = inspect.getsource(f_df)
+    except (OSError, TypeError):
+        return None
+
+    names = {}
+    for name in f_df.__code__.co_names:
+        value = f_df.__globals__.get(name)
+        if isinstance(value, (int, float)):
+            names[name] = value
+            continue
+        module = getattr(value, "__module__", None)
+        attr = getattr(value, "__name__", None)
+        try:
+            if module is None or getattr(importlib.import_module(module), attr) is not value:
+                return None
+        except (ImportError, AttributeError, TypeError):
+            return None
+        names[name] = [module, attr]
+
+    return {"derivative": str(program["derivative"]), "source": source, "globals": names}
+
+
+def _restore_program(record):
+    namespace = {}
+    for name, value in record["globals"].items():
+        if isinstance(value, list):
+            value = getattr(importlib.import_module(value[0]), value[1])
+        namespace[name] = value
+    exec(record["source"], namespace)
+    f_df = next(v for k, v in namespace.items() if k not in record["globals"] and callable(v))
+    return {"expression": None, "derivative": record["derivative"], "f_df": f_df, "record": record}
+
+
+class ProgramCache:
+    """
+    Bounded, thread-safe LRU cache of Newton programs: the parsed f, its
+    derivative and their compiled (f, f') callable, keyed by the
+    normalized expression text, parameter names and backend.
+
+    With a path, programs saved there by save() are rebuilt from their
+    generated source without importing SymPy. The file is executed as
+    Python code, so only point it at files you wrote.
+    """
+
+    def __init__(self, maxsize=128, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self._entries = OrderedDict()
+        self._stored = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_loads = 0
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def get(self, func_str, params=(), modules="math"):
+        key = f"{modules}|{','.join(params)}|{normalize_expression(func_str)}"
+        with self._lock:
+            program = self._entries.get(key)
+            if program is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return program
+            self.misses += 1
+            record = self._stored.get(key)
+
+        program = None
+        if record is not None:
+            try:
+                program = _restore_program(record)
+                with self._lock:
+                    self.disk_loads += 1
+            except Exception:
+                program = None
+        if program is None:
+            program = _build_program(func_str, tuple(params), modules)
+
+        with self._lock:
+            self._entries[key] = program
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return program
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_loads": self.disk_loads
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.disk_loads = 0
+
+    def load(self, path=None):
+        with open(path or self.path) as f:
+            stored = json.load(f)
+        with self._lock:
+            self._stored.update(stored)
+
+    def save(self, path=None):
+        with self._lock:
+            items = list(self._entries.items())
+            stored = dict(self._stored)
+        for key, program in items:
+            if program["record"] is not None:
+                stored[key] = program["record"]
+        path = path or self.path
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(stored, f)
+        os.replace(tmp, path)
+
+
+# Shared by newton_method and newton_method_batch. Setting
+# NUMERICS_NEWTON_CACHE to a file path persists it across runs.
+program_cache = ProgramCache(path=os.environ.get("NUMERICS_NEWTON_CACHE"))
+if program_cache.path is not None:
+    atexit.register(program_cache.save)
+
+
+def _autodiff_program(func, derivative):
+    """
+    (f_df, derivative description) for a Python callable, or for text when
+    derivative is "autodiff"; None means the SymPy program cache is used.
+    """
+    if derivative not in DERIVATIVE_SOURCES:
+        raise ValueError(f"Unknown derivative source {derivative!r}, expected one of {DERIVATIVE_SOURCES}")
+    if callable(func):
+        from .autodiff import value_and_derivative
+        return value_and_derivative(func), AUTODIFF
+    if derivative == "autodiff":
+        from .autodiff import compile_dual
+        return compile_dual(str(func)), AUTODIFF
+    return None
+
+
+def newton_method(func_str, x0, tol=1e-6, max_iter=100, trace="full", derivative="sympy"):
+    """
+    Newton Method لحساب جذر الدالة
+
+    Parameters:
+        func_str (str or callable): الدالة كنص (Python/SymPy format)
+            أو Python function f(x) تشتق بالـ dual numbers
+        x0 (float): التخمين الابتدائي
+        tol (float): التوليرانس
+        max_iter (int): أقصى عدد Iterations
+        trace (str): "full" / "compact" / "none" (see numerics.trace)
+        derivative (str): "sympy" أو "autodiff" (نص بصيغة Python بدون SymPy)
+
+    Returns:
+        result (dict): يحتوي على:
+            'iterations': tuples (i, x, f(x), error) حسب trace
+            'root': الجذر لو وجد أو None
+            'converged': True/False
+            'derivative': f'(x) أو AUTODIFF
+            'error_msg': رسالة خطأ لو فشلت
+            'reason': سبب التوقف (numerics.monitor reason code)
+    """
+    result = {
+        "iterations": make_trace(trace, ITERATION_COLUMNS, "qddd"),
+        "root": None,
+        "converged": False,
+        "derivative": None,
+        "error_msg": None,
+        "reason": None
+    }
+
+    try:
+        program = _autodiff_program(func_str, derivative)
+        if program is None:
+            program = program_cache.get(func_str)
+            program = program["f_df"], program["derivative"]
+        f_df, result["derivative"] = program
+        x_val = float(x0)
+    except Exception as e:
+        result["error_msg"] = f"Invalid input: {e}"
+        return result
+
+    record = result["iterations"].record
+    monitor = ConvergenceMonitor(tol, max_iter)
+    for i in range(1, max_iter + 1):
+        try:
+            fx_val, dfx_val = f_df(x_val)
+            fx_val, dfx_val = float(fx_val), float(dfx_val)
+        except (ArithmeticError, ValueError, TypeError) as e:
+            result["error_msg"] = f"Cannot evaluate f at x = {x_val}: {e}"
+            result["reason"] = BREAKDOWN
+            return result
+
+        if dfx_val == 0:
+            result["error_msg"] = "Derivative is zero – method failed"
+            result["reason"] = BREAKDOWN
+            return result
+
+        x_new = x_val - fx_val / dfx_val #newten formula
+        error = abs(x_new - x_val)
+
+        record((i, x_val, fx_val, error))
+
+        if monitor.update(error, abs(fx_val), x_new):
+            break
+
+        x_val = x_new
+
+    result["reason"] = monitor.reason
+    if monitor.converged:
+        result["root"] = x_new
+        result["converged"] = True
+    else:
+        result["error_msg"] = monitor.message
+    return result
+
+
+def newton_method_batch(func_str, x0, tol=1e-6, max_iter=100, params=None, derivative="sympy"):
+    """
+    Newton Method over an array of initial guesses, one root per lane.
+
+    Parameters:
+        func_str (str or callable): f(x), may contain extra symbols
+            (e.g. "x**2 - c"); a callable f(x, **params) is differentiated
+            with dual numbers over whole arrays
+        x0 (array): initial guesses
+        params (dict): array of values for each extra symbol, broadcast
+            together with x0, e.g. {"c": np.linspace(1, 2, 1000)}
+        derivative (str): "sympy" or "autodiff" (text without extra symbols)
+
+    Returns:
+        result (dict): 'root' (NaN where a lane failed), 'iterations',
+        'status' (CONVERGED, ZERO_DERIVATIVE, NOT_CONVERGED, NOT_FINITE),
+        'derivative' and 'error_msg' for invalid input or when f cannot
+        be evaluated (the lanes still running are left NOT_CONVERGED)
+    """
+    params = params or {}
+    result = {
+        "root": None,
+        "iterations": None,
+        "status": None,
+        "derivative": None,
+        "error_msg": None
+    }
+
+    try:
+        names = sorted(params)
+        program = _autodiff_program(func_str, derivative)
+        if program is None:
+            program = program_cache.get(func_str, names, modules="numpy")
+            f_df, result["derivative"] = program["f_df"], program["derivative"]
+        else:
+            # Parameters go in by name, in the same sorted order as args
+            f_dual, result["derivative"] = program
+            f_df = lambda x, *args: f_dual(x, **dict(zip(names, args)))
+        x_val, *args = np.broadcast_arrays(*(np.asarray(a, dtype=float)
+                                             for a in (x0, *(params[n] for n in names))))
+        shape = x_val.shape
+        x_val, *args = (a.ravel().copy() for a in (x_val, *args))
+    except Exception as e:
+        result["error_msg"] = f"Invalid input: {e}"
+        return result
+
+    root = np.full(x_val.size, np.nan)
+    iterations = np.zeros(x_val.size, dtype=int)
+    status = np.full(x_val.size, NOT_CONVERGED)
+    active = np.arange(x_val.size)
+
+    with np.errstate(all="ignore"):
+        for _ in range(max_iter):
+            if active.size == 0:
+                break
+
+            try:
+                fx_val, dfx_val = (np.broadcast_to(np.asarray(v, dtype=float), x_val.shape)
+                                   for v in f_df(x_val, *args))
+            except (ArithmeticError, ValueError, TypeError) as e:
+                result["error_msg"] = f"Cannot evaluate f: {e}"
+                break
+            zero = dfx_val == 0
+            x_new = x_val - fx_val / np.where(zero, 1.0, dfx_val)
+            iterations[active] += ~zero
+
+            finite = np.isfinite(x_new) & ~zero
+            converged = finite & (np.abs(x_new - x_val) < tol)
+            status[active[zero]] = ZERO_DERIVATIVE
+            status[active[~zero & ~np.isfinite(x_new)]] = NOT_FINITE
+            status[active[converged]] = CONVERGED
+            root[active[converged]] = x_new[converged]
+
+            keep = finite & ~converged
+            if not keep.all():
+                active = active[keep]
+                args = [a[keep] for a in args]
+                x_new = x_new[keep]
+            x_val = x_new
+
+    result["root"] = root.reshape(shape)
+    result["iterations"] = iterations.reshape(shape)
+    result["status"] = status.reshape(shape)
+    return result
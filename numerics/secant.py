@@ -0,0 +1,119 @@
+# secant.py
+# Secant method for f(x) = 0
+
+import numpy as np
+
+from .expressions import compile_expression
+from .monitor import MAX_ITER, ConvergenceMonitor
+from .trace import make_trace
+
+# Lane status codes for secant_method_batch
+CONVERGED = 0
+ZERO_DIVISION = 1
+NOT_CONVERGED = 2
+NOT_FINITE = 3
+
+# Columns of the secant_method steps trace
+STEP_COLUMNS = ("iteration", "x0", "x1", "x2", "f0", "f1")
+
+def parse_function(func_text):
+    """
+    Turns f(x) text such as "x**2*math.exp(x)-1" into a callable.
+    The text is parsed once and cached, see compile_expression.
+    """
+    return compile_expression(func_text)
+
+def secant_method(f, x0, x1, tol=1e-4, max_iter=100, monitor=None, trace="full"):
+    """
+    Returns (x2, steps). The run also stops early when it diverges,
+    cycles, stagnates or hits NaN/inf; pass a ConvergenceMonitor as
+    monitor to read the reason afterwards. It must be built with the
+    same tol and max_iter, which stay the ones the run uses.
+
+    steps holds one STEP_COLUMNS row per iteration. trace picks how:
+    "full" (a list of tuples), "compact" (rows packed into a bytearray)
+    or "none".
+    """
+    if monitor is None:
+        monitor = ConvergenceMonitor(tol, max_iter)
+    elif (monitor.tol, monitor.max_iter) != (tol, max_iter):
+        raise ValueError(f"monitor has tol={monitor.tol}, max_iter={monitor.max_iter}; "
+                         f"secant_method was given tol={tol}, max_iter={max_iter}")
+    steps = make_trace(trace, STEP_COLUMNS, "qddddd")
+    record = steps.record
+    f0 = f(x0)
+    f1 = f(x1)
+    x2 = x1
+    for i in range(max_iter):
+        if f1 - f0 == 0:
+            raise ValueError("Division by zero")
+        x2 = x1 - f1*(x1 - x0)/(f1 - f0)
+        record((i+1, x0, x1, x2, f0, f1))
+        if monitor.update(abs(x2 - x1), abs(f1), x2):
+            return x2, steps
+        # f(x1) is carried forward: one new evaluation per iteration
+        x0, x1 = x1, x2
+        f0, f1 = f1, f(x2)
+    if monitor.reason is None:
+        monitor.stop(MAX_ITER)
+    return x2, steps
+
+def secant_method_batch(f, x0, x1, tol=1e-4, max_iter=100, args=()):
+    """
+    Secant method over arrays of starting points, one root per lane.
+
+    f must work on NumPy arrays and is called as f(x, *args), where args
+    are per-lane parameter arrays broadcast together with x0 and x1. Each lane
+    stops on its own and f is evaluated once per iteration on the lanes
+    that are still running.
+
+    Returns a dict with arrays 'root' (NaN where a lane failed, as in
+    newton_method_batch), 'iterations' and 'status' (one of CONVERGED,
+    ZERO_DIVISION, NOT_CONVERGED, NOT_FINITE).
+    """
+    x0, x1, *args = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (x0, x1, *args)))
+    shape = x0.shape
+    x0, x1, *args = (a.ravel().copy() for a in (x0, x1, *args))
+
+    def evaluate(x, lane_args):
+        return np.broadcast_to(np.asarray(f(x, *lane_args), dtype=float), x.shape)
+
+    root = x1.copy()
+    iterations = np.zeros(x1.size, dtype=int)
+    status = np.full(x1.size, NOT_CONVERGED)
+    active = np.arange(x1.size)
+
+    with np.errstate(all="ignore"):
+        f0 = evaluate(x0, args)
+        f1 = evaluate(x1, args)
+
+        for _ in range(max_iter):
+            if active.size == 0:
+                break
+
+            df = f1 - f0
+            zero = df == 0
+            x2 = np.where(zero, x1, x1 - f1 * (x1 - x0) / np.where(zero, 1.0, df))
+            root[active] = x2
+            iterations[active] += ~zero
+
+            finite = np.isfinite(x2)
+            done = zero | ~finite | (np.abs(x2 - x1) < tol)
+            status[active[zero]] = ZERO_DIVISION
+            status[active[~zero & ~finite]] = NOT_FINITE
+            status[active[done & ~zero & finite]] = CONVERGED
+
+            if done.any():
+                keep = ~done
+                active = active[keep]
+                args = [a[keep] for a in args]
+                x1, x2, f1 = x1[keep], x2[keep], f1[keep]
+            x0, x1, f0 = x1, x2, f1
+            f1 = evaluate(x1, args)
+
+    root[status != CONVERGED] = np.nan
+    return {
+        "root": root.reshape(shape),
+        "iterations": iterations.reshape(shape),
+        "status": status.reshape(shape)
+    }
@@ -0,0 +1,143 @@
+# trace.py
+# Iteration traces: what an iterative method remembers about each step
+#
+#   "none"     records nothing (batch runs that only want the root)
+#   "compact"  rows packed into one bytearray, read as a structured array
+#   "full"     a list of tuples, the historical format
+#
+# Methods call trace.record(row) with one tuple per iteration; for the
+# stored modes record is one list append or one struct pack. All three
+# pickle, iterate as tuples and export with to_numpy() and save().
+
+import struct
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+TRACE_MODES = ("none", "compact", "full")
+
+_DTYPES = {"d": "<f8", "q": "<i8"}
+_FORMATS = {"d": "%.17g", "q": "%d"}
+
+
+class Trace(ABC):
+    """Common export code; subclasses store the rows."""
+
+    def __init__(self, columns, typecodes=None):
+        self.columns = tuple(columns)
+        self.typecodes = typecodes or "d" * len(self.columns)
+
+    def _empty(self, n):
+        return np.empty(n, dtype=[(name, _DTYPES[code]) for name, code in zip(self.columns, self.typecodes)])
+
+    @abstractmethod
+    def to_numpy(self):
+        """The trace as a structured array with one field per column."""
+
+    def save(self, path):
+        """Writes the trace to a .npy file, or CSV with a header for any other path."""
+        data = self.to_numpy()
+        if str(path).endswith(".npy"):
+            np.save(path, data)
+            return
+        # savetxt wants a 2-D array: go through float64, which holds
+        # every int64 iteration count a run can reach exactly
+        table = np.column_stack([data[name].astype(float) for name in self.columns]) \
+            if len(data) else np.empty((0, len(self.columns)))
+        np.savetxt(path, table, delimiter=",", header=",".join(self.columns), comments="",
+                   fmt=[_FORMATS[code] for code in self.typecodes])
+
+    def tolist(self):
+        return [list(row) for row in self]
+
+
+class NullTrace(Trace):
+    def record(self, row):
+        pass
+
+    def __len__(self):
+        return 0
+
+    def __iter__(self):
+        return iter(())
+
+    def __getitem__(self, index):
+        return ()[index]
+
+    def to_numpy(self):
+        return self._empty(0)
+
+
+class CompactTrace(Trace):
+    """
+    Rows are packed with struct into one growing bytearray laid out like
+    the structured array to_numpy() returns: 8 bytes per column instead
+    of a tuple of Python numbers, and export is a single copy.
+    """
+
+    def __init__(self, columns, typecodes=None):
+        super().__init__(columns, typecodes)
+        self._buffer = bytearray()
+        self._row = struct.Struct("<" + self.typecodes)
+
+    def record(self, row):
+        self._buffer.extend(self._row.pack(*row))
+
+    def __getstate__(self):
+        # struct.Struct does not pickle; it follows from typecodes
+        state = self.__dict__.copy()
+        del state["_row"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._row = struct.Struct("<" + self.typecodes)
+
+    def __len__(self):
+        return len(self._buffer) // self._row.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("trace index out of range")
+        return self._row.unpack_from(self._buffer, index * self._row.size)
+
+    def __iter__(self):
+        return self._row.iter_unpack(bytes(self._buffer))
+
+    def to_numpy(self):
+        return np.frombuffer(self._buffer, dtype=self._empty(0).dtype).copy()
+
+
+class FullTrace(list, Trace):
+    """A plain list of row tuples, as the methods always returned."""
+
+    def __init__(self, columns, typecodes=None):
+        list.__init__(self)
+        Trace.__init__(self, columns, typecodes)
+        self.record = self.append
+
+    def to_numpy(self):
+        data = self._empty(len(self))
+        for i, name in enumerate(self.columns):
+            data[name] = [row[i] for row in self]
+        return data
+
+
+def make_trace(mode, columns, typecodes=None):
+    """
+    A trace for mode ("none", "compact" or "full"); a Trace instance is
+    returned as is, so callers can pass their own.
+    """
+    if isinstance(mode, Trace):
+        return mode
+    if mode == "none" or mode is None:
+        return NullTrace(columns, typecodes)
+    if mode == "compact":
+        return CompactTrace(columns, typecodes)
+    if mode == "full":
+        return FullTrace(columns, typecodes)
+    raise ValueError(f"Unknown trace mode {mode!r}, expected one of {TRACE_MODES}")
@@ -0,0 +1,7 @@
+# conftest.py
+# Lets the tests import numerics and the Logic modules from the repository root
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
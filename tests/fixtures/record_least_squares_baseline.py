@@ -0,0 +1,77 @@
+# record_least_squares_baseline.py
+# Writes least_squares_baseline.json: the 34 pinned data sets and what
+# auto_fit_best_model returns for them through both Logic modules of a
+# source tree. The committed file was recorded on the tree before the
+# two Logic modules were merged (commit d34fa10):
+#
+#   git worktree add /tmp/baseline d34fa10
+#   python tests/fixtures/record_least_squares_baseline.py /tmp/baseline
+
+import importlib.util
+import json
+import os
+import sys
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MODULES = {
+    "Linearization": os.path.join("Linearization", "Logic.py"),
+    "Newten": os.path.join("Newten", "Project_Linearization", "Logic.py"),
+}
+
+
+def datasets():
+    """Four hand-made sets (one per model family, one with x and y <= 0) and 30 random power laws."""
+    cases = [
+        ([1, 2, 3, 4, 5], [2.2, 4.1, 6.3, 7.9, 10.2]),
+        ([1, 2, 3, 4], [2.7, 7.4, 20.1, 54.6]),
+        ([-2, -1, 1, 2], [3, 1, 1, 3]),
+        ([0, 1, 2, 3], [1, 2, -1, 5]),
+    ]
+    rng = np.random.default_rng(1)
+    for _ in range(30):
+        n = int(rng.integers(3, 300))
+        x = rng.uniform(0.1, 10, n)
+        y = rng.uniform(0.5, 3) * x ** rng.uniform(0.3, 2) * rng.uniform(0.9, 1.1, n)
+        if rng.random() < 0.3:
+            y -= 2
+        cases.append((x.tolist(), y.tolist()))
+    return cases
+
+
+def load_logic(root, name):
+    spec = importlib.util.spec_from_file_location(f"logic_{name}", os.path.join(root, MODULES[name]))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def record(module, cases):
+    results = []
+    for x, y in cases:
+        result = module.auto_fit_best_model(x, y)
+        results.append({
+            "best": result["best_model"]["model"],
+            "models": [{"model": m["model"], "a": float(m["a"]), "b": float(m["b"]), "error": float(m["error"]),
+                        "sums": {key: float(value) for key, value in m["sums"].items()}}
+                       for m in result["all_models"]],
+        })
+    return results
+
+
+def main():
+    root = os.path.abspath(sys.argv[1])
+    output = sys.argv[2] if len(sys.argv) > 2 else os.path.join(HERE, "least_squares_baseline.json")
+    sys.path.insert(0, root)
+    cases = datasets()
+    baseline = {
+        "datasets": [{"x": x, "y": y} for x, y in cases],
+        "results": {name: record(load_logic(root, name), cases) for name in MODULES},
+    }
+    with open(output, "w") as f:
+        json.dump(baseline, f)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# test_autodiff.py
+# Newton on plain Python callables, differentiated with dual numbers
+
+import math
+
+import numpy as np
+import pytest
+
+from numerics.autodiff import Dual, compile_dual, value_and_derivative
+from numerics.newton import CONVERGED, newton_method, newton_method_batch
+from numerics.secant import parse_function
+
+ROOT = 0.7034674224983917  # x**2 e^x = 1
+
+
+@pytest.mark.parametrize("f", [
+    lambda x: x**2 * math.exp(x) - 1,
+    parse_function("x**2*math.exp(x)-1"),
+    parse_function("x**2*exp(x)-1"),
+    lambda x: x**2 * np.exp(x) - 1,
+])
+def test_newton_on_callables(f):
+    result = newton_method(f, 1.0, 1e-12)
+    assert result["converged"], result["error_msg"]
+    assert result["root"] == pytest.approx(ROOT, abs=1e-12)
+
+
+def test_numpy_batch():
+    c = np.array([0.1, 0.5, 0.9])
+    result = newton_method_batch(lambda x, c: np.sin(x) - c, np.full(3, 0.5), 1e-12, params={"c": c})
+    assert result["error_msg"] is None
+    assert np.all(result["status"] == CONVERGED)
+    np.testing.assert_allclose(result["root"], np.arcsin(c), rtol=1e-12)
+
+
+def test_batch_reports_evaluation_errors():
+    result = newton_method_batch(lambda x: np.hypot(x, 1.0) - 2, np.ones(3))
+    assert "no automatic derivative" in result["error_msg"]
+    assert np.all(np.isnan(result["root"]))
+
+
+@pytest.mark.parametrize("f, df", [
+    (lambda x: np.arctan(x) * np.log1p(x), lambda x: np.log1p(x) / (1 + x * x) + np.arctan(x) / (1 + x)),
+    (lambda x: np.power(x, x), lambda x: x**x * (np.log(x) + 1)),
+    (lambda x: 2.0 ** np.sqrt(x), lambda x: 2.0 ** np.sqrt(x) * np.log(2) / (2 * np.sqrt(x))),
+    (lambda x: np.arange(3.0) / x, lambda x: -np.arange(3.0) / (x * x)),
+])
+def test_ufunc_derivatives(f, df):
+    x = np.array([0.3, 0.7, 1.9])
+    value, derivative = value_and_derivative(f)(x)
+    np.testing.assert_allclose(value, f(x), rtol=1e-14)
+    np.testing.assert_allclose(derivative, df(x), rtol=1e-13)
+
+
+def test_builtins_in_text():
+    assert compile_dual("abs(x) - 2")(-3.0) == (1.0, -1.0)
+    assert compile_dual("max(x, 0) - 1")(3.0) == (2.0, 1.0)
+    with pytest.raises(TypeError):
+        compile_dual("round(x)")(2.0)
+
+
+def test_float_conversion_is_refused():
+    # Anything that still calls float() would drop the derivative
+    with pytest.raises(TypeError):
+        float(Dual(1.0, 1.0))
@@ -0,0 +1,31 @@
+# test_incremental_fitter.py
+# IncrementalFitter refreshes on a schedule that keeps updates O(1) amortized
+
+from numerics.least_squares import IncrementalFitter
+
+
+def refresh_points(fitter, n):
+    """Sizes at which auto_fit() refreshed over n added points."""
+    sizes = []
+    refresh = fitter.refresh
+    fitter.refresh = lambda: sizes.append(len(fitter)) or refresh()
+    for i in range(n):
+        fitter.add(i + 1.0, 2.0 * i + 1 + i % 7).auto_fit()
+    return sizes
+
+
+def test_windowed_refreshes_every_window():
+    assert refresh_points(IncrementalFitter(window=100), 500) == [1, 100, 100, 100, 100]
+
+
+def test_unwindowed_gap_grows_with_history():
+    sizes = refresh_points(IncrementalFitter(), 20000)
+    assert sizes == [1, 1001, 2002, 4004, 8008, 16016]
+
+
+def test_explicit_refresh_is_honoured():
+    assert refresh_points(IncrementalFitter(refresh=100), 500) == [1, 101, 201, 301, 401]
+    fitter = IncrementalFitter(refresh=1)
+    for i in range(50):
+        models = fitter.add(i + 1.0, 2.0 * i + 1 + i % 7).auto_fit()["all_models"]
+        assert all(m["error_age"] == 0 for m in models)
@@ -0,0 +1,56 @@
+# test_least_squares_regression.py
+# auto_fit_best_model through both Logic modules against the outputs the
+# original lecture code gave on 34 data sets (fixtures/least_squares_baseline.json,
+# see record_least_squares_baseline.py)
+#
+# Model choice and order must not change. The QR solve changed the last
+# digits of a and b, so values are compared to 1e-10; the summations are
+# plain sums of the data and must match to rounding.
+
+import json
+import os
+
+import pytest
+
+from fixtures.record_least_squares_baseline import MODULES, datasets, load_logic, record
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures",
+                       "least_squares_baseline.json")) as f:
+    BASELINE = json.load(f)
+
+CASES = [(d["x"], d["y"]) for d in BASELINE["datasets"]]
+
+
+def test_datasets_are_reproducible():
+    assert [list(map(float, x)) for x, _ in datasets()] == [list(map(float, x)) for x, _ in CASES]
+    assert [list(map(float, y)) for _, y in datasets()] == [list(map(float, y)) for _, y in CASES]
+
+
+@pytest.fixture(scope="module", params=sorted(MODULES))
+def results(request):
+    return request.param, record(load_logic(ROOT, request.param), CASES)
+
+
+def test_same_models_and_choice(results):
+    name, current = results
+    for index, (got, expected) in enumerate(zip(current, BASELINE["results"][name])):
+        assert got["best"] == expected["best"], index
+        assert [m["model"] for m in got["models"]] == [m["model"] for m in expected["models"]], index
+
+
+def test_same_coefficients_and_errors(results):
+    name, current = results
+    for index, (got, expected) in enumerate(zip(current, BASELINE["results"][name])):
+        for model, pinned in zip(got["models"], expected["models"]):
+            context = (index, model["model"])
+            assert model["a"] == pytest.approx(pinned["a"], rel=1e-10, abs=1e-12), context
+            assert model["b"] == pytest.approx(pinned["b"], rel=1e-10, abs=1e-12), context
+            assert model["error"] == pytest.approx(pinned["error"], rel=1e-10, abs=1e-12), context
+            assert model["sums"] == pytest.approx(pinned["sums"], rel=1e-13), context
+
+
+def test_frontends_agree():
+    # Both GUIs load numerics.least_squares, so they now agree bit for bit
+    assert record(load_logic(ROOT, "Linearization"), CASES) == record(load_logic(ROOT, "Newten"), CASES)
@@ -0,0 +1,31 @@
+# test_loaders.py
+# fit_file reads every supported format with the same options
+
+import numpy as np
+import pytest
+
+from numerics.loaders import fit_file
+
+X = np.arange(1.0, 9.0)
+Y = 3 * X + 1
+
+
+def write(path, ext):
+    data = np.column_stack([X, Y])
+    if ext == ".csv":
+        np.savetxt(path, data, delimiter=",", header="x,y", comments="")
+    elif ext == ".npy":
+        np.save(path, data)
+    else:
+        data.astype("<f8").tofile(path)
+
+
+@pytest.mark.parametrize("ext", [".csv", ".npy", ".bin"])
+def test_skip_header_with_any_format(tmp_path, ext):
+    # The CLI passes --skip-header whatever the file type
+    path = tmp_path / ("data" + ext)
+    write(path, ext)
+    best = fit_file(str(path), skip_header=1)["best_model"]
+    assert best["model"] == "Linear: y = ax + b"
+    assert best["a"] == pytest.approx(3)
+    assert best["b"] == pytest.approx(1)
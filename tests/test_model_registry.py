@@ -0,0 +1,78 @@
+# test_model_registry.py
+# Every fitting entry point ranks the same candidates from MODELS
+
+import numpy as np
+import pytest
+
+from numerics.least_squares import (DEFAULT_MODELS, IncrementalFitter, LeastSquaresAccumulator,
+                                    auto_fit_best_model, auto_fit_stacked, line_models)
+from numerics.loaders import fit_file
+
+X = np.arange(1.0, 9.0)
+Y = 2 * np.log(X) + 1
+WITH_LOG = ["linear", "exponential", "power", "growth_rate", "logarithmic"]
+
+
+def best_models(tmp_path, models, x=X, y=Y):
+    path = tmp_path / "data.npy"
+    np.save(path, np.column_stack([x, y]))
+    stacked = auto_fit_stacked(x, y[None], models=models)
+    fitter = IncrementalFitter(models=models)
+    for point in zip(x, y):
+        fitter.add(*point)
+    return {
+        "auto_fit_best_model": auto_fit_best_model(x, y, models=models)["best_model"]["model"],
+        "fit_file": fit_file(str(path), models=models)["best_model"]["model"],
+        "auto_fit_stacked": stacked["kinds"][stacked["best"][0]],
+        "IncrementalFitter": fitter.auto_fit()["best_model"]["model"],
+    }
+
+
+def test_defaults_are_the_lecture_models():
+    assert DEFAULT_MODELS == ["linear", "exponential", "power", "growth_rate"]
+    assert line_models() == tuple(DEFAULT_MODELS)
+
+
+@pytest.mark.parametrize("models, name, kind", [
+    (None, "Power: y = b x^a", "power"),
+    (WITH_LOG, "Logarithmic: y = a ln(x) + b", "logarithmic"),
+])
+def test_entry_points_agree(tmp_path, models, name, kind):
+    best = best_models(tmp_path, models)
+    assert best.pop("auto_fit_stacked") == kind
+    assert set(best.values()) == {name}
+
+
+def test_same_coefficients(tmp_path):
+    reference = {m["model"]: m for m in auto_fit_best_model(X, Y, models=WITH_LOG)["all_models"]}
+    stacked = auto_fit_stacked(X, Y[None], models=WITH_LOG)
+    accumulated = LeastSquaresAccumulator(WITH_LOG).update(X, Y).fit_all()
+    assert [m["model"] for m in accumulated] == list(reference)
+    for i, model in enumerate(accumulated):
+        expected = reference[model["model"]]
+        assert model["a"] == pytest.approx(expected["a"], rel=1e-12)
+        assert model["b"] == pytest.approx(expected["b"], rel=1e-12)
+        assert stacked["a"][i, 0] == pytest.approx(expected["a"], rel=1e-12)
+        assert stacked["b"][i, 0] == pytest.approx(expected["b"], rel=1e-12)
+        assert stacked["error"][i, 0] == pytest.approx(expected["error"], rel=1e-9)
+
+
+
+@pytest.mark.parametrize("y, names", [
+    # Power with a = 1, b = 1 fits y = x exactly too; rounding decides the tie
+    ([1.0, 2.0, 3.0, 4.0], {"Linear: y = ax + b", "Power: y = b x^a"}),
+    ([2.0, 4.0, 6.0, 8.0], {"Linear: y = ax + b"}),
+])
+def test_proportional_data(tmp_path, y, names):
+    # 1/y = A/x + B with B = 0 puts a pole in growth rate's back-transform
+    x, y = np.array([1.0, 2.0, 3.0, 4.0]), np.array(y)
+    best = best_models(tmp_path, None, x, y)
+    assert best.pop("auto_fit_stacked") == "linear"
+    assert set(best.values()) <= names
+    growth = auto_fit_best_model(x, y)["all_models"][-1]
+    assert growth["model"] == "Growth Rate: y = ax / (b + x)"
+    assert growth["error"] == float("inf")
+
+def test_every_model_failing_raises():
+    with pytest.raises(ValueError, match="singular"):
+        auto_fit_best_model([2.0, 2.0, 2.0], [1.0, 2.0, 3.0])
@@ -0,0 +1,111 @@
+# test_monitor.py
+# Stopping decisions of ConvergenceMonitor on runs that must not be cut short
+
+import math
+
+import numpy as np
+import pytest
+
+from numerics.jacobi import jacobi_method, jacobi_method_batched, stationary_method
+from numerics.monitor import CONVERGED, DIVERGED, MAX_ITER, NON_FINITE, ConvergenceMonitor
+from numerics.newton import newton_method
+from numerics.secant import secant_method
+
+
+def test_newton_survives_one_overshoot():
+    # The first step from near f'(x) = 0 lands at 5e5 and |f| jumps from
+    # 2 to about 2.5e11 before the iteration settles
+    result = newton_method("x**2-2", 1e-6)
+    assert result["converged"]
+    assert result["reason"] == CONVERGED
+    assert abs(result["root"] - 2 ** 0.5) < 1e-12
+    assert len(result["iterations"]) == 25
+
+
+def test_jacobi_survives_transient_growth():
+    # Nilpotent iteration matrix: spectral radius 0, exact after 3 sweeps,
+    # but the iterates grow to 1e10 on the way
+    A = [[1, 1e5, 0], [0, 1, 1e5], [0, 0, 1]]
+    x = jacobi_method(A, np.ones(3), np.zeros(3), 1e-8, 50)
+    assert x is not None
+    np.testing.assert_allclose(np.dot(A, x), np.ones(3), rtol=1e-12)
+
+
+def test_batched_jacobi_stops_each_column_like_jacobi():
+    # Not diagonally dominant (spectral radius 2): only b = 0 converges
+    A = [[1.0, 2.0], [2.0, 1.0]]
+    B = np.array([[0.0, 1.0, np.nan], [0.0, -1.0, 1.0]])
+    result = jacobi_method_batched(A, B, np.zeros((2, 3)), 1e-8, 1000)
+    assert list(result["reason"]) == [CONVERGED, DIVERGED, NON_FINITE]
+    assert list(result["converged"]) == [True, False, False]
+    for j in range(3):
+        single = stationary_method(A, B[:, j], np.zeros(2), 1e-8, 1000, method="jacobi")
+        assert result["reason"][j] == single["reason"]
+        assert result["iterations"][j] == single["iterations"]
+
+
+def test_batched_jacobi_survives_transient_growth():
+    A = [[1, 1e5, 0], [0, 1, 1e5], [0, 0, 1]]
+    result = jacobi_method_batched(A, np.ones((3, 2)), np.zeros((3, 2)), 1e-8, 50)
+    assert result["converged"].all()
+    assert list(result["reason"]) == [CONVERGED, CONVERGED]
+
+
+def test_sustained_growth_diverges():
+    monitor = ConvergenceMonitor(1e-8, 1000, patience=5)
+    steps = [10.0 ** k for k in range(20)]
+    stopped = [monitor.update(step) for step in steps]
+    assert monitor.reason == DIVERGED
+    # No new minimum since the first step, so the first step past 1e8
+    # times the best (1e9) stops the run
+    assert stopped.index(True) == 9
+
+    # A jump after steady progress needs patience iterations of no progress
+    monitor = ConvergenceMonitor(1e-8, 1000, patience=5)
+    stopped = [monitor.update(step) for step in [1.0, 0.5, 1e9, 1e9, 1e9, 1e9, 1e9, 1e9]]
+    assert monitor.reason == DIVERGED
+    assert stopped.index(True) == 6
+
+
+def test_growth_at_the_end_of_the_budget_is_divergence():
+    monitor = ConvergenceMonitor(1e-8, 3)
+    for step in (1.0, 1e9, 1e10):
+        monitor.update(step)
+    assert monitor.reason == DIVERGED
+
+    monitor = ConvergenceMonitor(1e-8, 3)
+    for step in (1.0, 0.5, 0.25):
+        monitor.update(step)
+    assert monitor.reason == MAX_ITER
+
+
+def test_secant_monitor_matches_its_run():
+    monitor = ConvergenceMonitor(1e-12, 5)
+    secant_method(lambda x: x ** 3 - 2, 0.0, 1.0, 1e-12, 5, monitor=monitor)
+    assert monitor.reason == MAX_ITER
+    assert monitor.iterations == 5
+
+    for tol, max_iter in ((1e-4, 5), (1e-12, 100)):
+        with pytest.raises(ValueError, match="max_iter"):
+            secant_method(lambda x: x ** 3 - 2, 0.0, 1.0, tol, max_iter,
+                          monitor=ConvergenceMonitor(1e-12, 5))
+
+
+def test_runaway_towards_an_asymptote_diverges():
+    # x e^(-x) fades towards 0 as x grows: no root that way
+    monitor = ConvergenceMonitor(1e-6, 10_000)
+    secant_method(lambda x: x * math.exp(-x), 2.0, 3.0, 1e-6, 10_000, monitor=monitor, trace="none")
+    assert monitor.reason == DIVERGED
+    assert monitor.iterations < 100
+
+
+@pytest.mark.parametrize("f, x0, x1, root", [
+    # Outward runs that do end at a root: far away, or on the asymptote
+    (lambda x: math.log(x) - 50, 1.0, 2.0, math.exp(50)),
+    (lambda x: math.exp(-x) - math.exp(-30), 0.0, 1.0, 30.0),
+])
+def test_outward_runs_to_a_root_converge(f, x0, x1, root):
+    monitor = ConvergenceMonitor(1e-8, 10_000)
+    x, _ = secant_method(f, x0, x1, 1e-8, 10_000, monitor=monitor, trace="none")
+    assert monitor.reason == CONVERGED
+    assert x == pytest.approx(root, rel=1e-9)
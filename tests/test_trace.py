@@ -0,0 +1,31 @@
+# test_trace.py
+# Traces survive pickling, so results can cross process boundaries
+
+import pickle
+
+import numpy as np
+import pytest
+
+from numerics.secant import secant_method
+from numerics.trace import TRACE_MODES, make_trace
+
+
+@pytest.mark.parametrize("mode", TRACE_MODES)
+def test_trace_pickle_round_trip(mode):
+    trace = make_trace(mode, ("n", "x"), "qd")
+    trace.record((1, 0.5))
+    copy = pickle.loads(pickle.dumps(trace))
+    copy.record((2, 0.25))
+    expected = [] if mode == "none" else [(1, 0.5), (2, 0.25)]
+    assert list(copy) == expected
+    assert len(trace) == len(expected) // 2
+    np.testing.assert_array_equal(copy.to_numpy()["x"], [x for _, x in expected])
+
+
+@pytest.mark.parametrize("mode", ["compact", "full"])
+def test_secant_steps_pickle(mode):
+    root, steps = secant_method(lambda x: x ** 2 - 2, 1.0, 2.0, 1e-12, 50, trace=mode)
+    copy = pickle.loads(pickle.dumps((root, steps)))
+    assert copy[0] == root
+    assert list(copy[1]) == list(steps)
+    np.testing.assert_array_equal(copy[1].to_numpy(), steps.to_numpy())